@@ -8,13 +8,23 @@ from .lib_batches import (
     Batch,
     BatchCollection,
     BatchLists,
+    FrozenBatch,
+    FrozenBatchCollection,
+    FrozenBatchLists,
 )
 
+from .lib_matrix import BatchMatrix, SparseBatchMatrix
+
 from .lib_item_request import ItemListRequest, ItemRequest
 
 from .lib_optimization import (
     minBatchExpense,
     maxEarnings,
+    BatchProblem,
+    DualBatchProblem,
+    solve_many,
+    PriceSweep,
+    price_sweep,
 )
 
 from .lib_functions_streamlit import (
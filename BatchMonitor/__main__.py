@@ -230,7 +230,7 @@ def demo_batchCollection():
         "batch 3: 3; 4xapple, 3xbanana, 4xorange",
         seller="seller 1",
     )
-    bc.to_json("demo_batchcollection.json")
+    bc.to_json("demo_batchcollection.json", sparse=False, checksum=False)
 
 
 @app.command()
@@ -250,7 +250,7 @@ def demo_batchLists():
             "seller 3_batch 4: 3; 4xapple, 3xbanana, 4xorange",
         ]
     )
-    bl.to_json("demo_batchlists.json")
+    bl.to_json("demo_batchlists.json", sparse=False, checksum=False)
 
 
 @app.command()
@@ -270,7 +270,7 @@ def view_batches(path: str):
     """View the content of a BatchCollection or BatchLists object from a json file
 
     Args:
-    - path (str): path to the json file
+    - path (str): path to the json file, which can be compressed (.gz, .bz2, .xz or .lzma)
 
     Returns:
     - None
@@ -423,8 +423,8 @@ def solve(
     """Solve the optimization problem with the BatchCollection or BatchLists object and the ItemListRequest object from the json files.
 
     Args:
-    - batches_path (str): path to the json file containing the BatchCollection or BatchLists object\n
-    - itemlist_path (str): path to the json file containing the ItemListRequest object\n
+    - batches_path (str): path to the json file containing the BatchCollection or BatchLists object, which can be compressed (.gz, .bz2, .xz or .lzma)\n
+    - itemlist_path (str): path to the json file containing the ItemListRequest object, which can be compressed\n
     - category_of_variables (bool): if True, the user will be prompted to choose the category of the variables which represents the quantities of the batches and the prices of the items.\n
     - function_constraints (bool): if True, the user will be prompted to choose the constraints for the objective function of the minBatchExpense problem and the benefits of the maxEarnings problem.\n
     - rates (bool): if True, the user will be prompted to choose the rates he has for the batches.\n
@@ -3,7 +3,6 @@
 This module contains the different functions used for the CLI
 """
 
-import copy
 import os
 import sys
 import time
@@ -220,7 +219,8 @@ def _bc_creation():
         '\nYou can create a batch like this : "Batch name:price; quantity1xitem1, quantity2xitem2, ..."'
     )
     _styled_echo("Example : Batchname:10; 1xapple, 2xbanana")
-    bc = BatchCollection(seller=str_seller)
+    batches: list[Batch] = []
+    batch_names: set[str] = set()
     for numero in range(1, number_of_batches + 1):
         while True:
             try:
@@ -228,7 +228,13 @@ def _bc_creation():
                     f"\n[red]⠹ {round(100 * (numero) / number_of_batches, 2)}% : [/red]Enter the Batch n°{numero}"
                 )
                 console.print(str_batch)
-                bc.add_batch(Batch.from_str(str_batch))
+                batch = Batch.from_str(str_batch)
+                if batch.name in batch_names:
+                    raise ValueError(
+                        f"The name of the batch '{batch.name}' is not unique."
+                    )
+                batch_names.add(batch.name)
+                batches.append(batch)
                 break
             except ValueError:
                 _style_invalid_choice(
@@ -238,6 +244,7 @@ def _bc_creation():
                     'You can create a batch like this : "Batch name:price; quantity1xitem1, quantity2xitem2, ..."'
                 )
                 _styled_echo("Example : Batchname:10; 1xapple, 2xbanana")
+    bc = BatchCollection.from_batches(batches, seller=str_seller)
     _animate_progress_bar("Initialization of the problems", number_of_batches)
     return number_of_batches, bc
 
@@ -474,13 +481,12 @@ def _verify_rates(rates: np.ndarray, number_of_batches: int) -> bool:
 
 def _batch_transformation(batch_list: BatchCollection | BatchLists):
     """
-    Copy the batch list to avoid modifying the original one.
-    Furthermore, transform the copy of the BatchLists object into a BatchCollection object.
+    Transform the BatchLists object into a BatchCollection object.
+    The original batch list is not modified.
     """
 
     if isinstance(batch_list, BatchLists):
-        batch_list_copy = copy.deepcopy(batch_list)
-        batch_list_copy_transform = _transform_batch_list(batch_list_copy)
+        batch_list_copy_transform = _transform_batch_list(batch_list)
     else:
         batch_list_copy_transform = batch_list
     return batch_list_copy_transform
@@ -1,11 +1,13 @@
 """Description:
 
 Library containing the creation of dataclasses Item_in_batch, Batch, BatchCollection, BatchLists
+and of their immutable snapshots FrozenBatch, FrozenBatchCollection, FrozenBatchLists
 
 - Item_in_batch : class representing the different items and their respective quantity in the considered batch.
 - Batch : class representing the proposed batches of items.
 - BatchCollection : class representing the list of batches sold by one seller.
 - BatchLists : class representing the list of batches sold by each seller.
+- FrozenBatch, FrozenBatchCollection, FrozenBatchLists : immutable snapshots returned by the freeze() methods.
 
 - This library is useful to resolve the BatchMonitor problem.
 
@@ -17,14 +19,26 @@ Developed by :
     - [Gregory Jaillet](https://github.com/Greg-jllt)
 """
 
+import csv
+import hashlib
 import json
+import os
+import re
+import sys
 import warnings
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from itertools import count, islice
 from dataclasses import dataclass, field
 import numpy as np
-from beartype.typing import Iterator
+import pandas as pd
+from beartype.typing import Callable, Iterable, Iterator
 from prettytable import PrettyTable
 from serde import serde
 
+from .lib_io import compression, open_file
+
 
 class Incompatible_negative_value(ValueError):
     """Error returned if the price of a batch or a quantity is negative."""
@@ -32,8 +46,236 @@ class Incompatible_negative_value(ValueError):
     pass
 
 
+class Invalid_batch_line(ValueError):
+    """Error returned if a line of the 'seller_batch:price; quantityxitem, ...' grammar cannot be parsed.
+    The number of the line is kept in the line_number attribute."""
+
+    def __init__(self, line_number: int, message: str):
+        super().__init__(f"Line {line_number} : {message}")
+        self.line_number = line_number
+        self.message = message
+
+    def __reduce__(self):
+        """Allows the error to be sent back by the processes parsing the lines."""
+
+        return type(self), (self.line_number, self.message)
+
+
+_versions = count()
+
+
+class _TrackedList(list):
+    """List which draws a new version from a global counter at each modification.
+    The indexes built on the list keep its version, so they know in O(1) if it has been modified
+    without the methods of its owner. Two lists never share a version."""
+
+    __slots__ = ("version",)
+
+    def __init__(self, iterable: Iterable = ()):
+        super().__init__(iterable)
+        self.version = next(_versions)
+
+
+def _tracked(method):
+    """Returns the method of list drawing a new version before modifying the list."""
+
+    def modify(self, *args, **kwargs):
+        self.version = next(_versions)
+        return method(self, *args, **kwargs)
+
+    modify.__name__ = method.__name__
+    return modify
+
+
+for _name in (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+):
+    setattr(_TrackedList, _name, _tracked(getattr(list, _name)))
+
+
+def _fingerprint(*parts: object) -> str:
+    """Returns a stable SHA-256 fingerprint of the given parts.
+    Unlike hash(), it does not depend on the process, so it can be stored or shared."""
+
+    return hashlib.sha256(
+        json.dumps(parts, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenBatch:
+    """Immutable snapshot of a Batch, returned by Batch.freeze().
+
+    The hash and the fingerprint are computed once at creation,
+    the snapshot can be used as a dictionary key and shared between threads.
+
+    Args :
+    - name : str : name of the batch
+    - price : float : price of the batch
+    - items : tuple[tuple[str, float], ...] : names and quantities of the items in the batch
+
+    Example :
+
+    >>> frozen_batch = Batch.from_str("batch 1:1; 2xapple, 3xorange").freeze()
+    >>> frozen_batch
+    FrozenBatch(name='batch 1', price=1.0, items=(('apple', 2.0), ('orange', 3.0)))
+    >>> len(frozen_batch.fingerprint)
+    64
+    """
+
+    name: str
+    price: float
+    items: tuple[tuple[str, float], ...]
+    _hash: int = field(init=False, repr=False, compare=False)
+    fingerprint: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Computes the hash and the fingerprint of the snapshot."""
+
+        object.__setattr__(self, "_hash", hash((self.name, self.price, self.items)))
+        object.__setattr__(
+            self,
+            "fingerprint",
+            _fingerprint(self.name, self.price, self.items),
+        )
+
+    def __hash__(self) -> int:
+        """Returns the cached hash of the snapshot."""
+
+        return self._hash
+
+    def __len__(self) -> int:
+        """Returns the number of items in the batch."""
+
+        return len(self.items)
+
+    def thaw(self) -> "Batch":
+        """Returns a mutable Batch with the content of the snapshot."""
+
+        return Batch(
+            self.name,
+            self.price,
+            [Item_in_batch(name, quantity) for name, quantity in self.items],
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenBatchCollection:
+    """Immutable snapshot of a BatchCollection, returned by BatchCollection.freeze().
+
+    Args :
+    - batch_list : tuple[FrozenBatch, ...] : snapshots of the batches sold by the seller
+    - seller : str : name of the seller
+
+    Example :
+
+    >>> BatchCollection.from_str("batch 1:1; 2xapple", seller="seller1").freeze()
+    FrozenBatchCollection(batch_list=(FrozenBatch(name='batch 1', price=1.0, items=(('apple', 2.0),)),), seller='seller1')
+    """
+
+    batch_list: tuple[FrozenBatch, ...]
+    seller: str = "Default seller"
+    _hash: int = field(init=False, repr=False, compare=False)
+    fingerprint: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Computes the hash and the fingerprint of the snapshot from the ones of its batches."""
+
+        object.__setattr__(self, "_hash", hash((self.seller, self.batch_list)))
+        object.__setattr__(
+            self,
+            "fingerprint",
+            _fingerprint(self.seller, [batch.fingerprint for batch in self.batch_list]),
+        )
+
+    def __hash__(self) -> int:
+        """Returns the cached hash of the snapshot."""
+
+        return self._hash
+
+    def __len__(self) -> int:
+        """Returns the number of batches in the collection."""
+
+        return len(self.batch_list)
+
+    def __iter__(self) -> Iterator[FrozenBatch]:
+        """Returns an iterator over the snapshots of the batches."""
+
+        return iter(self.batch_list)
+
+    def thaw(self) -> "BatchCollection":
+        """Returns a mutable BatchCollection with the content of the snapshot."""
+
+        return BatchCollection.from_batches(
+            (batch.thaw() for batch in self.batch_list),
+            seller=self.seller,
+            validate="none",
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenBatchLists:
+    """Immutable snapshot of a BatchLists, returned by BatchLists.freeze().
+
+    Args :
+    - batchlists : tuple[FrozenBatchCollection, ...] : snapshots of the collections of each seller
+
+    Example :
+
+    >>> catalog = BatchLists.from_str(["seller1_batch 1:1; 2xapple", "seller2_batch 1:2; 3xapple"])
+    >>> results = {catalog.freeze(): "result of the solve"}
+    >>> results[BatchLists.from_str(["seller1_batch 1:1; 2xapple", "seller2_batch 1:2; 3xapple"]).freeze()]
+    'result of the solve'
+    """
+
+    batchlists: tuple[FrozenBatchCollection, ...]
+    _hash: int = field(init=False, repr=False, compare=False)
+    fingerprint: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Computes the hash and the fingerprint of the snapshot from the ones of its collections."""
+
+        object.__setattr__(self, "_hash", hash(self.batchlists))
+        object.__setattr__(
+            self,
+            "fingerprint",
+            _fingerprint([batches.fingerprint for batches in self.batchlists]),
+        )
+
+    def __hash__(self) -> int:
+        """Returns the cached hash of the snapshot."""
+
+        return self._hash
+
+    def __len__(self) -> int:
+        """Returns the number of collections in the snapshot."""
+
+        return len(self.batchlists)
+
+    def __iter__(self) -> Iterator[FrozenBatchCollection]:
+        """Returns an iterator over the snapshots of the collections."""
+
+        return iter(self.batchlists)
+
+    def thaw(self) -> "BatchLists":
+        """Returns a mutable BatchLists with the content of the snapshot."""
+
+        return BatchLists([batches.thaw() for batches in self.batchlists])
+
+
 @serde
-@dataclass
+@dataclass(slots=True)
 class Item_in_batch:
     """Class illustrating the different items
     and their respective quantity in the considered batch.
@@ -72,8 +314,9 @@ class Item_in_batch:
     quantity_in_batch: float | int
 
     def __post_init__(self):
-        """Checks if the item is valid."""
+        """Checks if the item is valid and interns its name."""
 
+        self.name = sys.intern(self.name)
         if self.quantity_in_batch < 0:
             raise Incompatible_negative_value(
                 f"The specific quantity of the entered item : \n '{self.quantity_in_batch}' is negative, however, it must be positive or zero."
@@ -210,7 +453,7 @@ class Item_in_batch:
 
 
 @serde
-@dataclass
+@dataclass(slots=True)
 class Batch:
     """Class representing the proposed batches of items.
 
@@ -288,19 +531,74 @@ class Batch:
     name: str
     price: float | int
     items: list[Item_in_batch] = field(default_factory=list)
+    _index: dict[str, int] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+        metadata={"serde_skip": True},
+    )
+    _version: int = field(
+        default=-1,
+        init=False,
+        repr=False,
+        compare=False,
+        metadata={"serde_skip": True},
+    )
+    _universe: dict[str, int] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+        metadata={"serde_skip": True},
+    )
 
     def __post_init__(self):
-        """Checks if the batch is valid."""
+        """Checks if the batch is valid and interns its name."""
 
+        self.name = sys.intern(self.name)
         if self.price < 0:
             raise Incompatible_negative_value(
                 f"The price of the batch '{self.price}' is negative, however, it must be positive or zero."
             )
 
-        if len(self) > 0:
-            item_names = [item.name for item in self.items]
-            if len(item_names) != len(set(item_names)):
-                raise ValueError("Some items have the same name in the batch !")
+        self._reindex()
+        if len(self._index) != len(self.items):
+            raise ValueError("Some items have the same name in the batch !")
+
+    def _reindex(self) -> None:
+        """Rebuilds the index giving the position of each item name in the list of items.
+        The list of items is kept in a _TrackedList, whose version is recorded with the index.
+        """
+
+        if type(self.items) is not _TrackedList:
+            self.items = _TrackedList(self.items)
+        self._index = {item.name: position for position, item in enumerate(self.items)}
+        self._version = self.items.version
+
+    def _position(self, item_name: str) -> int | None:
+        """Returns the position of the item in the list of items, None if it is not in the batch.
+
+        The index is rebuilt only if the list of items has been replaced or modified without the methods of the batch,
+        which the version of the list tells in O(1).
+        """
+
+        if getattr(self.items, "version", None) != self._version:
+            self._reindex()
+        return self._index.get(item_name)
+
+    def _swap_remove(self, position: int) -> Item_in_batch:
+        """Removes the item at the position in O(1) : the last item takes its place,
+        so only its entry of the index changes. Returns the removed item."""
+
+        item = self.items[position]
+        last_item = self.items.pop()
+        if last_item is not item:
+            self.items[position] = last_item
+            self._index[last_item.name] = position
+        del self._index[item.name]
+        self._version = self.items.version
+        return item
 
     def __hash__(self):
         """Returns the hash of the batch."""
@@ -319,16 +617,17 @@ class Batch:
     def __getitem__(
         self, index: int | str
     ) -> str | float | int | Item_in_batch | list[Item_in_batch]:
-        """Returns the name, the price or the items at the specified index.
+        """Returns the name, the price, the items at the specified index or the quantity of an item.
 
         Args :
-        - index : int | str : index of the item
+        - index : int | str : index of the item, or name of the item
 
         Returns :
-        - str | float | list[Item_in_batch] : name, price or items of the batch
+        - str | float | list[Item_in_batch] : name, price or items of the batch, or quantity of the item
 
         Raises :
         - IndexError : if the index is not valid
+        - KeyError : if the key is neither an attribute nor an item of the batch or of its BatchCollection
 
         Example :
 
@@ -347,6 +646,15 @@ class Batch:
 
         >>> batch[1]
         Item_in_batch(name='orange', quantity_in_batch=2)
+
+        >>> batch["orange"]
+        2
+
+        Once the batch belongs to a BatchCollection, the items of the other batches have an implicit quantity of 0 :
+
+        >>> bc = BatchCollection([batch, Batch("batch 2", 2, [Item_in_batch("banana", 3)])])
+        >>> batch["banana"]
+        0.0
         """
 
         if index == "name":
@@ -358,6 +666,11 @@ class Batch:
         elif isinstance(index, int):
             return self.items[index]
         elif isinstance(index, str):
+            position = self._position(index)
+            if position is not None:
+                return self.items[position].quantity_in_batch
+            elif index in self._universe:
+                return 0.0
             raise KeyError("You must provide a valid key.")
         else:
             raise IndexError("You must provide a valid index.")
@@ -410,10 +723,7 @@ class Batch:
         False
         """
 
-        for item in self:
-            if item.name == item_name:
-                return True
-        return False
+        return self._position(item_name) is not None
 
     def __add__(self, other: "Batch") -> "Batch":
         """Returns a new Batch object with the items of the two Batch objects.
@@ -661,21 +971,26 @@ class Batch:
         Batch(name='batch 1', price=1, items=[Item_in_batch(name='apple', quantity_in_batch=4), Item_in_batch(name='orange', quantity_in_batch=2)])
         """
 
-        existing_items = {item.name: item for item in self.items}
+        new_items: dict[str, Item_in_batch] = {}
 
         for item in items:
-            if item.name in existing_items:
-                if add_quantities:
-                    existing_items[
-                        item.name
-                    ].quantity_in_batch += item.quantity_in_batch
-                else:
-                    raise ValueError("Some items have the same name in the batch !")
+            position = self._position(item.name)
+            if position is None and item.name not in new_items:
+                new_items[item.name] = item
+            elif add_quantities:
+                existing_item = (
+                    self.items[position]
+                    if position is not None
+                    else new_items[item.name]
+                )
+                existing_item.quantity_in_batch += item.quantity_in_batch
             else:
-                existing_items[item.name] = item
+                raise ValueError("Some items have the same name in the batch !")
 
-        self.items = list(existing_items.values())
-        self.__post_init__()
+        for item_name, item in new_items.items():
+            self._index[item_name] = len(self.items)
+            self.items.append(item)
+        self._version = self.items.version
         return self
 
     def remove_item(self, *index: int, **item_names: str) -> "Batch":
@@ -713,11 +1028,16 @@ class Batch:
         """
 
         if item_names:
-            for item_name in item_names.values():
-                self.items = [item for item in self.items if item.name != item_name]
+            positions = {self._position(item_name) for item_name in item_names.values()}
+            self.items = [
+                item
+                for position, item in enumerate(self.items)
+                if position not in positions
+            ]
         elif index:
             for ind in sorted(index, reverse=True):
                 self.items.pop(ind)
+        self._reindex()
         return self
 
     def find_item(
@@ -742,14 +1062,7 @@ class Batch:
         """
 
         if item_name:
-            return next(
-                (
-                    index
-                    for index, item in enumerate(self.items)
-                    if item.name == item_name
-                ),
-                None,
-            )
+            return self._position(item_name)
         elif item_quantity:
             indexes = [
                 index
@@ -789,12 +1102,12 @@ class Batch:
 
         if by == "name":
             self.items.sort(key=lambda x: x.name, reverse=reverse)
-            return self
         elif by == "quantity":
             self.items.sort(key=lambda x: x.quantity_in_batch, reverse=reverse)
-            return self
         else:
             raise KeyError("You must provide a valid key.")
+        self._reindex()
+        return self
 
     def are_equal(self, other: "Batch") -> bool:
         """Returns True if the two Batch objects have the same items, False otherwise.
@@ -813,6 +1126,444 @@ class Batch:
 
         return set(self) == set(other)
 
+    def freeze(self) -> FrozenBatch:
+        """Returns an immutable snapshot of the batch, with a cached hash and fingerprint.
+
+        Example :
+
+        >>> Batch("batch 1", 1, [Item_in_batch("apple", 1)]).freeze()
+        FrozenBatch(name='batch 1', price=1.0, items=(('apple', 1.0),))
+        """
+
+        return FrozenBatch(
+            self.name,
+            float(self.price),
+            tuple((item.name, float(item.quantity_in_batch)) for item in self.items),
+        )
+
+
+def _checked_item(name: str, quantity: float) -> Item_in_batch:
+    """Creates an Item_in_batch without calling its __init__,
+    for the interned names and the quantities already checked in bulk by a loader."""
+
+    item = object.__new__(Item_in_batch)
+    item.name = name
+    item.quantity_in_batch = quantity
+    return item
+
+
+def _checked_batch(name: str, price: float | int, items: list[Item_in_batch]) -> Batch:
+    """Creates a Batch without calling its __init__, for the batches of a file whose checksum has been verified."""
+
+    batch = object.__new__(Batch)
+    batch.name = sys.intern(name)
+    batch.price = price
+    batch.items = items
+    batch._reindex()
+    batch._universe = {}
+    return batch
+
+
+def _batch_from_dict(batch: dict) -> Batch:
+    """Creates a Batch object from its json representation."""
+
+    return Batch(
+        name=batch["name"],
+        price=batch["price"],
+        items=[
+            Item_in_batch(item["name"], item["quantity_in_batch"])
+            for item in batch["items"]
+        ],
+    )
+
+
+def _batch_to_dict(batch: Batch) -> dict:
+    """Returns the json representation of a Batch object, without its private fields."""
+
+    return {
+        "name": batch.name,
+        "price": batch.price,
+        "items": [
+            {"name": item.name, "quantity_in_batch": item.quantity_in_batch}
+            for item in batch.items
+        ],
+    }
+
+
+def _sparse_batch_to_dict(batch: Batch, vocabulary: dict[str, int]) -> dict:
+    """Returns the sparse json representation of a Batch object : the positions of its items
+    in the vocabulary of the file and their quantities. The new items are added to the vocabulary.
+    """
+
+    return {
+        "name": batch.name,
+        "price": batch.price,
+        "item_indices": [
+            vocabulary.setdefault(item.name, len(vocabulary)) for item in batch.items
+        ],
+        "quantities": [item.quantity_in_batch for item in batch.items],
+    }
+
+
+def _sparse_batch_from_dict(batch: dict, item_names: list[str]) -> Batch:
+    """Creates a Batch object from its sparse json representation and the vocabulary of the file."""
+
+    return Batch(
+        name=batch["name"],
+        price=batch["price"],
+        items=[
+            Item_in_batch(item_names[index], quantity)
+            for index, quantity in zip(
+                batch["item_indices"], batch["quantities"], strict=True
+            )
+        ],
+    )
+
+
+def _batches_from_dict(batches: dict) -> Iterator[Batch]:
+    """Yields the batches of the json representation of a BatchCollection object, sparse or not."""
+
+    if "item_names" in batches:
+        item_names = [sys.intern(item_name) for item_name in batches["item_names"]]
+        return (
+            _sparse_batch_from_dict(batch, item_names)
+            for batch in batches["batch_list"]
+        )
+    return (_batch_from_dict(batch) for batch in batches["batch_list"])
+
+
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _decode_json_object(
+    text: str, position: int = 0
+) -> tuple[dict, dict[str, tuple[int, int]], int]:
+    """Decodes the json object starting at a position of a text one member at a time.
+    Returns the object, the span of the text of each of its values and the position after it.
+    """
+
+    position = _JSON_WHITESPACE.match(text, position).end()
+    if text[position : position + 1] != "{":
+        raise json.JSONDecodeError("Expecting '{'", text, position)
+    json_object: dict = {}
+    spans: dict[str, tuple[int, int]] = {}
+    position = _JSON_WHITESPACE.match(text, position + 1).end()
+    if text[position : position + 1] == "}":
+        return json_object, spans, position + 1
+    while True:
+        key, position = _JSON_DECODER.raw_decode(text, position)
+        if not isinstance(key, str):
+            raise json.JSONDecodeError("Expecting a property name", text, position)
+        position = _JSON_WHITESPACE.match(text, position).end()
+        if text[position : position + 1] != ":":
+            raise json.JSONDecodeError("Expecting ':' delimiter", text, position)
+        start = _JSON_WHITESPACE.match(text, position + 1).end()
+        json_object[key], position = _JSON_DECODER.raw_decode(text, start)
+        spans[key] = (start, position)
+        position = _JSON_WHITESPACE.match(text, position).end()
+        delimiter = text[position : position + 1]
+        if delimiter == "}":
+            return json_object, spans, position + 1
+        if delimiter != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, position)
+        position = _JSON_WHITESPACE.match(text, position + 1).end()
+
+
+def _decode_with_checksum(text: str, position: int = 0) -> tuple[tuple[dict, str], int]:
+    """Decodes the json representation of a BatchCollection object starting at a position of a text.
+    Returns it with the checksum of its content, computed like to_json does on the raw text
+    of its batch_list, item_names and seller values, and the position after it."""
+
+    json_bc, spans, end = _decode_json_object(text, position)
+    content_digest = hashlib.sha256()
+    for key in ("batch_list", "item_names", "seller"):
+        if key in spans:
+            content_digest.update(text[slice(*spans[key])].encode("utf-8"))
+    return (json_bc, content_digest.hexdigest()), end
+
+
+def _trusted_batches_from_dict(batches: dict) -> Iterator[Batch]:
+    """Yields the batches of the json representation of a BatchCollection object, sparse or not,
+    without checking them."""
+
+    if "item_names" in batches:
+        item_names = [sys.intern(item_name) for item_name in batches["item_names"]]
+        for batch in batches["batch_list"]:
+            yield _checked_batch(
+                batch["name"],
+                batch["price"],
+                [
+                    _checked_item(item_names[index], quantity)
+                    for index, quantity in zip(
+                        batch["item_indices"], batch["quantities"]
+                    )
+                ],
+            )
+    else:
+        for batch in batches["batch_list"]:
+            yield _checked_batch(
+                batch["name"],
+                batch["price"],
+                [
+                    _checked_item(sys.intern(item["name"]), item["quantity_in_batch"])
+                    for item in batch["items"]
+                ],
+            )
+
+
+def _ndjson_lines(seller: str, batches: Iterable[Batch]) -> Iterator[str]:
+    """Yields the NDJSON line {seller, name, price, items} of each batch of a seller."""
+
+    for batch in batches:
+        yield json.dumps(
+            {"seller": seller, **_batch_to_dict(batch)}, separators=(",", ":")
+        ) + "\n"
+
+
+def _read_patch(path: str) -> Iterator[dict]:
+    """Yields the operations of a patch log, one JSON object per line."""
+
+    with open_file(path, "r") as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _check_number(value, name: str) -> None:
+    """Checks that a price or a quantity read from a patch has the type checked on a Batch."""
+
+    if isinstance(value, bool) or not isinstance(value, (float, int)):
+        raise TypeError(
+            f"Expected '{name}' to be of type 'float | int', but got '{type(value).__name__}'."
+        )
+
+
+def _tokenize_line(
+    line: str, seller: str | None
+) -> tuple[str, str, float, list[str], list[float]]:
+    """Splits a 'seller_batch:price; quantityxitem, ...' line in a single pass over its separators
+    and returns the seller, the name and the price of the batch, the names and the quantities of its items.
+    If the seller is given, the line has no 'seller_' prefix."""
+
+    head, separator, items = line.partition(";")
+    if not separator:
+        raise ValueError("missing ';' after the price")
+    name, separator, price = head.partition(":")
+    if not separator:
+        raise ValueError("missing ':' before the price")
+    if seller is None:
+        seller, separator, name = name.partition("_")
+        if not separator:
+            raise ValueError("missing '_' between the seller and the batch")
+
+    item_names = []
+    quantities = []
+    for token in items.split(","):
+        quantity, separator, item_name = token.partition("x")
+        if not separator:
+            if token.strip():
+                raise ValueError(f"missing 'x' in the item '{token.strip()}'")
+            continue
+        item_name = item_name.strip()
+        if not item_name:
+            raise ValueError(f"missing the name of the item '{token.strip()}'")
+        quantity_float = float(quantity)
+        if quantity_float < 0:
+            raise Incompatible_negative_value(
+                f"the quantity of the item '{item_name}' is negative"
+            )
+        item_names.append(item_name)
+        quantities.append(quantity_float)
+
+    return seller.strip(), name.strip(), float(price), item_names, quantities
+
+
+def _tokenize_lines(
+    first_line: int, lines: list[str], seller: str | None = None
+) -> list[tuple[int, str, str, float, list[str], list[float]]]:
+    """Splits lines of the string grammar and returns their numbers with their tokens.
+    The empty lines are skipped. Only built-in types are returned, so they are quickly sent back by a process.
+
+    Raises :
+    - Invalid_batch_line : if a line cannot be parsed, with its number
+    """
+
+    records = []
+    for line_number, line in enumerate(lines, first_line):
+        if line.strip():
+            try:
+                records.append((line_number, *_tokenize_line(line, seller)))
+            except ValueError as error:
+                raise Invalid_batch_line(
+                    line_number, f"{error} in '{line.strip()}'"
+                ) from None
+    return records
+
+
+def _line_chunks(
+    lines: Iterable[str], chunk_size: int
+) -> Iterator[tuple[int, list[str]]]:
+    """Yields the number of the first line and the lines of each chunk of chunk_size lines."""
+
+    iterator = iter(lines)
+    first_line = 1
+    while chunk := list(islice(iterator, chunk_size)):
+        yield first_line, chunk
+        first_line += len(chunk)
+
+
+def _tokenized_chunks(
+    lines: Iterable[str], seller: str | None, workers: int | None, chunk_size: int
+) -> Iterator[list[tuple[int, str, str, float, list[str], list[float]]]]:
+    """Yields the tokens of each chunk of lines, in order.
+    If workers is not 1, the chunks are split in a pool of processes, with at most two chunks per process in flight.
+    """
+
+    chunks = _line_chunks(lines, chunk_size)
+    if workers == 1:
+        for first_line, chunk in chunks:
+            yield _tokenize_lines(first_line, chunk, seller)
+        return
+
+    window = 2 * (workers or os.cpu_count() or 1)
+    pending: deque = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for first_line, chunk in chunks:
+            pending.append(executor.submit(_tokenize_lines, first_line, chunk, seller))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _parsed_records(
+    tokenized: Iterable[list[tuple[int, str, str, float, list[str], list[float]]]]
+) -> Iterator[tuple[str, Batch]]:
+    """Builds the (seller, batch) records of the tokenized chunks.
+
+    Raises :
+    - Invalid_batch_line : if a batch is not valid or if a seller sells a batch already defined on a previous line
+    """
+
+    seen: dict[tuple[str, str], int] = {}
+    for records in tokenized:
+        for line_number, seller, name, price, item_names, quantities in records:
+            seller = sys.intern(seller)
+            if (seller, name) in seen:
+                raise Invalid_batch_line(
+                    line_number,
+                    f"the batch '{name}' of '{seller}' is already defined at line {seen[seller, name]}",
+                )
+            seen[seller, name] = line_number
+            try:
+                batch = Batch(
+                    name,
+                    price,
+                    [
+                        _checked_item(sys.intern(item_name), quantity)
+                        for item_name, quantity in zip(item_names, quantities)
+                    ],
+                )
+            except ValueError as error:
+                raise Invalid_batch_line(line_number, str(error)) from None
+            yield seller, batch
+
+
+def _read_ndjson_range(path: str, start: int, end: int) -> list[tuple[str, Batch]]:
+    """Reads the (seller, batch) records of the lines of a NDJSON file which begin in the byte range [start, end)."""
+
+    records = []
+    with open_file(path, "rb") as file:
+        if start > 0:
+            file.seek(start - 1)
+            file.readline()
+        while file.tell() < end:
+            line = file.readline()
+            if not line:
+                break
+            if line.strip():
+                record = json.loads(line)
+                records.append((record["seller"], _batch_from_dict(record)))
+    return records
+
+
+def _sheet_frame(cells: np.ndarray) -> pd.DataFrame:
+    """Creates the DataFrame of a sheet from its cells, in a single block.
+    The first row contains the names of the batches and the first column the labels of the rows.
+    Unlike the header of pandas, the duplicated batch names of different sellers are kept as they are.
+    """
+
+    cells[cells == ""] = None
+    return pd.DataFrame(
+        cells[1:, 1:],
+        index=[str(label) for label in cells[1:, 0]],
+        columns=[str(name) for name in cells[0, 1:]],
+    )
+
+
+def _iter_json_array(
+    path: str,
+    chunk_size: int = 1 << 20,
+    decode: Callable[[str, int], tuple] = _JSON_DECODER.raw_decode,
+) -> Iterator:
+    """Yields the elements of the top-level array of a json file one at a time.
+    The file is read by chunks, so only the element being decoded is held in memory.
+    The buffer is only cut when a chunk is read, the elements are decoded at a moving position
+    by decode, which returns the element and the position after it like json.JSONDecoder.raw_decode.
+    """
+
+    with open_file(path, "r") as file:
+        buffer, position, end_of_file = "", 0, False
+        read_size, expected = chunk_size, "["
+        while True:
+            while position < len(buffer) and buffer[position] in " \t\n\r":
+                position += 1
+            if position < len(buffer):
+                character = buffer[position]
+                if expected == "[":
+                    if character != "[":
+                        raise ValueError(
+                            f"The json file '{path}' does not contain an array."
+                        )
+                    position, expected = position + 1, "first element"
+                    continue
+                if expected == "separator":
+                    if character == "]":
+                        return
+                    if character != ",":
+                        raise ValueError(
+                            f"Expected ',' or ']' between the elements of the json file '{path}', but got '{character}'."
+                        )
+                    position, expected = position + 1, "element"
+                    continue
+                if character == "]" and expected == "first element":
+                    return
+                if character in ",]":
+                    raise ValueError(
+                        f"Expected an element in the array of the json file '{path}', but got '{character}'."
+                    )
+                try:
+                    element, end = decode(buffer, position)
+                    if end < len(buffer) or end_of_file:
+                        yield element
+                        position, expected, read_size = end, "separator", chunk_size
+                        continue
+                except json.JSONDecodeError:
+                    if end_of_file:
+                        raise
+            elif end_of_file:
+                if expected == "[":
+                    raise ValueError(
+                        f"The json file '{path}' does not contain an array."
+                    )
+                raise ValueError(f"The array of the json file '{path}' is not closed.")
+            chunk = file.read(read_size)
+            end_of_file = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+            read_size *= 2
+
 
 @serde
 @dataclass
@@ -831,7 +1582,10 @@ class BatchCollection:
     - TypeError : if the elements of the list are not of type Batch.
 
     Warning :
-    - Some batches contain weapons not present in other batches. They have been added with a quantity of 0.
+    - Some batches contain weapons not present in other batches. They have an implicit quantity of 0 in the other batches.
+
+    The batches only store their non-zero items. The BatchCollection keeps the universe of its items
+    and an item absent from a batch has an implicit quantity of 0 in this batch.
 
     Example :
 
@@ -924,7 +1678,7 @@ class BatchCollection:
     |     orange      |    4     |
     +-----------------+----------+
 
-    If the batches contain weapons not present in other batches, they are added with a quantity of 0 :
+    If the batches contain weapons not present in other batches, they have an implicit quantity of 0 :
 
     >>> BatchCollection.from_str(
         "batch 1:1; 2xapple, 3xorange, 5xbanana",
@@ -955,48 +1709,128 @@ class BatchCollection:
 
     batch_list: list[Batch] = field(default_factory=list)
     seller: str = "Default seller"
+    _universe: dict[str, int] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+        metadata={"serde_skip": True},
+    )
+    _index: dict[str, int] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+        metadata={"serde_skip": True},
+    )
+    _version: int = field(
+        default=-1,
+        init=False,
+        repr=False,
+        compare=False,
+        metadata={"serde_skip": True},
+    )
 
     def __post_init__(self):
-        """Checks if the list of batches is valid."""
+        """Checks if the list of batches is valid and builds the universe of the items."""
 
-        if len(self) > 0:
-            batch_name_already_seen = set()
+        self.seller = sys.intern(self.seller)
+        self._universe = {}
+        self._reindex()
+        if len(self._index) != len(self.batch_list):
+            seen = set()
             for batch in self.batch_list:
-                if batch.name not in batch_name_already_seen:
-                    batch_name_already_seen.add(batch.name)
-                else:
+                if batch.name in seen:
                     raise ValueError(
                         f"The name of the batch '{batch.name}' is not unique."
                     )
+                seen.add(batch.name)
+        if len(self) > 0:
 
-            all_items_name = [
-                item.name for batch in self.batch_list for item in batch.items
-            ]
-
-            counter = 0
             for batch in self.batch_list:
-                for item_name in all_items_name:
-                    if item_name not in [item.name for item in batch.items]:
-                        batch.items.append(Item_in_batch(item_name, 0.0))
-                        counter += 1
-
-            if counter > 0:
-                warnings.warn(
-                    "Some batches contain weapons not present in other batches. They have been added with a quantity of 0."
-                )
+                self._register_items(batch)
+            self._warn_incomplete_batches()
 
-            for item_name in all_items_name:
-                item_list_name = np.array(
-                    [
-                        item.quantity_in_batch == 0
-                        for batch in self
-                        for item in batch
-                        if item.name == item_name
-                    ]
-                )
-                if all(item_list_name):
-                    for batch in self:
-                        batch.remove_item(item_name=item_name)
+    def _reindex(self) -> None:
+        """Rebuilds the index giving the position of each batch name in the list of batches.
+        The list of batches is kept in a _TrackedList, whose version is recorded with the index.
+        """
+
+        if type(self.batch_list) is not _TrackedList:
+            self.batch_list = _TrackedList(self.batch_list)
+        self._index = {
+            batch.name: position for position, batch in enumerate(self.batch_list)
+        }
+        self._version = self.batch_list.version
+
+    def _position(self, batch_name: str) -> int | None:
+        """Returns the position of the batch in the list of batches, None if it is not in the BatchCollection.
+
+        The index is rebuilt only if the list of batches has been replaced or modified without the methods
+        of the BatchCollection, which the version of the list tells in O(1).
+        """
+
+        if getattr(self.batch_list, "version", None) != self._version:
+            self._reindex()
+        return self._index.get(batch_name)
+
+    def _swap_remove(self, position: int) -> Batch:
+        """Removes the batch at the position in O(1) : the last batch takes its place,
+        so only its entry of the index changes. Returns the removed batch."""
+
+        batch = self.batch_list[position]
+        last_batch = self.batch_list.pop()
+        if last_batch is not batch:
+            self.batch_list[position] = last_batch
+            self._index[last_batch.name] = position
+        del self._index[batch.name]
+        self._version = self.batch_list.version
+        return batch
+
+    def _warn_incomplete_batches(self, batches: Iterable[Batch] | None = None) -> None:
+        """Warns the user if some batches do not contain all the items of the BatchCollection.
+        Only the given batches are checked, all the batches by default."""
+
+        if batches is None:
+            batches = self.batch_list
+        if any(len(batch) != len(self._universe) for batch in batches):
+            warnings.warn(
+                "Some batches contain weapons not present in other batches. They have an implicit quantity of 0 in the other batches."
+            )
+
+    def _register_items(self, batch: Batch) -> None:
+        """Removes the items with a null quantity from the batch
+        and adds its items to the universe of the BatchCollection."""
+
+        if any(item.quantity_in_batch == 0 for item in batch.items):
+            batch.items = [item for item in batch.items if item.quantity_in_batch != 0]
+            batch._reindex()
+        for item in batch.items:
+            self._universe[item.name] = self._universe.get(item.name, 0) + 1
+        batch._universe = self._universe
+
+    def _unregister_item(self, item_name: str) -> bool:
+        """Removes an item of a batch from the universe of the BatchCollection.
+        Returns True if no batch of the BatchCollection contains the item anymore."""
+
+        count = self._universe[item_name] - 1
+        if count:
+            self._universe[item_name] = count
+            return False
+        del self._universe[item_name]
+        return True
+
+    @property
+    def item_names(self) -> list[str]:
+        """Returns the names of all the items sold in the BatchCollection, in order of appearance.
+
+        Example :
+
+        >>> BatchCollection.from_str("batch 1:1; 2xapple, 3xorange", "batch 2:2; 4xbanana").item_names
+        ['apple', 'orange', 'banana']
+        """
+
+        return list(self._universe)
 
     def __str__(self) -> str:
         """Prints the batch collection in a readable way with print()."""
@@ -1089,10 +1923,7 @@ class BatchCollection:
         False
         """
 
-        for batch in self.batch_list:
-            if batch.name == batch_name:
-                return True
-        return False
+        return self._position(batch_name) is not None
 
     def __hash__(self):
         """Returns the hash of the BatchCollection object."""
@@ -1284,14 +2115,105 @@ class BatchCollection:
         BatchCollection(seller = "seller1", batch_list=[Batch(name='batch 1', price=1, items=[Item_in_batch(name='apple', quantity_in_batch=2), Item_in_batch(name='orange', quantity_in_batch=3), Item_in_batch(name='banana', quantity_in_batch=5)]), Batch(name='batch 2', price=2, items=[Item_in_batch(name='pinapple', quantity_in_batch=3), Item_in_batch(name='cherry', quantity_in_batch=4)])])
         """
 
-        batch_list = [Batch.from_str(string) for string in strings]
-        return cls(batch_list, seller)
-
-    def are_equal(self, other: "BatchCollection") -> bool:
-        """Returns True if the two BatchCollection objects have the same batch but in different order.
+        return cls.from_batches(
+            (Batch.from_str(string) for string in strings), seller=seller
+        )
 
-        Args :
-        - other : BatchCollection : other BatchCollection object
+    @classmethod
+    def from_lines(
+        cls,
+        lines: Iterable[str] | str,
+        seller: str = "Default seller",
+        workers: int | None = 1,
+        chunk_size: int = 100_000,
+    ) -> "BatchCollection":
+        """Creates a batch collection from lines of the 'batch:price; quantityxitem, ...' grammar of from_str.
+        Each line is parsed in a single pass and the BatchCollection is built in bulk.
+
+        Args :
+        - lines : Iterable[str] | str : lines of the batches, or path to a file of lines (compressed or not)
+        - seller : str : name of the seller
+        - workers : int | None : number of processes parsing the chunks of lines, None for the number of processors
+        - chunk_size : int : number of lines parsed at once
+
+        Returns :
+        - BatchCollection : BatchCollection object
+
+        Raises :
+        - Invalid_batch_line : if a line cannot be parsed or if a batch name is used on several lines, with the number of the line
+
+        Example :
+
+        >>> BatchCollection.from_lines(["batch 1:1; 2xapple", "batch 2:2; 3xorange"], seller="seller1")
+        BatchCollection(batch_list=[Batch(name='batch 1', price=1.0, items=[Item_in_batch(name='apple', quantity_in_batch=2.0)]), Batch(name='batch 2', price=2.0, items=[Item_in_batch(name='orange', quantity_in_batch=3.0)])], seller='seller1')
+
+        >>> BatchCollection.from_lines(["batch 1:1; 2xapple", "batch 2:two; 3xorange"])
+        Traceback (most recent call last):
+        BatchMonitor.lib_batches.Invalid_batch_line: Line 2 : could not convert string to float: 'two' in 'batch 2:two; 3xorange'
+        """
+
+        with ExitStack() as stack:
+            if isinstance(lines, str):
+                lines = stack.enter_context(open_file(lines, "r"))
+            return cls.from_batches(
+                (
+                    batch
+                    for _, batch in _parsed_records(
+                        _tokenized_chunks(lines, seller, workers, chunk_size)
+                    )
+                ),
+                seller=seller,
+                validate="none",
+            )
+
+    @classmethod
+    def from_batches(
+        cls,
+        batches: Iterable[Batch],
+        seller: str = "Default seller",
+        validate: str = "once",
+    ) -> "BatchCollection":
+        """Creates a batch collection from an iterable of batches.
+        The batches are streamed in and the BatchCollection is checked only once, when all of them are collected.
+
+        Args :
+        - batches : Iterable[Batch] : batches sold by the seller
+        - seller : str : name of the seller
+        - validate : str : "once" to check the uniqueness of the batch names after the last batch,
+        "none" to skip the checks when the batches come from an already valid source
+
+        Returns :
+        - BatchCollection : BatchCollection object
+
+        Raises :
+        - ValueError : if the names of the batches are not unique or if validate is not valid
+
+        Example :
+
+        >>> BatchCollection.from_batches(
+            (Batch.from_str(string) for string in ["batch 1:1; 2xapple", "batch 2:2; 3xorange"]),
+            seller = "seller1"
+        )
+        BatchCollection(batch_list=[Batch(name='batch 1', price=1.0, items=[Item_in_batch(name='apple', quantity_in_batch=2.0)]), Batch(name='batch 2', price=2.0, items=[Item_in_batch(name='orange', quantity_in_batch=3.0)])], seller='seller1')
+        """
+
+        if validate == "once":
+            return cls(list(batches), seller)
+        elif validate == "none":
+            batch_collection = cls(seller=seller)
+            batch_collection.batch_list = list(batches)
+            for batch in batch_collection.batch_list:
+                batch_collection._register_items(batch)
+            batch_collection._reindex()
+            return batch_collection
+        else:
+            raise ValueError("The 'validate' parameter must be 'once' or 'none'.")
+
+    def are_equal(self, other: "BatchCollection") -> bool:
+        """Returns True if the two BatchCollection objects have the same batch but in different order.
+
+        Args :
+        - other : BatchCollection : other BatchCollection object
         - bool : True if the two BatchCollection objects have the same batch but in different order
 
         Example :
@@ -1306,6 +2228,19 @@ class BatchCollection:
 
         return set(self.batch_list) == set(other.batch_list)
 
+    def freeze(self) -> FrozenBatchCollection:
+        """Returns an immutable snapshot of the BatchCollection, with a cached hash and fingerprint.
+
+        Example :
+
+        >>> BatchCollection.from_str("batch 1:1; 2xapple", seller="seller1").freeze()
+        FrozenBatchCollection(batch_list=(FrozenBatch(name='batch 1', price=1.0, items=(('apple', 2.0),)),), seller='seller1')
+        """
+
+        return FrozenBatchCollection(
+            tuple(batch.freeze() for batch in self.batch_list), self.seller
+        )
+
     def add_batch(self, *batch: Batch) -> "BatchCollection":
         """Adds a batch or a list of batches to the list of batches in the BatchCollection.
 
@@ -1340,11 +2275,18 @@ class BatchCollection:
         ValueError: The name of the batch 'batch 1' is not unique.
         """
 
+        universe_size, batch_count = len(self._universe), len(self.batch_list)
         for b in batch:
-            if b.name in [batch.name for batch in self.batch_list]:
+            if self._position(b.name) is not None:
                 raise ValueError(f"The name of the batch '{b.name}' is not unique.")
+            self._index[b.name] = len(self.batch_list)
             self.batch_list.append(b)
-        self.__post_init__()
+            self._version = self.batch_list.version
+            self._register_items(b)
+        # the batches already added only become incomplete if the universe grows,
+        # then the first of them is enough to warn
+        grown = batch_count > 0 and len(self._universe) != universe_size
+        self._warn_incomplete_batches(self.batch_list if grown else batch)
         return self
 
     def remove_batch(self, *index: int, **batch_name: str) -> "BatchCollection":
@@ -1432,10 +2374,7 @@ class BatchCollection:
         """
 
         if batch_name:
-            for index, batch in enumerate(self):
-                if batch.name == batch_name:
-                    return index
-            return None
+            return self._position(batch_name)
         elif batch_price:
             liste_of_index_with_same_price = [
                 index for index, batch in enumerate(self) if batch.price == batch_price
@@ -1477,11 +2416,111 @@ class BatchCollection:
             self.batch_list.sort(
                 key=lambda x: x.price if x.price else 0, reverse=reverse
             )
+        self._reindex()
         return self
 
-    def to_json(self, path: str = "batch_collection.json"):
+    def _json_text(
+        self,
+        sparse: bool = True,
+        checksum: bool = True,
+        indent: bool = False,
+        depth: int = 0,
+    ) -> Iterator[str]:
+        """Yields the json representation of the BatchCollection object, without its private fields, one batch at a time.
+        The json is compact, or indented by 4 spaces like json.dump for an object nested at the given depth.
+        In the sparse representation, the items of the batches are positions in the item_names vocabulary,
+        which is built while the batches are written, so it comes after them.
+        The checksum is the SHA-256 of the text of the batch_list, item_names and seller values as they are written,
+        so from_json checks it on the raw text it reads.
+        """
+
+        def newline(level: int) -> str:
+            return "\n" + "    " * level if indent else ""
+
+        def value(data, level: int) -> str:
+            if indent:
+                return json.dumps(data, indent=4).replace("\n", newline(level))
+            return json.dumps(data, separators=(",", ":"))
+
+        colon = ": " if indent else ":"
+        vocabulary: dict[str, int] = {}
+        content_digest = hashlib.sha256()
+
+        def written(text: str) -> str:
+            if checksum:
+                content_digest.update(text.encode("utf-8"))
+            return text
+
+        yield "{" + newline(depth + 1) + '"batch_list"' + colon + written("[")
+        for position, batch in enumerate(self.batch_list):
+            yield written(
+                ("," if position else "")
+                + newline(depth + 2)
+                + value(
+                    (
+                        _sparse_batch_to_dict(batch, vocabulary)
+                        if sparse
+                        else _batch_to_dict(batch)
+                    ),
+                    depth + 2,
+                )
+            )
+        yield written((newline(depth + 1) if self.batch_list else "") + "]")
+        members = [("item_names", list(vocabulary))] if sparse else []
+        for key, data in members + [("seller", self.seller)]:
+            yield "," + newline(depth + 1) + json.dumps(key) + colon
+            yield written(value(data, depth + 1))
+        if checksum:
+            yield "," + newline(depth + 1) + '"checksum"' + colon
+            yield json.dumps(content_digest.hexdigest())
+        yield newline(depth) + "}"
+
+    @classmethod
+    def _from_dict(
+        cls, json_bc: dict, content_checksum: str | None = None
+    ) -> "BatchCollection":
+        """Creates a BatchCollection object from its json representation.
+        If the checksum of the content read from the file is given and matches the one written by to_json,
+        the batches are not checked.
+        """
+
+        if content_checksum is not None and "checksum" in json_bc:
+            if json_bc["checksum"] == content_checksum:
+                batch_collection = cls(seller=json_bc["seller"])
+                batch_collection.batch_list = list(_trusted_batches_from_dict(json_bc))
+                batch_collection._universe = dict(
+                    Counter(
+                        item.name
+                        for batch in batch_collection.batch_list
+                        for item in batch.items
+                    )
+                )
+                for batch in batch_collection.batch_list:
+                    batch._universe = batch_collection._universe
+                batch_collection._reindex()
+                return batch_collection
+            warnings.warn(
+                f"The checksum of the batches of '{json_bc['seller']}' does not match their content, they have been checked."
+            )
+        return cls.from_batches(_batches_from_dict(json_bc), seller=json_bc["seller"])
+
+    def to_json(
+        self,
+        path: str = "batch_collection.json",
+        compact: bool = False,
+        sparse: bool = True,
+        checksum: bool = True,
+    ):
         """Returns the BatchCollection object in json format.
 
+        Args :
+        - path : str : path of the json file, compressed with gzip, bz2 or lzma if it ends with .gz, .bz2, .xz or .lzma
+        - compact : bool : writes the json without indentation nor spaces, which is smaller and faster to write
+        - sparse : bool : writes the names of the items once in the item_names vocabulary of the seller,
+        each batch only keeps the positions of its items in it and their quantities.
+        Otherwise each item is written as {"name", "quantity_in_batch"}
+        - checksum : bool : writes the checksum of the content, which allows from_json to load the file without checking it
+
         Returns :
         - str : BatchCollection object in json format
 
@@ -1490,19 +2529,23 @@ class BatchCollection:
         >>> batch_collection = BatchCollection([Batch("batch 1", 1, [Item_in_batch("apple", 1), Item_in_batch("orange", 2)]), Batch("batch 2", 2, [Item_in_batch("apple", 3), Item_in_batch("orange", 4)])], "seller1")
 
         >>> batch_collection.to_json()
+        >>> batch_collection.to_json("batch_collection.json", compact=True)
+        >>> batch_collection.to_json("batch_collection.json", sparse=False)
         """
         try:
-            with open(path, "w") as file:
-                json.dump(self, file, default=lambda o: o.__dict__, indent=4)
+            with open_file(path, "w") as file:
+                file.writelines(self._json_text(sparse, checksum, indent=not compact))
         except Exception as error:
             raise error
 
     @classmethod
-    def from_json(cls, path: str) -> "BatchCollection":
+    def from_json(cls, path: str, trusted: bool = False) -> "BatchCollection":
         """Creates a BatchCollection object from a json file.
 
         Args :
         - path : str : path of the json file
+        - trusted : bool : skips the checks of the batches if the checksum written by to_json matches the text of the file,
+        which is hashed as it is read. A file edited or reformatted since to_json is checked as usual with a warning
 
         Returns :
         - BatchCollection : BatchCollection object
@@ -1514,25 +2557,14 @@ class BatchCollection:
         BatchCollection(batches=[Batch(name='batch 1', price=1, items=[Item_in_batch(name='apple', quantity_in_batch=1), Item_in_batch(name='orange', quantity_in_batch=2)]), Batch(name='batch 2', price=2, items=[Item_in_batch(name='apple', quantity_in_batch=3), Item_in_batch(name='orange', quantity_in_batch=4)]), seller='seller1')
         """
         try:
-            with open(path, "r") as file:
-                json_bc = json.load(file)
-
-            bc = BatchCollection()
-            bc.seller = json_bc["seller"]
-            for batch in json_bc["batch_list"]:
-                item = []
-                batch_name = batch["name"]
-                batch_price = batch["price"]
-                for batch_item in batch["items"]:
-                    item.append(
-                        Item_in_batch(
-                            batch_item["name"], batch_item["quantity_in_batch"]
-                        )
-                    )
-                batch = Batch(name=batch_name, price=batch_price, items=item)
-                bc.add_batch(batch)
-            bc.__post_init__()
-            return bc
+            with open_file(path, "r") as file:
+                text = file.read()
+            if not trusted:
+                return cls._from_dict(json.loads(text))
+            (json_bc, content_checksum), end = _decode_with_checksum(text)
+            if text[end:].strip(" \t\n\r"):
+                raise json.JSONDecodeError("Extra data", text, end)
+            return cls._from_dict(json_bc, content_checksum)
         except Exception as error:
             raise error
 
@@ -1552,6 +2584,8 @@ class BatchLists:
         - ValueError: if the data is not a list of BatchCollection objects.
         - ValueError: if the name of the seller is not unique.
 
+    The batches are not padded with the items of the other sellers. The BatchLists keeps the vocabulary
+    of all the items sold, and the aligned quantities are only computed when they are requested.
 
     Example :
 
@@ -1668,31 +2702,176 @@ class BatchLists:
     """
 
     batchlists: list[BatchCollection] = field(default_factory=list)
+    _sellers: dict[str, int] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+        metadata={"serde_skip": True},
+    )
+    _version: int = field(
+        default=-1,
+        init=False,
+        repr=False,
+        compare=False,
+        metadata={"serde_skip": True},
+    )
+    _vocabulary: dict[str, int] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+        metadata={"serde_skip": True},
+    )
+    _item_names: list[str] = field(
+        default_factory=list,
+        init=False,
+        repr=False,
+        compare=False,
+        metadata={"serde_skip": True},
+    )
+    _item_sellers: dict[str, int] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+        metadata={"serde_skip": True},
+    )
 
     def __post_init__(self):
-        """Checks if the data is a list of BatchCollection objects and if the name of the seller is unique."""
+        """Checks if the data is a list of BatchCollection objects and if the name of the seller is unique.
+        Builds the vocabulary of the items sold by all the sellers."""
 
+        self._sellers = {}
+        self._vocabulary = {}
+        self._item_names = []
+        self._item_sellers = {}
         if len(self) > 0:
-            all_items_name = {
-                item.name for batches in self for batch in batches for item in batch
-            }
-
-            seller_to_batches = {}
+            seller_to_batches: dict[str, BatchCollection] = {}
             for batches in self:
                 if batches.seller not in seller_to_batches:
                     seller_to_batches[batches.seller] = batches
                 else:
-                    seller_to_batches[batches.seller].add_batch(
-                        [batch for batch in batches]
-                    )
+                    seller_to_batches[batches.seller].add_batch(*batches)
 
             self.batchlists = list(seller_to_batches.values())
+            self._reindex()
 
             for batches in self:
-                for batch in batches:
-                    for item_name in all_items_name:
-                        if item_name not in [item.name for item in batch.items]:
-                            batch.items.append(Item_in_batch(item_name, 0.0))
+                self._extend_vocabulary(batches, batches._universe)
+
+    @property
+    def item_names(self) -> list[str]:
+        """Returns the names of all the items sold in the BatchLists, in order of appearance.
+        The batches do not store the items they do not contain, this vocabulary is used to align them.
+        When no seller sells an item anymore, the last item of the vocabulary takes its place.
+
+        Example :
+
+        >>> BatchLists.from_str(["seller1_batch 1:1; 2xapple", "seller2_batch 1:2; 3xkiwi"]).item_names
+        ['apple', 'kiwi']
+        """
+
+        return list(self._item_names)
+
+    def aligned_quantities(self, batch: Batch) -> list[float]:
+        """Returns the quantities of the batch for each item of the vocabulary, 0 for the items it does not contain.
+        The items added to the batch without the methods of the BatchLists, for example with Batch.add_item,
+        are added at the end of the vocabulary.
+
+        Args :
+        - batch : Batch : batch of the BatchLists
+
+        Returns :
+        - list[float] : quantities of the batch in the order of item_names
+
+        Example :
+
+        >>> batch_lists = BatchLists.from_str(["seller1_batch 1:1; 2xapple", "seller2_batch 1:2; 3xkiwi"])
+        >>> batch_lists.aligned_quantities(batch_lists.find_batch("seller2", "batch 1"))
+        [0.0, 3.0]
+        """
+
+        quantities = [0.0] * len(self._vocabulary)
+        for item in batch:
+            if item.name not in self._vocabulary:
+                self._add_item_name(item.name)
+                quantities.append(0.0)
+            quantities[self._vocabulary[item.name]] = float(item.quantity_in_batch)
+        return quantities
+
+    def _add_item_name(self, item_name: str) -> None:
+        """Adds an item at the end of the vocabulary if it is not in it."""
+
+        if item_name not in self._vocabulary:
+            self._vocabulary[item_name] = len(self._item_names)
+            self._item_names.append(item_name)
+
+    def _extend_vocabulary(
+        self, batches: Iterable[Batch], item_names: Iterable[str]
+    ) -> None:
+        """Counts one more seller for the items newly sold by a BatchCollection of the BatchLists,
+        adds them to the vocabulary and shares the vocabulary with its batches."""
+
+        for item_name in item_names:
+            self._item_sellers[item_name] = self._item_sellers.get(item_name, 0) + 1
+            self._add_item_name(item_name)
+        for batch in batches:
+            batch._universe = self._vocabulary
+
+    def _remove_item_seller(self, item_name: str) -> None:
+        """Counts one seller less for an item. When no seller sells the item anymore, it is removed from
+        the vocabulary in place : the last item takes its column, so the other columns do not move.
+        """
+
+        count = self._item_sellers.get(item_name, 1) - 1
+        if count:
+            self._item_sellers[item_name] = count
+            return
+        self._item_sellers.pop(item_name, None)
+        column = self._vocabulary.pop(item_name)
+        last_item_name = self._item_names.pop()
+        if last_item_name != item_name:
+            self._item_names[column] = last_item_name
+            self._vocabulary[last_item_name] = column
+
+    def _reindex(self) -> None:
+        """Rebuilds the index giving the position of each seller in the list of batch collections.
+        The list of batch collections is kept in a _TrackedList, whose version is recorded with the index.
+        """
+
+        if type(self.batchlists) is not _TrackedList:
+            self.batchlists = _TrackedList(self.batchlists)
+        self._sellers = {
+            batches.seller: position for position, batches in enumerate(self.batchlists)
+        }
+        self._version = self.batchlists.version
+
+    def _seller_position(self, seller: str) -> int | None:
+        """Returns the position of the BatchCollection of the seller, None if the seller is not in the BatchLists.
+
+        The index is rebuilt only if the list of batch collections has been replaced or modified without the methods
+        of the BatchLists, which the version of the list tells in O(1).
+        """
+
+        if getattr(self.batchlists, "version", None) != self._version:
+            self._reindex()
+        return self._sellers.get(seller)
+
+    def _swap_remove_seller(self, position: int) -> None:
+        """Removes the BatchCollection at the position in O(1) : the last BatchCollection takes its place,
+        so only its entry of the index changes. The items it sells are removed from the vocabulary.
+        """
+
+        batches = self.batchlists[position]
+        last_batches = self.batchlists.pop()
+        if last_batches is not batches:
+            self.batchlists[position] = last_batches
+            self._sellers[last_batches.seller] = position
+        del self._sellers[batches.seller]
+        self._version = self.batchlists.version
+        for item_name in batches._universe:
+            self._remove_item_seller(item_name)
 
     def __str__(self) -> str:
         """Prints the batchlists in a readable way with print()."""
@@ -1721,11 +2900,10 @@ class BatchLists:
         elif isinstance(index, int):
             return self.batchlists[index]
         elif isinstance(index, str):
-            for batches in self:
-                if batches.seller == index:
-                    return batches
-            else:
+            position = self._seller_position(index)
+            if position is None:
                 raise KeyError(f"Key '{index}' not found.")
+            return self.batchlists[position]
         else:
             return None
 
@@ -1776,10 +2954,7 @@ class BatchLists:
         False
         """
 
-        for batch_collection in self:
-            if batch_collection.seller == seller:
-                return True
-        return False
+        return self._seller_position(seller) is not None
 
     def __eq__(self, other: object) -> bool:
         """Returns True if the two BatchLists objects are the same.
@@ -1918,6 +3093,18 @@ class BatchLists:
 
         return hash(tuple(self.batchlists))
 
+    def freeze(self) -> FrozenBatchLists:
+        """Returns an immutable snapshot of the BatchLists, with a cached hash and fingerprint.
+        The snapshot can be used as a key to memoise the results of the solves per catalog.
+
+        Example :
+
+        >>> BatchLists.from_str(["seller1_batch 1:1; 2xapple"]).freeze()
+        FrozenBatchLists(batchlists=(FrozenBatchCollection(batch_list=(FrozenBatch(name='batch 1', price=1.0, items=(('apple', 2.0),)),), seller='seller1'),))
+        """
+
+        return FrozenBatchLists(tuple(batches.freeze() for batches in self.batchlists))
+
     @classmethod
     def from_str(cls, strings: list[str] | str) -> "BatchLists":
         """Crée un objet BatchLists à partir d'une liste de chaînes de caractères.
@@ -1941,18 +3128,238 @@ class BatchLists:
         BatchLists([BatchCollection(batches=[Batch(name='batch 1', price=1, items=[Item_in_batch(name='apple', quantity_in_batch=2)]), Batch(name='batch 2', price=2, items=[Item_in_batch(name='apple', quantity_in_batch=3), Item_in_batch(name='orange', quantity_in_batch=4)]), seller='seller1'), BatchCollection(batches=[Batch(name='batch 3', price=3, items=[Item_in_batch(name='apple', quantity_in_batch=5), Item_in_batch(name='orange', quantity_in_batch=6)]), Batch(name='batch 4', price=4, items=[Item_in_batch(name='apple', quantity_in_batch=7), Item_in_batch(name='orange', quantity_in_batch=8)]), seller='seller2')])
         """
 
-        seller_to_batches = {}
         strings = strings if isinstance(strings, list) else [strings]
-        for string in strings:
-            seller, batch = string.split("_")
-            if seller not in seller_to_batches:
-                seller_to_batches[seller] = BatchCollection.from_str(
-                    batch, seller=seller
+
+        return cls.from_records(
+            (seller, Batch.from_str(batch))
+            for seller, batch in (string.split("_") for string in strings)
+        )
+
+    @classmethod
+    def from_records(
+        cls, records: Iterable[tuple[str, Batch]], validate: str = "once"
+    ) -> "BatchLists":
+        """Creates a BatchLists object from (seller, batch) records.
+        The records are grouped by seller and each BatchCollection is built and checked only once.
+
+        Args :
+        - records : Iterable[tuple[str, Batch]] : couples of the name of the seller and of a batch he sells
+        - validate : str : "once" to check the BatchCollection objects after the last record, "none" to skip the checks
+
+        Returns :
+        - BatchLists : BatchLists object
+
+        Raises :
+        - ValueError : if the combination of the seller and the batch name is not unique
+
+        Example :
+
+        >>> BatchLists.from_records(
+                [
+                    ("seller1", Batch.from_str("batch 1:1; 2xapple")),
+                    ("seller2", Batch.from_str("batch 1:2; 3xapple")),
+                    ("seller1", Batch.from_str("batch 2:3; 4xorange")),
+                ]
+            )
+        BatchLists(batchlists=[BatchCollection(batch_list=[Batch(name='batch 1', price=1.0, items=[Item_in_batch(name='apple', quantity_in_batch=2.0)]), Batch(name='batch 2', price=3.0, items=[Item_in_batch(name='orange', quantity_in_batch=4.0)])], seller='seller1'), BatchCollection(batch_list=[Batch(name='batch 1', price=2.0, items=[Item_in_batch(name='apple', quantity_in_batch=3.0)])], seller='seller2')])
+        """
+
+        seller_to_batches: dict[str, list[Batch]] = {}
+        for seller, batch in records:
+            seller_to_batches.setdefault(seller, []).append(batch)
+
+        return cls(
+            [
+                BatchCollection.from_batches(batches, seller=seller, validate=validate)
+                for seller, batches in seller_to_batches.items()
+            ]
+        )
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        dataframe: pd.DataFrame,
+        price_row: str = "TOTAL",
+        seller_row: str = "Seller",
+        seller: str = "Default seller",
+    ) -> "BatchLists":
+        """Creates a BatchLists object from a DataFrame with one column per batch.
+        The index contains the names of the items, the price row and the optional seller row.
+        The quantities are read column-wise in a single NumPy array and the batches are grouped with from_records.
+
+        Args :
+        - dataframe : pd.DataFrame : quantities of the items (rows) in each batch (columns)
+        - price_row : str : label of the row containing the price of each batch
+        - seller_row : str : label of the row containing the seller of each batch
+        - seller : str : seller of the batches if the DataFrame has no seller row
+
+        Returns :
+        - BatchLists : BatchLists object, the empty cells and the null quantities are not stored
+
+        Raises :
+        - KeyError : if the DataFrame has no price row
+        - Incompatible_negative_value : if a quantity or a price is negative
+        - ValueError : if a quantity or a price is not a number, or if a seller sells several batches with the same name
+
+        Example :
+
+        >>> BatchLists.from_dataframe(
+                pd.DataFrame(
+                    [[2, 0], [1, 3], [10, 20], ["seller1", "seller2"]],
+                    index=["apple", "banana", "TOTAL", "Seller"],
+                    columns=["batch 1", "batch 1"],
                 )
-            else:
-                seller_to_batches[seller].add_batch(Batch.from_str(batch))
+            )
+        BatchLists(batchlists=[BatchCollection(batch_list=[Batch(name='batch 1', price=10.0, items=[Item_in_batch(name='apple', quantity_in_batch=2.0), Item_in_batch(name='banana', quantity_in_batch=1.0)])], seller='seller1'), BatchCollection(batch_list=[Batch(name='batch 1', price=20.0, items=[Item_in_batch(name='banana', quantity_in_batch=3.0)])], seller='seller2')])
+        """
 
-        return cls(list(seller_to_batches.values()))
+        labels = [str(label).strip() for label in dataframe.index]
+        if price_row not in labels:
+            raise KeyError(f"Key '{price_row}' not found.")
+        item_rows = [
+            row
+            for row, label in enumerate(labels)
+            if label not in (price_row, seller_row)
+        ]
+        item_names = [labels[row] for row in item_rows]
+
+        quantities = np.ascontiguousarray(
+            dataframe.iloc[item_rows].to_numpy(dtype=np.float64, na_value=0.0).T
+        )
+        prices = (
+            dataframe.iloc[labels.index(price_row)]
+            .to_numpy(dtype=np.float64, na_value=0.0)
+            .tolist()
+        )
+        sellers = (
+            [str(name) for name in dataframe.iloc[labels.index(seller_row)]]
+            if seller_row in labels
+            else [seller] * len(dataframe.columns)
+        )
+
+        if (quantities < 0).any():
+            raise Incompatible_negative_value(
+                "The quantities of the items must be positive or zero."
+            )
+
+        rows, columns = np.nonzero(quantities)
+        indptr = np.searchsorted(rows, np.arange(len(prices) + 1)).tolist()
+        item_names = [sys.intern(name) for name in item_names]
+        names = [item_names[column] for column in columns.tolist()]
+        values = quantities[rows, columns].tolist()
+
+        return cls.from_records(
+            (
+                sellers[index],
+                Batch(
+                    str(batch_name),
+                    prices[index],
+                    [
+                        _checked_item(names[entry], values[entry])
+                        for entry in range(indptr[index], indptr[index + 1])
+                    ],
+                ),
+            )
+            for index, batch_name in enumerate(dataframe.columns)
+        )
+
+    @classmethod
+    def from_csv(cls, path: str, delimiter: str = ",", **kwargs) -> "BatchLists":
+        """Creates a BatchLists object from a CSV file with one column per batch, see from_dataframe.
+        The first row contains the names of the batches and the first column the names of the items.
+        The rows are read with the csv module, which is much faster than pandas on files with many columns.
+
+        Args :
+        - path : str : path to the CSV file
+        - delimiter : str : separator of the cells
+        - **kwargs : arguments of from_dataframe (price_row, seller_row, seller)
+
+        Returns :
+        - BatchLists : BatchLists object
+
+        Example :
+
+        >>> batch_lists = BatchLists.from_csv("exemple_Offre.csv")
+        """
+
+        try:
+            with open_file(path, "r", newline="") as file:
+                cells = np.array(
+                    list(csv.reader(file, delimiter=delimiter)), dtype=object
+                )
+            return cls.from_dataframe(_sheet_frame(cells), **kwargs)
+        except Exception as error:
+            raise error
+
+    @classmethod
+    def from_excel(cls, path: str, sheet_name: str | int = 0, **kwargs) -> "BatchLists":
+        """Creates a BatchLists object from a sheet of an Excel file with one column per batch, see from_dataframe.
+        The first row contains the names of the batches and the first column the names of the items.
+
+        Args :
+        - path : str : path to the Excel file
+        - sheet_name : str | int : name or position of the sheet
+        - **kwargs : arguments of from_dataframe (price_row, seller_row, seller)
+
+        Returns :
+        - BatchLists : BatchLists object
+
+        Example :
+
+        >>> batch_lists = BatchLists.from_excel("exemple/exemple_Offre.xlsx")
+        >>> [batches.seller for batches in batch_lists]
+        ['Detalin', 'Malandrin']
+        """
+
+        try:
+            return cls.from_dataframe(
+                _sheet_frame(
+                    pd.read_excel(path, sheet_name=sheet_name, header=None).to_numpy(
+                        dtype=object
+                    )
+                ),
+                **kwargs,
+            )
+        except Exception as error:
+            raise error
+
+    @classmethod
+    def from_lines(
+        cls,
+        lines: Iterable[str] | str,
+        workers: int | None = 1,
+        chunk_size: int = 100_000,
+    ) -> "BatchLists":
+        """Creates a BatchLists object from lines of the 'seller_batch:price; quantityxitem, ...' grammar of from_str.
+        Each line is parsed in a single pass and the BatchLists is built in bulk with from_records.
+
+        Args :
+        - lines : Iterable[str] | str : lines of the batches, or path to a file of lines (compressed or not)
+        - workers : int | None : number of processes parsing the chunks of lines, None for the number of processors
+        - chunk_size : int : number of lines parsed at once
+
+        Returns :
+        - BatchLists : BatchLists object, the sellers and the batches are in the order of the lines
+
+        Raises :
+        - Invalid_batch_line : if a line cannot be parsed or if a seller sells a batch defined on a previous line, with the number of the line
+
+        Example :
+
+        >>> BatchLists.from_lines("legacy_export.txt.gz", workers=4)
+
+        >>> BatchLists.from_lines(["seller1_batch 1:1; 2xapple", "seller1_batch 1:2; 3xorange"])
+        Traceback (most recent call last):
+        BatchMonitor.lib_batches.Invalid_batch_line: Line 2 : the batch 'batch 1' of 'seller1' is already defined at line 1
+        """
+
+        with ExitStack() as stack:
+            if isinstance(lines, str):
+                lines = stack.enter_context(open_file(lines, "r"))
+            return cls.from_records(
+                _parsed_records(_tokenized_chunks(lines, None, workers, chunk_size)),
+                validate="none",
+            )
 
     def add_BatchCollection(
         self, batch_collection: BatchCollection | list[BatchCollection]
@@ -1992,25 +3399,26 @@ class BatchLists:
         )
 
         for bc in batch_collection:
-            if bc.seller in [batches.seller for batches in self]:
+            position = self._seller_position(bc.seller)
+            if position is None:
+                self._sellers[bc.seller] = len(self.batchlists)
+                self.batchlists.append(bc)
+                self._version = self.batchlists.version
+                self._extend_vocabulary(bc, bc._universe)
+            else:
+                batch_collection_to_update = self.batchlists[position]
                 for batch in bc:
-                    existing_batch_names = [
-                        batch.name
-                        for batches in self
-                        for batch in batches
-                        if batches.seller == bc.seller
-                    ]
-                    if batch.name in existing_batch_names:
+                    if batch.name in batch_collection_to_update:
                         raise ValueError(
                             f"The combination of the seller {bc.seller} and the batch name {batch.name} is not unique."
                         )
-                    else:
-                        batch_collection_to_update = self[self.find(seller=bc.seller)]
-                        if isinstance(batch_collection_to_update, BatchCollection):
-                            batch_collection_to_update.add_batch(batch)
-            else:
-                self.batchlists.append(bc)
-        self.__post_init__()
+                new_item_names = [
+                    item_name
+                    for item_name in bc._universe
+                    if item_name not in batch_collection_to_update._universe
+                ]
+                batch_collection_to_update.add_batch(*bc)
+                self._extend_vocabulary(bc, new_item_names)
 
         return self
 
@@ -2051,16 +3459,28 @@ class BatchLists:
             index = [index] if isinstance(index, int) else sorted(index, reverse=True)
             for i in index:
                 if isinstance(i, int):
-                    self.batchlists.pop(i)
+                    self._remove_seller(i)
+            self._reindex()
             return self
         elif seller_name:
-            for batch_collection in self:
-                if batch_collection.seller == seller_name:
-                    self.batchlists.remove(batch_collection)
+            position = self._seller_position(seller_name)
+            if position is not None:
+                self._remove_seller(position)
+                self._reindex()
             return self
         else:
             return self
 
+    def _remove_seller(self, position: int) -> None:
+        """Removes the BatchCollection at the position and its items from the vocabulary,
+        its batches get back the universe of the BatchCollection."""
+
+        batches = self.batchlists.pop(position)
+        for item_name in batches._universe:
+            self._remove_item_seller(item_name)
+        for batch in batches:
+            batch._universe = batches._universe
+
     def find(self, seller: str) -> int | None:
         """Returns the batch collection corresponding to the seller.
 
@@ -2080,10 +3500,32 @@ class BatchLists:
         None
         """
 
-        for index, batch_collection in enumerate(self):
-            if batch_collection.seller == seller:
-                return index
-        return None
+        return self._seller_position(seller)
+
+    def find_batch(self, seller: str, batch_name: str) -> Batch | None:
+        """Returns the batch sold by the seller under the batch name.
+
+        Args :
+        - seller : str : name of the seller
+        - batch_name : str : name of the batch
+
+        Returns :
+        - Batch | None : batch, None if the seller does not sell a batch with this name
+
+        Example :
+
+        >>> batch_lists = BatchLists([BatchCollection([Batch("batch 1", 1, [Item_in_batch("apple", 1), Item_in_batch("orange", 2)])], "seller1"), BatchCollection([Batch("batch 1", 2, [Item_in_batch("apple", 3), Item_in_batch("orange", 4)])], "seller2")])
+
+        >>> batch_lists.find_batch("seller2", "batch 1")
+        Batch(name='batch 1', price=2, items=[Item_in_batch(name='apple', quantity_in_batch=3), Item_in_batch(name='orange', quantity_in_batch=4)])
+        """
+
+        position = self._seller_position(seller)
+        if position is None:
+            return None
+        batches = self.batchlists[position]
+        batch_position = batches._position(batch_name)
+        return None if batch_position is None else batches.batch_list[batch_position]
 
     def sort(self, by: str = "seller", reverse: bool = False) -> "BatchLists":
         """Sorts the batch collections in the BatchLists by seller.
@@ -2117,39 +3559,65 @@ class BatchLists:
             self.batchlists.sort(
                 key=lambda x: x.seller if x.seller else "", reverse=reverse
             )
+            self._reindex()
             return self
         elif by == "number_of_batches":
             self.batchlists.sort(key=lambda x: len(x) if x else 0, reverse=reverse)
+            self._reindex()
             return self
         else:
             raise ValueError(
                 "The 'by' parameter must be 'seller' or 'number_of_batches'."
             )
 
-    def to_json(self, path: str = "batchlists.json") -> None:
+    def to_json(
+        self,
+        path: str = "batchlists.json",
+        compact: bool = False,
+        sparse: bool = True,
+        checksum: bool = True,
+    ) -> None:
         """Saves the BatchLists object in a JSON file.
 
         Args :
-        - path : str : path to the JSON file
+        - path : str : path to the JSON file, compressed according to its suffix (.gz, .bz2, .xz or .lzma)
+        - compact : bool : writes the json without indentation nor spaces, which is smaller and faster to write
+        - sparse : bool : writes the names of the items once per seller in an item_names vocabulary,
+        the batches only keep the positions of their items in it and their quantities
+        - checksum : bool : writes the checksum of the content of each seller, which allows from_json to load the file without checking it
 
         Example :
 
         >>> batch_lists = BatchLists([BatchCollection([Batch("batch 1", 1, [Item_in_batch("apple", 1), Item_in_batch("orange", 2)])], "seller1"), BatchCollection([Batch("batch 2", 2, [Item_in_batch("apple", 3), Item_in_batch("orange", 4)])], "seller2")])
 
         >>> batch_lists.to_json("batchlists.json")
+        >>> batch_lists.to_json("batchlists.json", compact=True)
+        >>> batch_lists.to_json("batchlists.json", sparse=False)
         """
         try:
-            with open(path, "w") as file:
-                json.dump(self.batchlists, file, default=lambda o: o.__dict__, indent=4)
+            with open_file(path, "w") as file:
+                file.write("[")
+                for position, batches in enumerate(self.batchlists):
+                    file.write(("," if position else "") + ("\n    " * (not compact)))
+                    file.writelines(
+                        batches._json_text(
+                            sparse, checksum, indent=not compact, depth=1
+                        )
+                    )
+                file.write(("\n" * (not compact and bool(self.batchlists))) + "]")
         except Exception as error:
             raise error
 
     @classmethod
-    def from_json(cls, path: str = "batchlists.json") -> "BatchLists":
+    def from_json(
+        cls, path: str = "batchlists.json", trusted: bool = False
+    ) -> "BatchLists":
         """Loads the BatchLists object from a JSON file.
 
         Args :
         - path : str : path to the JSON file
+        - trusted : bool : skips the checks of the batches of each seller whose checksum written by to_json matches the content,
+        the other sellers are checked as usual with a warning
 
         Returns :
         - BatchLists : BatchLists object
@@ -2157,30 +3625,311 @@ class BatchLists:
         Example :
 
         >>> batch_lists = BatchLists.from_json("batchlists.json")
+        >>> batch_lists = BatchLists.from_json("batchlists.json", trusted=True)
         """
 
         try:
-            with open(path, "r") as file:
-                json_bl = json.load(file)
-
-            bl = BatchLists()
-            for batches in json_bl:
-                bc = BatchCollection(seller=batches["seller"])
-                for batch in batches["batch_list"]:
-                    batch_to_add = Batch(
-                        name=batch["name"], price=batch["price"], items=[]
-                    )
-                    items = []
-                    for batch_item in batch["items"]:
-                        items.append(
-                            Item_in_batch(
-                                batch_item["name"], batch_item["quantity_in_batch"]
-                            )
+            return cls(list(cls.iter_json(path, trusted=trusted)))
+        except Exception as error:
+            raise error
+
+    @staticmethod
+    def iter_json(
+        path: str = "batchlists.json", chunk_size: int = 1 << 20, trusted: bool = False
+    ) -> Iterator[BatchCollection]:
+        """Iterates over the BatchCollection objects of a BatchLists JSON file, one seller at a time.
+        The file is streamed, so the memory used is proportional to one seller and not to the whole file.
+
+        Args :
+        - path : str : path to the JSON file
+        - chunk_size : int : number of characters read from the file at once
+        - trusted : bool : skips the checks of the batches of each seller whose checksum matches, see from_json
+
+        Returns :
+        - Iterator[BatchCollection] : BatchCollection objects of the file, in order
+
+        Raises :
+        - ValueError : if the file does not contain an array of BatchCollection objects
+
+        Example :
+
+        >>> for batch_collection in BatchLists.iter_json("batchlists.json"):
+        ...     print(batch_collection.seller, len(batch_collection))
+        seller1 1
+        seller2 1
+        """
+
+        if not trusted:
+            for batches in _iter_json_array(path, chunk_size):
+                yield BatchCollection._from_dict(batches)
+            return
+        for batches, content_checksum in _iter_json_array(
+            path, chunk_size, _decode_with_checksum
+        ):
+            yield BatchCollection._from_dict(batches, content_checksum)
+
+    @staticmethod
+    def append_ndjson(path: str, seller: str, *batch: Batch) -> None:
+        """Appends batches of a seller at the end of a NDJSON file, one line per batch.
+        The rest of the file is neither read nor rewritten.
+
+        Args :
+        - path : str : path to the NDJSON file, created if it does not exist
+        - seller : str : name of the seller
+        - *batch : Batch : batches sold by the seller
+
+        Example :
+
+        >>> BatchLists.append_ndjson("batchlists.ndjson", "seller1", Batch.from_str("batch 3:3; 2xkiwi"))
+        """
+
+        try:
+            with open_file(path, "a") as file:
+                file.writelines(_ndjson_lines(seller, batch))
+        except Exception as error:
+            raise error
+
+    def to_ndjson(self, path: str = "batchlists.ndjson") -> None:
+        """Saves the BatchLists object in a NDJSON file : each line is the record {seller, name, price, items} of a batch.
+        New batches can then be added with append_ndjson without rewriting the file.
+
+        Args :
+        - path : str : path to the NDJSON file
+
+        Example :
+
+        >>> batch_lists.to_ndjson("batchlists.ndjson")
+        """
+
+        try:
+            with open_file(path, "w") as file:
+                for batches in self.batchlists:
+                    file.writelines(_ndjson_lines(batches.seller, batches))
+        except Exception as error:
+            raise error
+
+    @classmethod
+    def from_ndjson(
+        cls,
+        path: str = "batchlists.ndjson",
+        workers: int | None = None,
+        chunk_size: int = 1 << 24,
+    ) -> "BatchLists":
+        """Loads the BatchLists object from a NDJSON file.
+        The file is split in byte ranges of chunk_size bytes which are parsed in a pool of processes,
+        then the records are grouped by seller with from_records.
+        A compressed file cannot be split without being decompressed, so it is parsed in a single pass.
+
+        Args :
+        - path : str : path to the NDJSON file
+        - workers : int | None : number of processes, by default the number of processors
+        - chunk_size : int : number of bytes parsed by each task
+
+        Returns :
+        - BatchLists : BatchLists object, the sellers and the batches are in the order of the file
+
+        Raises :
+        - ValueError : if a line is not a valid record or if a batch of a seller appears several times
+
+        Example :
+
+        >>> batch_lists = BatchLists.from_ndjson("batchlists.ndjson", workers=4)
+        """
+
+        try:
+            size = os.path.getsize(path)
+            ranges = (
+                [(0, sys.maxsize)]
+                if compression(path)
+                else [
+                    (start, min(start + chunk_size, size))
+                    for start in range(0, size, chunk_size)
+                ]
+            )
+            if len(ranges) > 1 and workers != 1:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    chunks = list(
+                        executor.map(
+                            _read_ndjson_range,
+                            [path] * len(ranges),
+                            *zip(*ranges),
                         )
-                    batch_to_add.items = items
-                    bc.add_batch(batch_to_add)
-                if isinstance(bc, BatchCollection):
-                    bl.add_BatchCollection(bc)
-            return bl
+                    )
+            else:
+                chunks = [_read_ndjson_range(path, start, end) for start, end in ranges]
+
+            return cls.from_records(record for chunk in chunks for record in chunk)
+        except Exception as error:
+            raise error
+
+    def _apply_operation(self, operation: dict) -> None:
+        """Applies one operation of a patch to the BatchLists, in place.
+        The vocabulary is updated with the items the operation adds or removes.
+        """
+
+        kind = operation["op"]
+        seller = operation["seller"]
+        batch_name = operation["batch"]
+        position = self._seller_position(seller)
+
+        if kind == "add":
+            batch = _batch_from_dict(
+                {
+                    "name": batch_name,
+                    "price": operation["price"],
+                    "items": operation.get("items", []),
+                }
+            )
+            if position is None:
+                position = self._sellers[seller] = len(self.batchlists)
+                self.batchlists.append(BatchCollection(seller=seller))
+                self._version = self.batchlists.version
+            batches = self.batchlists[position]
+            if batches._position(batch.name) is not None:
+                raise ValueError(
+                    f"The combination of the seller {seller} and the batch name {batch.name} is not unique."
+                )
+            batches._index[batch.name] = len(batches.batch_list)
+            batches.batch_list.append(batch)
+            batches._version = batches.batch_list.version
+            batches._register_items(batch)
+            self._extend_vocabulary(
+                [batch],
+                [
+                    item.name
+                    for item in batch.items
+                    if batches._universe[item.name] == 1
+                ],
+            )
+            return
+
+        batches = self.batchlists[position] if position is not None else None
+        batch_position = batches._position(batch_name) if batches else None
+        if batches is None or batch_position is None:
+            raise KeyError(
+                f"The batch '{batch_name}' of the seller '{seller}' is not in the BatchLists."
+            )
+        batch = batches.batch_list[batch_position]
+
+        if kind == "price":
+            _check_number(operation["price"], "price")
+            if operation["price"] < 0:
+                raise Incompatible_negative_value(
+                    f"The price of the batch '{operation['price']}' is negative, however, it must be positive or zero."
+                )
+            batch.price = operation["price"]
+
+        elif kind == "remove":
+            batches._swap_remove(batch_position)
+            for item in batch.items:
+                if batches._unregister_item(item.name):
+                    self._remove_item_seller(item.name)
+            batch._universe = batches._universe
+            if not batches.batch_list:
+                self._swap_remove_seller(position)
+
+        elif kind == "quantity":
+            item_name = operation["item"]
+            quantity = operation["quantity"]
+            _check_number(quantity, "quantity")
+            item_position = batch._position(item_name)
+            if quantity < 0:
+                raise Incompatible_negative_value(
+                    f"The quantity of '{item_name}' is '{quantity}', but it must be positive or zero."
+                )
+            elif item_position is not None and quantity:
+                batch.items[item_position].quantity_in_batch = quantity
+            elif item_position is not None:
+                batch._swap_remove(item_position)
+                if batches._unregister_item(item_name):
+                    self._remove_item_seller(item_name)
+            elif quantity:
+                item = Item_in_batch(item_name, quantity)
+                batch._index[item.name] = len(batch.items)
+                batch.items.append(item)
+                batch._version = batch.items.version
+                batches._universe[item.name] = batches._universe.get(item.name, 0) + 1
+                if batches._universe[item.name] == 1:
+                    self._extend_vocabulary([], [item.name])
+
+        else:
+            raise ValueError(
+                "The 'op' of an operation must be 'price', 'add', 'remove' or 'quantity'."
+            )
+
+    def apply_patch(self, patch: Iterable[dict] | str) -> "BatchLists":
+        """Applies a patch to the BatchLists in place : price changes, added or removed batches
+        and quantity changes of the items, keyed by the seller and the name of the batch.
+        Each operation only touches its batch, so applying a patch costs the size of the patch and not of the catalog.
+
+        The operations are dictionaries :
+        - {"op": "price", "seller", "batch", "price"} : changes the price of the batch
+        - {"op": "add", "seller", "batch", "price", "items": [{"name", "quantity_in_batch"}, ...]} : adds a batch,
+        and the seller if he is not in the BatchLists
+        - {"op": "remove", "seller", "batch"} : removes the batch, and the seller if it was his last batch
+        - {"op": "quantity", "seller", "batch", "item", "quantity"} : changes the quantity of an item of the batch,
+        the item is added to the batch if it is new and removed from it if the quantity is 0
+
+        A removed batch, seller or item is replaced by the last one of its list, so removing costs O(1)
+        but the order of the remaining batches, sellers or items can change.
+
+        Args :
+        - patch : Iterable[dict] | str : operations, or path to a patch log written by append_patch
+
+        Returns :
+        - BatchLists : BatchLists object with the patch applied
+
+        Raises :
+        - KeyError : if the batch of an operation is not in the BatchLists
+        - ValueError : if an added batch already exists or if an operation is not valid
+        - TypeError : if a price or a quantity is not a number
+        - Incompatible_negative_value : if a price or a quantity is negative
+
+        The operations before the one raising an error stay applied.
+
+        Example :
+
+        >>> batch_lists = BatchLists.from_str(["seller1_batch 1:1; 2xapple", "seller2_batch 1:2; 3xorange"])
+        >>> batch_lists.apply_patch(
+                [
+                    {"op": "price", "seller": "seller1", "batch": "batch 1", "price": 1.5},
+                    {"op": "quantity", "seller": "seller2", "batch": "batch 1", "item": "apple", "quantity": 1},
+                    {"op": "remove", "seller": "seller2", "batch": "batch 1"},
+                ]
+            )
+        BatchLists(batchlists=[BatchCollection(batch_list=[Batch(name='batch 1', price=1.5, items=[Item_in_batch(name='apple', quantity_in_batch=2.0)])], seller='seller1')])
+        >>> batch_lists.apply_patch("batchlists.patch.ndjson")
+        """
+
+        try:
+            operations = _read_patch(patch) if isinstance(patch, str) else patch
+            for operation in operations:
+                self._apply_operation(operation)
+            return self
+        except Exception as error:
+            raise error
+
+    @staticmethod
+    def append_patch(path: str, *operation: dict) -> None:
+        """Appends operations at the end of a patch log, one JSON object per line.
+        The log can be replayed on a catalog with apply_patch, the rest of the file is neither read nor rewritten.
+
+        Args :
+        - path : str : path to the patch log, created if it does not exist
+        - *operation : dict : operations of the patch, see apply_patch
+
+        Example :
+
+        >>> BatchLists.append_patch(
+                "batchlists.patch.ndjson",
+                {"op": "price", "seller": "seller1", "batch": "batch 1", "price": 1.5},
+            )
+        """
+
+        try:
+            with open_file(path, "a") as file:
+                file.writelines(
+                    json.dumps(op, separators=(",", ":")) + "\n" for op in operation
+                )
         except Exception as error:
             raise error
@@ -26,7 +26,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 
 warnings.filterwarnings(
     "ignore",
-    "Some batches contain weapons not present in other batches. They have been added with a quantity of 0.",
+    "Some batches contain weapons not present in other batches. They have an implicit quantity of 0 in the other batches.",
 )
 warnings.filterwarnings(
     "ignore", "Spaces are not permitted in the name. Converted to '_'"
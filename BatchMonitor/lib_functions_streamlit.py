@@ -3,22 +3,21 @@
 This file contains the functions used in the streamlit app to create the database and the batch list from the data.
 """
 
+import numpy as np
 import pandas as pd
 from BatchMonitor import BatchCollection, BatchLists, Item_in_batch, Batch
+from BatchMonitor.lib_matrix import BatchMatrix
 
 
 def createDatabaseFromBatchLists(data: BatchLists) -> pd.DataFrame:
     """Function allowing to create a database from the data. From the Batchlists class"""
 
-    data_dict = {}
-    for batches in data.batchlists:
-        for batch in batches.batch_list:
-            data_dict[batches.seller + "_" + batch.name] = {
-                **{item.name: item.quantity_in_batch for item in batch.items},
-                "Total": batch.price,
-            }
-
-    df = pd.DataFrame(data_dict)
+    matrix = BatchMatrix.from_batch_lists(data)
+    df = pd.DataFrame(
+        np.vstack([matrix.quantities.T, matrix.prices]),
+        index=[*matrix.item_names, "Total"],
+        columns=matrix.keys(),
+    )
 
     return df
 
@@ -27,7 +26,8 @@ def create_df_from_json(json_df: pd.DataFrame) -> pd.DataFrame:
     """Function allowing to create a database from the data. From the Batchlists class"""
 
     all_batch_with_seller = dict()
-    quantities_of_items: dict[str, list[int | float]] = dict()
+    items_of_each_batch: list[dict[str, int | float]] = []
+    sparse = "item_names" in json_df.columns
 
     for row in json_df.itertuples():
         batch_list = getattr(row, "batch_list")
@@ -36,12 +36,20 @@ def create_df_from_json(json_df: pd.DataFrame) -> pd.DataFrame:
             batch["name"]: batch["price"] for batch in batch_list
         }
         for batch in batch_list:
-            for item in batch["items"]:
-                item_name = item["name"]
-                if item_name in quantities_of_items:
-                    quantities_of_items[item_name].append(item["quantity_in_batch"])
-                else:
-                    quantities_of_items[item_name] = [item["quantity_in_batch"]]
+            if sparse:
+                item_names = getattr(row, "item_names")
+                items_of_each_batch.append(
+                    {
+                        item_names[index]: quantity
+                        for index, quantity in zip(
+                            batch["item_indices"], batch["quantities"]
+                        )
+                    }
+                )
+            else:
+                items_of_each_batch.append(
+                    {item["name"]: item["quantity_in_batch"] for item in batch["items"]}
+                )
 
     seller_associate_to_each_batch = [
         batch_seller
@@ -71,19 +79,18 @@ def create_df_from_json(json_df: pd.DataFrame) -> pd.DataFrame:
 
     already_seen = set()
     all_item_name = []
-    for batches in json_df["batch_list"]:
-        for batch in batches:
-            for item in batch["items"]:
-                if item["name"] not in already_seen:
-                    all_item_name.append(item["name"])
-                    already_seen.add(item["name"])
+    for items in items_of_each_batch:
+        for item_name in items:
+            if item_name not in already_seen:
+                all_item_name.append(item_name)
+                already_seen.add(item_name)
     all_item_name.append("TOTAL")
     all_item_name.append("Seller")
 
     df = pd.DataFrame(data=json_df, columns=all_batch, index=all_item_name)
 
-    for row_item in quantities_of_items.keys():
-        df.loc[row_item] = quantities_of_items[row_item]
+    for row_item in all_item_name[:-2]:
+        df.loc[row_item] = [items.get(row_item, 0.0) for items in items_of_each_batch]
     df.loc["TOTAL"] = all_price
     df = df.astype(object)
     df.loc["Seller"] = seller_associate_to_each_batch
@@ -0,0 +1,67 @@
+"""Description:
+
+Library opening the files read and written by the package, compressed or not.
+
+- The compression is chosen from the suffix of the path : .gz (gzip), .bz2 (bz2), .xz or .lzma (lzma).
+- The compressed files are read and written incrementally, like the plain files.
+
+You can import this library with the following command:
+    import BatchMonitor.lib_io as lio
+
+Developed by :
+    - [Hugo Cochereau](https://github.com/hugocoche)
+    - [Gregory Jaillet](https://github.com/Greg-jllt)
+"""
+
+import bz2
+import gzip
+import lzma
+import os
+from beartype.typing import IO
+
+COMPRESSIONS = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+    ".lzma": lzma.open,
+}
+
+
+def compression(path: str) -> str | None:
+    """Returns the suffix of the compression of the file, or None if the file is not compressed.
+
+    Example :
+
+    >>> compression("batchlists.json.gz")
+    '.gz'
+    >>> compression("batchlists.json")
+    """
+
+    suffix = os.path.splitext(path)[1].lower()
+    return suffix if suffix in COMPRESSIONS else None
+
+
+def open_file(path: str, mode: str = "r", **kwargs) -> IO:
+    """Opens a file, compressed or not according to its suffix.
+    In text mode ("r", "w", "a"), the compressed files are decoded and encoded on the fly.
+
+    Args :
+    - path : str : path to the file
+    - mode : str : mode of open, "r", "w", "a" or the same modes followed by "b"
+    - **kwargs : arguments of open in text mode, for example newline
+
+    Returns :
+    - IO : file object
+
+    Example :
+
+    >>> with open_file("batchlists.json.gz", "w") as file:
+    ...     file.write("[]")
+    """
+
+    suffix = compression(path)
+    if suffix is None:
+        return open(path, mode, **kwargs)
+    if "b" not in mode:
+        mode += "t"
+    return COMPRESSIONS[suffix](path, mode, **kwargs)
@@ -17,11 +17,16 @@ Developed by :
 
 import json
 import math
-from dataclasses import dataclass, field
+import sys
+from dataclasses import asdict, dataclass, field
+import numpy as np
+import pandas as pd
 from beartype.typing import Iterator
 from prettytable import PrettyTable
 from serde import serde
 
+from .lib_io import open_file
+
 
 class Incompatible_negative_value(ValueError):
     """Error returned if the price of a batch or a quantity is negative."""
@@ -30,7 +35,7 @@ class Incompatible_negative_value(ValueError):
 
 
 @serde
-@dataclass
+@dataclass(slots=True)
 class ItemRequest:
     """Represents an item requested by the requester.
 
@@ -95,8 +100,9 @@ class ItemRequest:
     maximum_quantity: float | int | None = None
 
     def __post_init__(self):
-        """Checks if the item is valid."""
+        """Checks if the item is valid and interns its name."""
 
+        self.name = sys.intern(self.name)
         if self.minimum_quantity < 0:
             raise Incompatible_negative_value(
                 f"The quantity of the item '{self.minimum_quantity}' is negative, however, it must be positive or zero."
@@ -706,6 +712,54 @@ class ItemListRequest:
 
         return cls([ItemRequest.from_str(s) for s in string])
 
+    @classmethod
+    def from_dataframe(
+        cls,
+        dataframe: pd.DataFrame,
+        minimum_column: str = "Min_Quantity",
+        maximum_column: str = "Max_Quantity",
+    ) -> "ItemListRequest":
+        """Creates a list of items requested from a DataFrame indexed by the names of the items.
+        The quantities are read column-wise.
+
+        Args:
+        - dataframe: pd.DataFrame -> minimum and optional maximum quantity of each item requested
+        - minimum_column: str -> column of the minimum quantities, an empty cell is a minimum of 0
+        - maximum_column: str -> column of the maximum quantities, an empty cell or inf is no maximum
+
+        Returns:
+        - ItemListRequest: ItemListRequest -> list of items requested by the requester
+
+        Raises:
+        - KeyError: if the DataFrame has no minimum column
+        - ValueError: if a quantity is not a number or if an item is requested several times
+
+        Examples:
+
+        >>> ItemListRequest.from_dataframe(
+            pd.DataFrame({"Min_Quantity": [1, 2], "Max_Quantity": [3, None]}, index=["apple", "banana"])
+        )
+        ItemListRequest(items=[ItemRequest(name='apple', minimum_quantity=1.0, maximum_quantity = 3.0), ItemRequest(name='banana', minimum_quantity=2.0, maximum_quantity = None)])
+        """
+
+        minimums = (
+            dataframe[minimum_column].to_numpy(dtype=np.float64, na_value=0.0).tolist()
+        )
+        maximums = (
+            dataframe[maximum_column]
+            .to_numpy(dtype=np.float64, na_value=np.inf)
+            .tolist()
+            if maximum_column in dataframe.columns
+            else [None] * len(dataframe)
+        )
+
+        return cls(
+            [
+                ItemRequest(str(name).strip(), minimum, maximum)
+                for name, minimum, maximum in zip(dataframe.index, minimums, maximums)
+            ]
+        )
+
     def add_item(self, *items: ItemRequest) -> "ItemListRequest":
         """Adds an item or a list of item to the list of items requested.
 
@@ -915,8 +969,8 @@ class ItemListRequest:
         >>> item_list_request.to_json("items.json")
         """
         try:
-            with open(path, "w") as file:
-                json.dump(self, file, default=lambda o: o.__dict__, indent=4)
+            with open_file(path, "w") as file:
+                json.dump(self, file, default=asdict, indent=4)
         except Exception as error:
             raise error
 
@@ -932,7 +986,7 @@ class ItemListRequest:
         >>> ItemListRequest.from_json("items.json")
         """
         try:
-            with open(path, "r") as file:
+            with open_file(path, "r") as file:
                 json_ilr = json.load(file)
 
             ilr = ItemListRequest()
@@ -0,0 +1,848 @@
+"""Description:
+
+Library containing the columnar representations of the batches : BatchMatrix, SparseBatchMatrix
+
+- BatchMatrix : class storing the quantities of the items of each batch in a 2-D NumPy array,
+the prices of the batches in a vector and the names of the batches, items and sellers in interned tables.
+- SparseBatchMatrix : class storing the same data in CSR arrays (indptr, indices, data),
+for the catalogs where each batch only holds a few items of a large universe.
+
+The Batch and Item_in_batch objects are only created when a batch of the matrix is accessed.
+The optimization functions and the DataFrame exports can read the arrays directly.
+
+You can import this library with the following command:
+    import BatchMonitor.lib_matrix as lm
+
+Developed by :
+    - [Hugo Cochereau](https://github.com/hugocoche)
+    - [Gregory Jaillet](https://github.com/Greg-jllt)
+"""
+
+import json
+import os
+import sys
+from dataclasses import InitVar, dataclass, field
+import numpy as np
+from beartype.typing import Iterable, Iterator
+
+from .lib_batches import Item_in_batch, Batch, BatchCollection, BatchLists
+from .lib_io import open_file
+
+
+def _read_records(records: Iterable[tuple[str, Batch]]) -> dict:
+    """Reads (seller, batch) records in a single pass and returns the name tables,
+    the prices and the non-zero quantities in CSR arrays (indptr, indices, data).
+    The items are numbered by first appearance."""
+
+    batch_names: list[str] = []
+    prices: list[float] = []
+    seller_index: dict[str, int] = {}
+    batch_sellers: list[int] = []
+    item_index: dict[str, int] = {}
+    indptr: list[int] = [0]
+    indices: list[int] = []
+    data: list[float] = []
+
+    for seller, batch in records:
+        batch_names.append(batch.name)
+        prices.append(batch.price)
+        batch_sellers.append(seller_index.setdefault(seller, len(seller_index)))
+        for item in batch.items:
+            if item.quantity_in_batch != 0:
+                indices.append(item_index.setdefault(item.name, len(item_index)))
+                data.append(item.quantity_in_batch)
+        indptr.append(len(indices))
+
+    return {
+        "batch_names": batch_names,
+        "prices": np.asarray(prices, dtype=np.float64),
+        "seller_names": list(seller_index) or ["Default seller"],
+        "batch_sellers": np.asarray(batch_sellers, dtype=np.intp),
+        "item_names": list(item_index),
+        "indptr": np.asarray(indptr, dtype=np.intp),
+        "indices": np.asarray(indices, dtype=np.intp),
+        "data": np.asarray(data, dtype=np.float64),
+    }
+
+
+def _read_only(array: Iterable, dtype: type) -> np.ndarray:
+    """Returns a read-only view of the array converted to the dtype, the array given stays writable."""
+
+    view = np.asarray(array, dtype=dtype).view()
+    view.flags.writeable = False
+    return view
+
+
+_ARRAY_DTYPES = {
+    "indptr": np.intp,
+    "indices": np.intp,
+    "data": np.float64,
+    "prices": np.float64,
+    "batch_sellers": np.intp,
+}
+
+
+def _row_of_entries(indptr: np.ndarray) -> np.ndarray:
+    """Returns the row of each stored entry of CSR arrays."""
+
+    return np.repeat(np.arange(len(indptr) - 1, dtype=np.intp), np.diff(indptr))
+
+
+class _BatchTable:
+    """Methods shared by the matrix representations, based on the name tables of the batches."""
+
+    batch_names: list[str]
+    seller_names: list[str]
+    batch_sellers: np.ndarray | None
+    catalog: str | None
+
+    def __len__(self) -> int:
+        """Returns the number of batches in the matrix."""
+
+        return len(self.batch_names)
+
+    def __iter__(self) -> Iterator[Batch]:
+        """Returns an iterator over the batches of the matrix, built one at a time."""
+
+        for index in range(len(self)):
+            yield self[index]
+
+    def seller(self, index: int) -> str:
+        """Returns the name of the seller of the batch at the specified row."""
+
+        return self.seller_names[self.batch_sellers[index]]  # type: ignore[index]
+
+    def sellers(self) -> list[str]:
+        """Returns the name of the seller of each batch, in the order of the rows."""
+
+        return [self.seller_names[i] for i in self.batch_sellers]  # type: ignore[union-attr]
+
+    def keys(self, separator: str = "_") -> list[str]:
+        """Returns the names of the batches prefixed by the name of their seller.
+
+        Example :
+
+        >>> BatchMatrix.from_records([("seller1", Batch.from_str("batch 1:1; 2xapple"))]).keys()
+        ['seller1_batch 1']
+        """
+
+        return [
+            f"{seller}{separator}{name}"
+            for seller, name in zip(self.sellers(), self.batch_names)
+        ]
+
+    def to_batch_collection(self) -> BatchCollection:
+        """Returns the batches of the matrix in a BatchCollection.
+
+        Raises :
+        - ValueError : if the matrix contains the batches of several sellers
+        """
+
+        if len(set(self.sellers())) > 1:
+            raise ValueError(
+                "The matrix contains several sellers, use to_batch_lists instead."
+            )
+        seller = self.seller_names[0] if len(self) == 0 else self.seller(0)
+        return BatchCollection.from_batches(iter(self), seller=seller)
+
+    def to_batch_lists(self) -> BatchLists:
+        """Returns the batches of the matrix in a BatchLists, grouped by seller."""
+
+        return BatchLists.from_records(
+            (self.seller(index), batch) for index, batch in enumerate(self)
+        )
+
+    def to_catalog(self) -> BatchCollection | BatchLists:
+        """Returns the batches of the matrix in the kind of catalog it was created from.
+        If the kind is unknown, a BatchCollection is returned if the matrix has a single seller, else a BatchLists.
+        The result can be given to minBatchExpense and maxEarnings.
+        """
+
+        if self.catalog == "BatchCollection" or (
+            self.catalog is None and len(self.seller_names) == 1
+        ):
+            return self.to_batch_collection()
+        return self.to_batch_lists()
+
+
+@dataclass(eq=False)
+class BatchMatrix(_BatchTable):
+    """Class representing batches as a matrix of quantities and a vector of prices.
+
+    Args :
+    - quantities : np.ndarray : matrix of shape (number of batches, number of items),
+    quantities[i, j] is the quantity of the item j in the batch i
+    - prices : np.ndarray : vector of the prices of the batches
+    - batch_names : list[str] : names of the batches, in the order of the rows
+    - item_names : list[str] : names of the items, in the order of the columns
+    - seller_names : list[str] : names of the sellers
+    - batch_sellers : np.ndarray : position in seller_names of the seller of each batch
+    - catalog : str | None : kind of catalog the batches come from, "BatchCollection" or "BatchLists",
+    None if it is unknown
+
+    Returns :
+    - BatchMatrix : columnar representation of the batches
+
+    Raises :
+    - ValueError : if the dimensions of the arrays and of the name tables do not match
+
+    Example :
+
+    >>> matrix = BatchMatrix.from_batch_collection(
+            BatchCollection.from_str("batch 1:1; 2xapple, 3xorange", "batch 2:2; 4xbanana", seller="seller1")
+        )
+    >>> matrix.quantities
+    array([[2., 3., 0.],
+           [0., 0., 4.]])
+    >>> matrix.item_names
+    ['apple', 'orange', 'banana']
+
+    The batches are built on demand :
+
+    >>> matrix[1]
+    Batch(name='batch 2', price=2.0, items=[Item_in_batch(name='banana', quantity_in_batch=4.0)])
+
+    minBatchExpense, maxEarnings and the compiled problems read the quantity matrix without building the batches :
+
+    >>> minBatchExpense(matrix, ItemListRequest.from_str("4-inf of banana"))
+    {'Status': 'Optimal', 'Total cost': 2.0, 'Batch quantities': {'batch 1': 0.0, 'batch 2': 1.0}}
+    """
+
+    quantities: np.ndarray
+    prices: np.ndarray
+    batch_names: list[str]
+    item_names: list[str]
+    seller_names: list[str] = field(default_factory=lambda: ["Default seller"])
+    batch_sellers: np.ndarray | None = None
+    catalog: str | None = None
+    _item_index: dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        """Checks the dimensions of the matrix and interns the names."""
+
+        self.quantities = np.asarray(self.quantities, dtype=np.float64)
+        self.prices = np.asarray(self.prices, dtype=np.float64)
+        if self.batch_sellers is None:
+            self.batch_sellers = np.zeros(len(self.batch_names), dtype=np.intp)
+        self.batch_sellers = np.asarray(self.batch_sellers, dtype=np.intp)
+
+        if self.quantities.ndim != 2 or self.quantities.shape != (
+            len(self.batch_names),
+            len(self.item_names),
+        ):
+            raise ValueError(
+                "The quantity matrix must have one row per batch and one column per item."
+            )
+        if self.prices.shape != (
+            len(self.batch_names),
+        ) or self.batch_sellers.shape != (len(self.batch_names),):
+            raise ValueError("The prices and the sellers must be given for each batch.")
+        if self.catalog not in (None, "BatchCollection", "BatchLists"):
+            raise ValueError(
+                "The catalog must be 'BatchCollection', 'BatchLists' or None."
+            )
+
+        self.batch_names = [sys.intern(name) for name in self.batch_names]
+        self.item_names = [sys.intern(name) for name in self.item_names]
+        self.seller_names = [sys.intern(name) for name in self.seller_names]
+        self._item_index = {name: j for j, name in enumerate(self.item_names)}
+        if len(self._item_index) != len(self.item_names):
+            raise ValueError("Some items have the same name in the matrix !")
+
+    @classmethod
+    def from_records(cls, records: Iterable[tuple[str, Batch]]) -> "BatchMatrix":
+        """Creates a BatchMatrix from (seller, batch) records.
+
+        Args :
+        - records : Iterable[tuple[str, Batch]] : couples of the name of the seller and of a batch he sells
+
+        Returns :
+        - BatchMatrix : matrix of the batches, the items are ordered by first appearance
+
+        Example :
+
+        >>> BatchMatrix.from_records([("seller1", Batch.from_str("batch 1:1; 2xapple"))]).quantities
+        array([[2.]])
+        """
+
+        table = _read_records(records)
+        quantities = np.zeros(
+            (len(table["batch_names"]), len(table["item_names"])), dtype=np.float64
+        )
+        quantities[_row_of_entries(table["indptr"]), table["indices"]] = table["data"]
+
+        return cls(
+            quantities,
+            table["prices"],
+            table["batch_names"],
+            table["item_names"],
+            table["seller_names"],
+            table["batch_sellers"],
+        )
+
+    @classmethod
+    def from_batch_collection(cls, batch_collection: BatchCollection) -> "BatchMatrix":
+        """Creates a BatchMatrix from the batches of a BatchCollection.
+
+        Args :
+        - batch_collection : BatchCollection : batches sold by the seller
+
+        Returns :
+        - BatchMatrix : matrix of the batches
+        """
+
+        matrix = cls.from_records(
+            (batch_collection.seller, batch) for batch in batch_collection
+        )
+        matrix.seller_names = [sys.intern(batch_collection.seller)]
+        matrix.catalog = "BatchCollection"
+        return matrix
+
+    @classmethod
+    def from_batch_lists(cls, batch_lists: BatchLists) -> "BatchMatrix":
+        """Creates a BatchMatrix from the batches of all the sellers of a BatchLists.
+
+        Args :
+        - batch_lists : BatchLists : batches sold by each seller
+
+        Returns :
+        - BatchMatrix : matrix of the batches, the rows of a seller are contiguous
+        """
+
+        matrix = cls.from_records(
+            (batches.seller, batch) for batches in batch_lists for batch in batches
+        )
+        matrix.catalog = "BatchLists"
+        return matrix
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Returns the number of batches and the number of items of the matrix."""
+
+        return self.quantities.shape  # type: ignore[return-value]
+
+    def __getitem__(self, index: int) -> Batch:
+        """Returns the batch at the specified row, built from the matrix.
+        Only the items with a non-zero quantity are in the batch.
+
+        Args :
+        - index : int : row of the batch
+
+        Returns :
+        - Batch : batch of the row
+
+        Raises :
+        - IndexError : if the row does not exist
+        """
+
+        if not isinstance(index, (int, np.integer)):
+            raise IndexError("You must provide a valid index.")
+
+        row = self.quantities[index]
+        return Batch(
+            self.batch_names[index],
+            float(self.prices[index]),
+            [
+                Item_in_batch(self.item_names[j], float(row[j]))
+                for j in np.flatnonzero(row)
+            ],
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Returns True if the two BatchMatrix objects have the same names and the same values."""
+
+        if not isinstance(other, BatchMatrix):
+            return NotImplemented
+
+        return (
+            self.batch_names == other.batch_names
+            and self.item_names == other.item_names
+            and self.sellers() == other.sellers()
+            and np.array_equal(self.prices, other.prices)
+            and np.array_equal(self.quantities, other.quantities)
+        )
+
+    def item_column(self, item_name: str) -> np.ndarray:
+        """Returns the quantity of the item in each batch. The column is a view on the matrix.
+
+        Args :
+        - item_name : str : name of the item
+
+        Returns :
+        - np.ndarray : quantity of the item in each batch
+
+        Raises :
+        - KeyError : if the item is not in the matrix
+        """
+
+        if item_name not in self._item_index:
+            raise KeyError(f"Key '{item_name}' not found.")
+        return self.quantities[:, self._item_index[item_name]]
+
+    def to_sparse(self) -> "SparseBatchMatrix":
+        """Returns the matrix in CSR storage, without its zero quantities."""
+
+        rows, columns = np.nonzero(self.quantities)
+        return SparseBatchMatrix(
+            np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=len(self))))),
+            columns,
+            self.quantities[rows, columns],
+            self.prices.copy(),
+            self.batch_names,
+            self.item_names,
+            self.seller_names,
+            self.batch_sellers.copy(),  # type: ignore[union-attr]
+            self.catalog,
+        )
+
+
+@dataclass(eq=False, frozen=True)
+class SparseBatchMatrix(_BatchTable):
+    """Class representing batches as CSR arrays over an interned item vocabulary.
+    Only the non-zero quantities are stored : the items of the batch i are
+    item_names[indices[indptr[i]:indptr[i + 1]]] with the quantities data[indptr[i]:indptr[i + 1]].
+
+    Args :
+    - indptr : np.ndarray : position in indices and data of the first item of each batch, followed by the number of entries
+    - indices : np.ndarray : position in item_names of each stored item
+    - data : np.ndarray : quantity of each stored item
+    - prices : np.ndarray : vector of the prices of the batches
+    - batch_names : list[str] : names of the batches, in the order of the rows
+    - item_names : list[str] : vocabulary of the items
+    - seller_names : list[str] : names of the sellers
+    - batch_sellers : np.ndarray : position in seller_names of the seller of each batch
+    - catalog : str | None : kind of catalog the batches come from, "BatchCollection" or "BatchLists",
+    None if it is unknown
+    - validate : bool : checks that indptr is non-decreasing and that the indices refer to the vocabulary,
+    which reads the whole arrays. Otherwise only the shapes and the dtypes of the arrays are checked,
+    and they must already have their dtypes so that they are not converted
+
+    Returns :
+    - SparseBatchMatrix : sparse representation of the batches
+
+    Raises :
+    - ValueError : if the dimensions of the arrays and of the name tables do not match,
+    or if an array does not have its dtype when validate is False
+
+    Example :
+
+    >>> matrix = SparseBatchMatrix.from_batch_collection(
+            BatchCollection.from_str("batch 1:1; 2xapple, 3xorange", "batch 2:2; 4xbanana", seller="seller1")
+        )
+    >>> matrix.indptr, matrix.indices, matrix.data
+    (array([0, 2, 3]), array([0, 1, 2]), array([2., 3., 4.]))
+
+    The batches containing an item are found without reading the other items :
+
+    >>> matrix.item_batches("banana")
+    (array([1]), array([4.]))
+
+    The matrix is frozen and its arrays are read-only : it can be hashed and the columns
+    computed at the first access stay valid.
+
+    >>> matrix.prices[0] = 3
+    Traceback (most recent call last):
+    ...
+    ValueError: assignment destination is read-only
+    """
+
+    indptr: np.ndarray
+    indices: np.ndarray
+    data: np.ndarray
+    prices: np.ndarray
+    batch_names: list[str]
+    item_names: list[str]
+    seller_names: list[str] = field(default_factory=lambda: ["Default seller"])
+    batch_sellers: np.ndarray | None = None
+    catalog: str | None = None
+    validate: InitVar[bool] = True
+    _item_index: dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _columns: tuple[np.ndarray, np.ndarray, np.ndarray] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self, validate: bool):
+        """Checks the dimensions of the arrays and interns the names.
+        The arrays are stored as read-only views, the fields are set through object.__setattr__.
+        """
+
+        if not validate:
+            for name, dtype in _ARRAY_DTYPES.items():
+                array = getattr(self, name)
+                if array is not None and np.asarray(array).dtype != dtype:
+                    raise ValueError(f"The array {name} must be of dtype {dtype}.")
+        object.__setattr__(self, "indptr", _read_only(self.indptr, np.intp))
+        object.__setattr__(self, "indices", _read_only(self.indices, np.intp))
+        object.__setattr__(self, "data", _read_only(self.data, np.float64))
+        object.__setattr__(self, "prices", _read_only(self.prices, np.float64))
+        if self.batch_sellers is None:
+            object.__setattr__(
+                self, "batch_sellers", np.zeros(len(self.batch_names), dtype=np.intp)
+            )
+        object.__setattr__(
+            self, "batch_sellers", _read_only(self.batch_sellers, np.intp)
+        )
+
+        if (
+            self.indptr.shape != (len(self.batch_names) + 1,)
+            or self.indptr[0] != 0
+            or (validate and np.any(np.diff(self.indptr) < 0))
+            or self.indices.shape != self.data.shape
+            or self.indptr[-1] != len(self.indices)
+        ):
+            raise ValueError(
+                "The CSR arrays must have one row per batch and one quantity per index."
+            )
+        if (
+            validate
+            and len(self.indices) > 0
+            and (self.indices.min() < 0 or self.indices.max() >= len(self.item_names))
+        ):
+            raise ValueError("The indices must refer to the items of the vocabulary.")
+        if self.prices.shape != (
+            len(self.batch_names),
+        ) or self.batch_sellers.shape != (len(self.batch_names),):
+            raise ValueError("The prices and the sellers must be given for each batch.")
+        if self.catalog not in (None, "BatchCollection", "BatchLists"):
+            raise ValueError(
+                "The catalog must be 'BatchCollection', 'BatchLists' or None."
+            )
+
+        for name in ("batch_names", "item_names", "seller_names"):
+            object.__setattr__(
+                self, name, [sys.intern(value) for value in getattr(self, name)]
+            )
+        object.__setattr__(
+            self, "_item_index", {name: j for j, name in enumerate(self.item_names)}
+        )
+        if len(self._item_index) != len(self.item_names):
+            raise ValueError("Some items have the same name in the matrix !")
+        object.__setattr__(self, "_columns", None)
+
+    @classmethod
+    def from_records(cls, records: Iterable[tuple[str, Batch]]) -> "SparseBatchMatrix":
+        """Creates a SparseBatchMatrix from (seller, batch) records, the null quantities are not stored.
+
+        Args :
+        - records : Iterable[tuple[str, Batch]] : couples of the name of the seller and of a batch he sells
+
+        Returns :
+        - SparseBatchMatrix : sparse matrix of the batches, the items are numbered by first appearance
+        """
+
+        table = _read_records(records)
+        return cls(
+            table["indptr"],
+            table["indices"],
+            table["data"],
+            table["prices"],
+            table["batch_names"],
+            table["item_names"],
+            table["seller_names"],
+            table["batch_sellers"],
+        )
+
+    @classmethod
+    def from_batch_collection(
+        cls, batch_collection: BatchCollection
+    ) -> "SparseBatchMatrix":
+        """Creates a SparseBatchMatrix from the batches of a BatchCollection."""
+
+        table = _read_records(
+            (batch_collection.seller, batch) for batch in batch_collection
+        )
+        table["seller_names"] = [batch_collection.seller]
+        return cls(**table, catalog="BatchCollection")
+
+    @classmethod
+    def from_batch_lists(cls, batch_lists: BatchLists) -> "SparseBatchMatrix":
+        """Creates a SparseBatchMatrix from the batches of all the sellers of a BatchLists."""
+
+        return cls(
+            **_read_records(
+                (batches.seller, batch) for batches in batch_lists for batch in batches
+            ),
+            catalog="BatchLists",
+        )
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Returns the number of batches and the number of items of the matrix."""
+
+        return len(self.batch_names), len(self.item_names)
+
+    @property
+    def nnz(self) -> int:
+        """Returns the number of stored quantities."""
+
+        return len(self.data)
+
+    def __getitem__(self, index: int) -> Batch:
+        """Returns the batch at the specified row, built from its stored items.
+
+        Args :
+        - index : int : row of the batch
+
+        Returns :
+        - Batch : batch of the row
+
+        Raises :
+        - IndexError : if the row does not exist
+        """
+
+        if not isinstance(index, (int, np.integer)):
+            raise IndexError("You must provide a valid index.")
+
+        index = range(len(self))[index]
+        start, end = self.indptr[index], self.indptr[index + 1]
+        return Batch(
+            self.batch_names[index],
+            float(self.prices[index]),
+            [
+                Item_in_batch(self.item_names[j], float(quantity))
+                for j, quantity in zip(self.indices[start:end], self.data[start:end])
+            ],
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Returns True if the two SparseBatchMatrix objects have the same names and the same values."""
+
+        if not isinstance(other, SparseBatchMatrix):
+            return NotImplemented
+
+        return (
+            self.batch_names == other.batch_names
+            and self.item_names == other.item_names
+            and self.sellers() == other.sellers()
+            and np.array_equal(self.prices, other.prices)
+            and np.array_equal(self.indptr, other.indptr)
+            and np.array_equal(self.indices, other.indices)
+            and np.array_equal(self.data, other.data)
+        )
+
+    def __hash__(self) -> int:
+        """Returns the hash of the SparseBatchMatrix object."""
+
+        return hash(
+            (
+                tuple(self.batch_names),
+                tuple(self.item_names),
+                tuple(self.sellers()),
+                self.prices.tobytes(),
+                self.indptr.tobytes(),
+                self.indices.tobytes(),
+                self.data.tobytes(),
+            )
+        )
+
+    def _column_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the CSC arrays (column pointers, rows, quantities) of the matrix.
+        They are computed at the first column access and kept for the next ones."""
+
+        if self._columns is None:
+            order = np.argsort(self.indices, kind="stable")
+            column_ptr = np.concatenate(
+                (
+                    [0],
+                    np.cumsum(
+                        np.bincount(self.indices, minlength=len(self.item_names))
+                    ),
+                )
+            )
+            object.__setattr__(
+                self,
+                "_columns",
+                (column_ptr, _row_of_entries(self.indptr)[order], self.data[order]),
+            )
+        return self._columns  # type: ignore[return-value]
+
+    def item_batches(self, item_name: str) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the rows of the batches containing the item and the quantity of the item in each of them.
+
+        Args :
+        - item_name : str : name of the item
+
+        Returns :
+        - tuple[np.ndarray, np.ndarray] : rows of the batches and quantities of the item
+
+        Raises :
+        - KeyError : if the item is not in the vocabulary
+        """
+
+        if item_name not in self._item_index:
+            raise KeyError(f"Key '{item_name}' not found.")
+        column_ptr, rows, quantities = self._column_arrays()
+        j = self._item_index[item_name]
+        return (
+            rows[column_ptr[j] : column_ptr[j + 1]],
+            quantities[column_ptr[j] : column_ptr[j + 1]],
+        )
+
+    def item_column(self, item_name: str) -> np.ndarray:
+        """Returns the quantity of the item in each batch, as a dense vector.
+
+        Args :
+        - item_name : str : name of the item
+
+        Returns :
+        - np.ndarray : quantity of the item in each batch
+
+        Raises :
+        - KeyError : if the item is not in the vocabulary
+        """
+
+        rows, quantities = self.item_batches(item_name)
+        column = np.zeros(len(self), dtype=np.float64)
+        column[rows] = quantities
+        return column
+
+    def to_dense(self) -> BatchMatrix:
+        """Returns the matrix in dense storage."""
+
+        quantities = np.zeros(self.shape, dtype=np.float64)
+        quantities[_row_of_entries(self.indptr), self.indices] = self.data
+        return BatchMatrix(
+            quantities,
+            self.prices.copy(),
+            self.batch_names,
+            self.item_names,
+            self.seller_names,
+            self.batch_sellers.copy(),  # type: ignore[union-attr]
+            self.catalog,
+        )
+
+    def to_json(self, path: str = "batch_matrix.json") -> None:
+        """Saves the SparseBatchMatrix object in a JSON file.
+
+        Args :
+        - path : str : path to the JSON file
+        """
+
+        try:
+            with open_file(path, "w") as file:
+                json.dump(
+                    {
+                        "batch_names": self.batch_names,
+                        "item_names": self.item_names,
+                        "seller_names": self.seller_names,
+                        "batch_sellers": self.batch_sellers.tolist(),  # type: ignore[union-attr]
+                        "catalog": self.catalog,
+                        "prices": self.prices.tolist(),
+                        "indptr": self.indptr.tolist(),
+                        "indices": self.indices.tolist(),
+                        "data": self.data.tolist(),
+                    },
+                    file,
+                )
+        except Exception as error:
+            raise error
+
+    @classmethod
+    def from_json(cls, path: str = "batch_matrix.json") -> "SparseBatchMatrix":
+        """Loads the SparseBatchMatrix object from a JSON file.
+
+        Args :
+        - path : str : path to the JSON file
+
+        Returns :
+        - SparseBatchMatrix : SparseBatchMatrix object
+        """
+
+        try:
+            with open_file(path, "r") as file:
+                json_matrix = json.load(file)
+
+            return cls(
+                json_matrix["indptr"],
+                json_matrix["indices"],
+                json_matrix["data"],
+                json_matrix["prices"],
+                json_matrix["batch_names"],
+                json_matrix["item_names"],
+                json_matrix["seller_names"],
+                json_matrix["batch_sellers"],
+                json_matrix.get("catalog"),
+            )
+        except Exception as error:
+            raise error
+
+    def to_npy(self, path: str = "batch_matrix") -> None:
+        """Saves the SparseBatchMatrix object in a directory of binary .npy files.
+        The arrays are stored in indptr.npy, indices.npy, data.npy, prices.npy and batch_sellers.npy,
+        and the name tables and the kind of catalog in names.json.
+
+        Args :
+        - path : str : path to the directory, created if it does not exist
+
+        Example :
+
+        >>> SparseBatchMatrix.from_batch_lists(batch_lists).to_npy("batch_matrix")
+        """
+
+        try:
+            os.makedirs(path, exist_ok=True)
+            for name in ("indptr", "indices", "data", "prices", "batch_sellers"):
+                np.save(os.path.join(path, f"{name}.npy"), getattr(self, name))
+            with open(os.path.join(path, "names.json"), "w") as file:
+                json.dump(
+                    {
+                        "batch_names": self.batch_names,
+                        "item_names": self.item_names,
+                        "seller_names": self.seller_names,
+                        "catalog": self.catalog,
+                    },
+                    file,
+                )
+        except Exception as error:
+            raise error
+
+    @classmethod
+    def from_npy(
+        cls, path: str = "batch_matrix", mmap_mode: str | None = "r"
+    ) -> "SparseBatchMatrix":
+        """Loads the SparseBatchMatrix object from a directory written by to_npy.
+        By default the arrays are memory-mapped and not read : the processes loading the same files
+        share their pages through the cache of the operating system.
+        The memory-mapped arrays are not validated, only their shapes and their dtypes are checked.
+        The matrix can be given to minBatchExpense, maxEarnings and the compiled problems,
+        which build the problem from the arrays without creating the batches.
+
+        Args :
+        - path : str : path to the directory
+        - mmap_mode : str | None : mode of np.load, None to read the arrays in memory
+
+        Returns :
+        - SparseBatchMatrix : SparseBatchMatrix object
+
+        Example :
+
+        >>> matrix = SparseBatchMatrix.from_npy("batch_matrix")
+        >>> minBatchExpense(matrix, ItemListRequest.from_str("2-inf of apple"))
+        """
+
+        try:
+            with open(os.path.join(path, "names.json"), "r") as file:
+                names = json.load(file)
+
+            arrays = {
+                name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+                for name in ("indptr", "indices", "data", "prices", "batch_sellers")
+            }
+            return cls(
+                arrays["indptr"],
+                arrays["indices"],
+                arrays["data"],
+                arrays["prices"],
+                names["batch_names"],
+                names["item_names"],
+                names["seller_names"],
+                arrays["batch_sellers"],
+                names.get("catalog"),
+                validate=mmap_mode is None,
+            )
+        except Exception as error:
+            raise error
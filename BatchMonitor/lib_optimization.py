@@ -11,6 +11,9 @@ You can fix the category of the variables with the minBatchExpense and maxEarnin
 You can fix the constraints of the batches with the minBatchExpense function
 You can fix the constraints of the prices with the maxEarnings function
 You can fix the exchange rate, tax rate, customs duty, and transport fee with the minBatchExpense or maxEarnings functions
+You can compile a problem once with BatchProblem or DualBatchProblem, update its data in place and solve it again
+You can solve many demand lists against one catalog, in several processes, with the solve_many function
+You can study the impact of the price of a batch on both problems with the price_sweep function
 
 Limits :
 - We suppose that we have a unique requester for the minBatchExpense function
@@ -25,50 +28,128 @@ Developed by :
 """
 
 import copy
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+import multiprocessing
+from collections import Counter, deque
 import os
 import sys
 import numpy as np
 import pulp as pulp
+from beartype.typing import Iterable, Iterator
 from .lib_batches import Batch, BatchCollection, BatchLists
 from .lib_item_request import ItemListRequest, ItemRequest
+from .lib_matrix import BatchMatrix, SparseBatchMatrix
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 
-def _transform_batch_list(liste_of_batches: BatchLists) -> BatchCollection:
-    """Transform a BatchLists object into a BatchCollection object.
-    We also add the name of the seller to the name of the batch."""
+def _batch_view(batch: Batch, name: str) -> Batch:
+    """Returns a new batch named `name` which shares the items of the batch.
+    The name and the price of the view can be changed without modifying the original batch.
+    """
 
-    for batches in liste_of_batches:
-        for batch in batches:
-            batch.name = f"{batches.seller}_{batch.name}"
+    view = copy.copy(batch)
+    view.name = name
+    return view
 
-    batch_collection = [batch for batches in liste_of_batches for batch in batches]
 
-    return BatchCollection(batch_list=batch_collection)
+def _batch_keys(
+    batches: BatchCollection | BatchLists,
+) -> dict[str, tuple[str, str]]:
+    """Returns the (seller, batch) key of each batch, indexed by the name of the batch in the optimization.
+    The batches of a BatchLists are named 'seller_batch' in the optimization."""
+
+    if isinstance(batches, BatchCollection):
+        return {batch.name: (batches.seller, batch.name) for batch in batches}
+    return {
+        f"{batch_collection.seller}_{batch.name}": (batch_collection.seller, batch.name)
+        for batch_collection in batches
+        for batch in batch_collection
+    }
+
 
+def _named_by_seller(matrix: SparseBatchMatrix) -> bool:
+    """Returns True if the batches of the matrix are named 'seller_batch' in the optimization,
+    like those of a BatchLists : the matrix comes from a BatchLists, or from an unknown catalog with several sellers.
+    """
 
-def _generate_variables_primal(
-    batches: BatchCollection,
+    return matrix.catalog == "BatchLists" or (
+        matrix.catalog is None and len(matrix.seller_names) > 1
+    )
+
+
+def _matrix_keys(matrix: SparseBatchMatrix) -> dict[str, tuple[str, str]]:
+    """Returns the (seller, batch) key of each row of the matrix, indexed by the name of the batch in the optimization,
+    like _batch_keys for the kind of catalog the matrix was created from.
+
+    Raises :
+    - ValueError : if several rows have the same name in the optimization
+    """
+
+    names = matrix.keys() if _named_by_seller(matrix) else matrix.batch_names
+    keys = dict(zip(names, zip(matrix.sellers(), matrix.batch_names)))
+    if len(keys) != len(matrix):
+        raise ValueError("Some batches have the same name in the matrix !")
+    return keys
+
+
+def _flatten_batches(batches: BatchCollection | BatchLists) -> BatchCollection:
+    """Flatten the batches into a BatchCollection of views for the optimization.
+    The views share the items of the original batches, so nothing is deep copied,
+    and the rates can be applied to their prices without modifying the original batches.
+    """
+
+    if isinstance(batches, BatchCollection):
+        return BatchCollection.from_batches(
+            [_batch_view(batch, batch.name) for batch in batches],
+            batches.seller,
+            validate="none",
+        )
+    return BatchCollection.from_batches(
+        _batch_view(batch, f"{batch_collection.seller}_{batch.name}")
+        for batch_collection in batches
+        for batch in batch_collection
+    )
+
+
+def _transform_batch_list(liste_of_batches: BatchLists) -> BatchCollection:
+    """Transform a BatchLists object into a BatchCollection object.
+    We also add the name of the seller to the name of the batch.
+    The BatchLists is not modified."""
+
+    return _flatten_batches(liste_of_batches)
+
+
+def _batch_variables(
+    batch_names: Iterable[str],
     cat: dict[str, str] | str = "Continuous",
     batch_constraints: dict[str, tuple[float, float | None]] | None = None,
 ) -> dict[str, pulp.LpVariable]:
-    """Generate the variables of the primal problem."""
+    """Generate the variables of the quantities of the batches, from their names in the optimization."""
 
     if batch_constraints is None:
         batch_constraints = {}
 
-    variables = {
-        batch.name: pulp.LpVariable(
-            batch.name,
-            lowBound=batch_constraints.get(batch.name, (0, None))[0],
-            upBound=batch_constraints.get(batch.name, (0, None))[1],
-            cat=cat.get(batch.name, cat) if isinstance(cat, dict) else cat,
+    return {
+        name: pulp.LpVariable(
+            name,
+            lowBound=batch_constraints.get(name, (0, None))[0],
+            upBound=batch_constraints.get(name, (0, None))[1],
+            cat=cat.get(name, cat) if isinstance(cat, dict) else cat,
         )
-        for batch in batches
+        for name in batch_names
     }
 
-    return variables
+
+def _generate_variables_primal(
+    batches: BatchCollection,
+    cat: dict[str, str] | str = "Continuous",
+    batch_constraints: dict[str, tuple[float, float | None]] | None = None,
+) -> dict[str, pulp.LpVariable]:
+    """Generate the variables of the primal problem."""
+
+    return _batch_variables((batch.name for batch in batches), cat, batch_constraints)
 
 
 def _generate_primal_objective_function(
@@ -87,13 +168,8 @@ def _missing_ItemRequest(
 ) -> bool:
     """Check if an item in the demand list is not in the Batch_list."""
 
-    return any(
-        all(
-            request_item.name not in [item.name for item in batch.items]
-            for batch in batches
-        )
-        for request_item in demand_list
-    )
+    item_names = {item.name for batch in batches for item in batch.items}
+    return any(request_item.name not in item_names for request_item in demand_list)
 
 
 def _addition_of_unrequested_item(
@@ -101,12 +177,117 @@ def _addition_of_unrequested_item(
 ) -> ItemListRequest:
     """Add the items not requested in the demand list."""
 
-    All_items_in_batch = {item.name for batch in batches for item in batch}
     items_requested = {item.name for item in demand_list}
-    for item in All_items_in_batch:
-        if item not in items_requested:
-            demand_list.items.append(ItemRequest(item, 0))
-    return demand_list
+    return ItemListRequest(
+        [
+            *demand_list.items,
+            *[
+                ItemRequest(item, 0)
+                for item in dict.fromkeys(
+                    item.name for batch in batches for item in batch
+                )
+                if item not in items_requested
+            ],
+        ]
+    )
+
+
+def _rate_vector(
+    batches: BatchCollection | list[Batch] | SparseBatchMatrix,
+    rate: float | np.ndarray | dict[str, float],
+    neutral: float = 0,
+    sellers: list[str] | None = None,
+) -> float | np.ndarray:
+    """Returns the rate of each batch, or the rate of all the batches if it is a scalar.
+
+    A dictionary gives the rate of each seller if one of its keys is a seller, else the rate of each item.
+    The rate of a batch is then the mean of the rates of its items weighted by their quantities.
+    The sellers or the items absent from the dictionary get the neutral rate.
+    The items of a SparseBatchMatrix are read from its arrays.
+
+    Raises :
+    - ValueError : if an array does not give exactly one rate per batch
+    - KeyError : if a key of a dictionary of sellers is not a seller of the batches,
+    or if a key of a dictionary of items is not an item of the batches
+    """
+
+    if isinstance(rate, np.ndarray):
+        if len(rate) != len(batches):
+            raise ValueError(
+                f"The rates must be given for each of the {len(batches)} batches, but got {len(rate)} rates."
+            )
+        return np.asarray(rate, dtype=np.float64)
+    if not isinstance(rate, dict):
+        return rate
+
+    if sellers is None:
+        seller = batches.seller if isinstance(batches, BatchCollection) else None
+        sellers = [seller] * len(batches)
+    if not set(rate).isdisjoint(sellers):
+        unknown = set(rate).difference(sellers)
+        if unknown:
+            raise KeyError(f"The keys {sorted(unknown)} are not sellers.")
+        return np.array([rate.get(seller, neutral) for seller in sellers], dtype=float)
+
+    matrix = (
+        batches
+        if isinstance(batches, SparseBatchMatrix)
+        else _incidence_matrix(batches)
+    )
+    unknown = set(rate) - set(matrix.item_names)
+    if unknown:
+        raise KeyError(f"The keys {sorted(unknown)} are neither sellers nor items.")
+    item_rates = np.array(
+        [rate.get(item_name, neutral) for item_name in matrix.item_names],
+        dtype=float,
+    )
+    rows = np.repeat(np.arange(len(batches)), np.diff(matrix.indptr))
+    quantities = np.bincount(rows, weights=matrix.data, minlength=len(batches))
+    weighted_rates = np.bincount(
+        rows, weights=matrix.data * item_rates[matrix.indices], minlength=len(batches)
+    )
+    return np.divide(
+        weighted_rates,
+        quantities,
+        out=np.full(len(batches), float(neutral)),
+        where=quantities > 0,
+    )
+
+
+def _effective_prices(
+    batches: BatchCollection | list[Batch] | SparseBatchMatrix,
+    exchange_rate: float | np.ndarray | dict[str, float] = 1,
+    tax_rate: float | np.ndarray | dict[str, float] = 0,
+    customs_duty: float | np.ndarray | dict[str, float] = 0,
+    transport_fee: float | np.ndarray | dict[str, float] = 0,
+    sellers: list[str] | None = None,
+    prices: np.ndarray | None = None,
+) -> np.ndarray:
+    """Returns the price of each batch once the rates are applied, computed at once with NumPy :
+    price x (1 + transport_fee) x exchange_rate x (1 + tax_rate) x (1 + customs_duty).
+    The prices are read from the batches unless they are given. The batches are not modified.
+    """
+
+    if prices is None:
+        prices = np.array([batch.price for batch in batches], dtype=np.float64)
+    return (
+        prices
+        * (1 + _rate_vector(batches, transport_fee, 0, sellers))
+        * _rate_vector(batches, exchange_rate, 1, sellers)
+        * (1 + _rate_vector(batches, tax_rate, 0, sellers))
+        * (1 + _rate_vector(batches, customs_duty, 0, sellers))
+    )
+
+
+def _set_prices(
+    batches: BatchCollection | list[Batch], prices: np.ndarray
+) -> BatchCollection | list[Batch]:
+    """Sets the prices of the batches, which are the views used by the optimization."""
+
+    for batch, price in zip(batches, prices.tolist()):
+        batch.price = price
+
+    return batches
 
 
 def _exchange_rate(
@@ -114,27 +295,13 @@ def _exchange_rate(
 ) -> BatchCollection:
     """Apply an exchange rate to the prices of the batches."""
 
-    if isinstance(rate, np.ndarray):
-        for i, batch in enumerate(batches):
-            batch.price *= rate[i]
-    else:
-        for batch in batches:
-            batch.price *= rate
-
-    return batches
+    return _set_prices(batches, _effective_prices(batches, exchange_rate=rate))
 
 
 def _taxe_rate(batches: BatchCollection, rate: float | np.ndarray) -> BatchCollection:
     """Apply a tax rate to the prices of the batches."""
 
-    if isinstance(rate, np.ndarray):
-        for i, batch in enumerate(batches):
-            batch.price *= 1 + rate[i]
-    else:
-        for batch in batches:
-            batch.price *= 1 + rate
-
-    return batches
+    return _set_prices(batches, _effective_prices(batches, tax_rate=rate))
 
 
 def _customs_duty(
@@ -142,14 +309,7 @@ def _customs_duty(
 ) -> BatchCollection:
     """Apply customs duties to the prices of the batches."""
 
-    if isinstance(rate, np.ndarray):
-        for i, batch in enumerate(batches):
-            batch.price *= 1 + rate[i]
-    else:
-        for batch in batches:
-            batch.price *= 1 + rate
-
-    return batches
+    return _set_prices(batches, _effective_prices(batches, customs_duty=rate))
 
 
 def _transport_fee(
@@ -157,50 +317,45 @@ def _transport_fee(
 ) -> BatchCollection:
     """Apply transport fees to the prices of the batches."""
 
-    if isinstance(rate, np.ndarray):
-        for i, batch in enumerate(batches):
-            batch.price *= 1 + rate[i]
-    else:
-        for batch in batches:
-            batch.price *= 1 + rate
-
-    return batches
+    return _set_prices(batches, _effective_prices(batches, transport_fee=rate))
 
 
 def _apply_rates(
     batches: BatchCollection,
-    exchange_rate: float | np.ndarray,
-    tax_rate: float | np.ndarray,
-    customs_duty: float | np.ndarray,
-    transport_fee: float | np.ndarray,
+    exchange_rate: float | np.ndarray | dict[str, float],
+    tax_rate: float | np.ndarray | dict[str, float],
+    customs_duty: float | np.ndarray | dict[str, float],
+    transport_fee: float | np.ndarray | dict[str, float],
+    sellers: list[str] | None = None,
 ) -> BatchCollection:
-    """Apply the rates to the prices of the batches."""
+    """Apply the rates to the prices of the batches, with a single vector of effective prices."""
 
-    batches = _transport_fee(batches, transport_fee)
-    batches = _exchange_rate(batches, exchange_rate)
-    batches = _taxe_rate(batches, tax_rate)
-    batches = _customs_duty(batches, customs_duty)
-
-    return batches
+    return _set_prices(
+        batches,
+        _effective_prices(
+            batches, exchange_rate, tax_rate, customs_duty, transport_fee, sellers
+        ),
+    )
 
 
 def _prepare_the_problem(
     batches: BatchCollection | BatchLists,
     demand_list: ItemListRequest,
-    exchange_rate: float | np.ndarray = 1,
-    tax_rate: float | np.ndarray = 0,
-    customs_duty: float | np.ndarray = 0,
-    transport_fee: float | np.ndarray = 0,
+    exchange_rate: float | np.ndarray | dict[str, float] = 1,
+    tax_rate: float | np.ndarray | dict[str, float] = 0,
+    customs_duty: float | np.ndarray | dict[str, float] = 0,
+    transport_fee: float | np.ndarray | dict[str, float] = 0,
 ) -> BatchCollection:
-    """Prepare the batch list for the optimization."""
+    """Prepare the batch list for the optimization.
+    The rates are applied to a flattened view of the batches, the original batches are not modified.
+    """
 
-    if isinstance(batches, BatchLists):
-        batches = _transform_batch_list(batches)
-    demand_list = _addition_of_unrequested_item(batches, demand_list)
+    sellers = [seller for seller, _ in _batch_keys(batches).values()]
+    batches = _flatten_batches(batches)
     if _missing_ItemRequest(batches, demand_list):
         raise ValueError("An item requested is not contained in any batch.")
     batches = _apply_rates(
-        batches, exchange_rate, tax_rate, customs_duty, transport_fee
+        batches, exchange_rate, tax_rate, customs_duty, transport_fee, sellers
     )
 
     return batches
@@ -253,40 +408,57 @@ def _apply_expense_constraints(
     return constraints
 
 
+def _incidence_matrix(batches: BatchCollection) -> SparseBatchMatrix:
+    """Returns the incidence of the items in the batches as a SparseBatchMatrix, with one row per batch in their order.
+    The rows give the items of each batch and the columns the batches containing each item.
+    """
+
+    return SparseBatchMatrix.from_records(("", batch) for batch in batches)
+
+
+def _item_quantity(
+    matrix: SparseBatchMatrix,
+    batch_variables: list[pulp.LpVariable],
+    item_name: str,
+) -> pulp.LpAffineExpression:
+    """Returns the quantity of the item bought : its quantity in each batch containing it times the variable of the batch.
+    The batches containing the item are read from the columns of the matrix, the other batches are not visited.
+    """
+
+    try:
+        rows, quantities = matrix.item_batches(item_name)
+    except KeyError:
+        return pulp.LpAffineExpression()
+    return pulp.LpAffineExpression(
+        [
+            (batch_variables[row], quantity)
+            for row, quantity in zip(rows.tolist(), quantities.tolist())
+        ]
+    )
+
+
 def _generate_primal_constraints(
     variables: dict[str, pulp.LpVariable],
     batches: BatchCollection,
     demand_list: ItemListRequest,
     maximum_expense: float | None = None,
     minimum_expense: float | None = None,
+    matrix: SparseBatchMatrix | None = None,
 ) -> pulp.LpProblem:
-    """Generate the constraints of the primal problem."""
+    """Generate the constraints of the primal problem.
+    The incidence of the items in the batches is built once as a SparseBatchMatrix, unless it is given,
+    and each demand row only reads the batches containing its item."""
+
+    if matrix is None:
+        matrix = _incidence_matrix(batches)
+    batch_variables = [variables[batch_name] for batch_name in matrix.batch_names]
 
     prob = pulp.LpProblem("Primal problem", pulp.LpMinimize)
     for item_request in demand_list:
-        prob += (
-            pulp.lpSum(
-                [
-                    item.quantity_in_batch * variables[batch.name]
-                    for batch in batches
-                    for item in batch
-                    if item.name == item_request.name
-                ]
-            )
-            >= item_request.minimum_quantity
-        )
+        quantity = _item_quantity(matrix, batch_variables, item_request.name)
+        prob += quantity >= item_request.minimum_quantity
         if item_request.maximum_quantity:
-            prob += (
-                pulp.lpSum(
-                    [
-                        item.quantity_in_batch * variables[batch.name]
-                        for batch in batches
-                        for item in batch
-                        if item.name == item_request.name
-                    ]
-                )
-                <= item_request.maximum_quantity
-            )
+            prob += quantity <= item_request.maximum_quantity
     prob = _apply_expense_constraints(
         batches=batches,
         variables=variables,
@@ -324,16 +496,26 @@ def _collecte_data_primal(
 
 
 def _expense_per_each_seller(
-    batches: BatchCollection,
+    batches: BatchCollection | np.ndarray,
     x: dict[str, float],
+    keys: dict[str, tuple[str, str]] | None = None,
 ) -> dict[str, float]:
-    """Calculate the expense per each seller"""
+    """Calculate the expense per each seller.
+    The prices are read from the batches, or given in an array in the order of x.
+    The seller of each batch is read from its (seller, batch) key if the keys are given.
+    """
+
+    if keys is None:
+        keys = {key: (key.split("_")[0], key) for key in x}
+    prices = (
+        batches.tolist()
+        if isinstance(batches, np.ndarray)
+        else [batch.price for batch in batches]
+    )
 
     expense_per_seller: dict[str, float] = {}
-    for key, value, price in zip(
-        x.keys(), x.values(), [batch.price for batch in batches]
-    ):
-        seller = key.split("_")[0]
+    for key, value, price in zip(x.keys(), x.values(), prices):
+        seller = keys[key][0]
         if seller in expense_per_seller:
             expense_per_seller[seller] += price * value
         else:
@@ -343,13 +525,13 @@ def _expense_per_each_seller(
 
 
 def minBatchExpense(
-    batches: BatchCollection | BatchLists,
+    batches: BatchCollection | BatchLists | BatchMatrix | SparseBatchMatrix,
     demand_list: ItemListRequest,
     category_of_variables: dict[str, str] | str = "Continuous",
-    exchange_rate: float | np.ndarray | int = 1,
-    tax_rate: float | np.ndarray | int = 0,
-    customs_duty: float | np.ndarray | int = 0,
-    transport_fee: float | np.ndarray | int = 0,
+    exchange_rate: float | np.ndarray | int | dict[str, float] = 1,
+    tax_rate: float | np.ndarray | int | dict[str, float] = 0,
+    customs_duty: float | np.ndarray | int | dict[str, float] = 0,
+    transport_fee: float | np.ndarray | int | dict[str, float] = 0,
     minimum_expense: float | None = None,
     maximum_expense: float | None = None,
     batch_constraints: dict[str, tuple[float, float | None]] | None = None,
@@ -361,9 +543,12 @@ def minBatchExpense(
     The variables are the quantities of the batches.
 
     Args:
-    - batches: BatchCollection | BatchLists: The list of batches to optimize.
+    - batches: BatchCollection | BatchLists | BatchMatrix | SparseBatchMatrix: The list of batches to optimize.
 
     You can specify the list of batches in the form of a BatchCollection or a BatchLists.
+    A SparseBatchMatrix, for example loaded with SparseBatchMatrix.from_npy, is read from its arrays without building
+    its batches, which are named like those of the kind of catalog it was created from ('seller_batch' for a BatchLists).
+    A BatchMatrix is read in the same way from its quantity matrix, converted with to_sparse.
 
 
     - demand_list: ItemListRequest: The list of items requested.
@@ -374,25 +559,29 @@ def minBatchExpense(
 
     You can specify a category (Contnuous or Integer) for each bach.
 
-    - exchange_rate: float | np.ndarray: The exchange rate.
+    - exchange_rate: float | np.ndarray | dict[str, float]: The exchange rate.
 
-    You can specify a different exchange rate for each batch in the form of an np.array([]).
+    You can specify a different exchange rate for each batch in the form of an np.array([]), with one rate per batch.
+    You can also specify the exchange rate of each seller, or of each item, in the form of a dict.
 
     Attention: The exchange rate is applied to the price of the batch. So the final money will be in the currency of the requester.
 
 
-    - tax_rate: float | np.ndarray: The tax rate.
+    - tax_rate: float | np.ndarray | dict[str, float]: The tax rate.
 
-    You can specify a different tax rate for each batch in the form of an np.array([]).
+    You can specify a different tax rate for each batch in the form of an np.array([]), with one rate per batch.
+    You can also specify the tax rate of each seller, or of each item, in the form of a dict.
 
-    - customs_duty: float | np.ndarray: The customs duty.
+    - customs_duty: float | np.ndarray | dict[str, float]: The customs duty.
 
-    You can specify a different customs duty for each batch in the form of an np.array([]).
+    You can specify a different customs duty for each batch in the form of an np.array([]), with one rate per batch.
+    You can also specify the customs duty of each seller, or of each item, in the form of a dict.
 
 
-    - transport_fee: float | np.ndarray: The transport fee.
+    - transport_fee: float | np.ndarray | dict[str, float]: The transport fee.
 
-    You can specify a different transport fee for each batch in the form of an np.array([]).
+    You can specify a different transport fee for each batch in the form of an np.array([]), with one rate per batch.
+    You can also specify the transport fee of each seller, or of each item, in the form of a dict.
 
     The different rates are applied to the price of the batch in the following order:
     - transport_fee
@@ -400,6 +589,11 @@ def minBatchExpense(
     - tax_rate
     - customs_duty
 
+    The rate of a batch given by item is the mean of the rates of its items weighted by their quantities.
+    The sellers or the items absent from the dict get a neutral rate (1 for the exchange rate, 0 otherwise).
+    A KeyError is raised if a key is not a seller or an item of the batches, the keys cannot mix both.
+    The effective prices are computed at once with NumPy, the batches given are not modified.
+
     - minimum_expense: float: The minimum expense the requester is willing to pay.
 
     - maximum_expense: float: The maximum expense the requester is willing to pay.
@@ -496,8 +690,8 @@ def minBatchExpense(
     ...     items,
     ...     category_of_variables="Continuous",
     ...     exchange_rate=0.9,
-    ...     transport_fee=np.array([0.3, 0.1, 0.4]),
-    ...     tax_rate=np.array([0.2, 0.1, 0.3]),
+    ...     transport_fee=np.array([0.3, 0.1]),
+    ...     tax_rate=np.array([0.2, 0.1]),
     ...     customs_duty=0.2,
     ...     batch_constraints=dict(
     ...         lot1= (0, 50),
@@ -581,59 +775,39 @@ def minBatchExpense(
     {'Status': 'Infeasible'}
     """
 
-    batches_copy = copy.deepcopy(batches)
-    demand_list_copy = copy.deepcopy(demand_list)
-
-    batches_copy = _prepare_the_problem(
-        batches=batches_copy,
-        demand_list=demand_list_copy,
+    return BatchProblem(
+        batches=batches,
+        demand_list=demand_list,
+        category_of_variables=category_of_variables,
         exchange_rate=exchange_rate,
         tax_rate=tax_rate,
         customs_duty=customs_duty,
         transport_fee=transport_fee,
-    )
-
-    variables, objective, constraints = _collecte_data_primal(
-        batches=batches_copy,
-        demand_list=demand_list_copy,
-        cat=category_of_variables,
-        maximum_expense=maximum_expense,
         minimum_expense=minimum_expense,
+        maximum_expense=maximum_expense,
         batch_constraints=batch_constraints,
-    )
-
-    prob = pulp.LpProblem("Primal problem", pulp.LpMinimize)
-    prob += objective
-    for constraint in constraints.values():
-        prob += constraint
-    prob.solve(pulp.PULP_CBC_CMD(msg=False))
-
-    return _return_minBatchExpense(
-        batches=batches, batches_copy=batches_copy, variables=variables, prob=prob
-    )
+    ).solve()
 
 
 def _return_minBatchExpense(
-    batches: BatchCollection | BatchLists,
-    batches_copy: BatchCollection,
-    variables: pulp.LpVariable,
+    variables: dict[str, pulp.LpVariable],
     prob: pulp.LpProblem,
+    keys: dict[str, tuple[str, str]] | None = None,
+    prices: np.ndarray | None = None,
 ) -> dict[str, str | float | int | dict[str, float | int]] | dict[str, str]:
-    """Returns of the minBatchExpense function"""
+    """Returns of the minBatchExpense function.
+    The expense per seller is added if the keys and the effective prices of the batches are given.
+    """
 
-    x = x = {
-        batch.name: pulp.value(variables[batch.name])
-        for batch in batches_copy
-        if isinstance(batch, Batch)
-    }
+    x = {name: pulp.value(variable) for name, variable in variables.items()}
     if pulp.LpStatus[prob.status] == "Infeasible":
         return {"Status": pulp.LpStatus[prob.status]}
-    elif isinstance(batches, BatchLists) and isinstance(batches_copy, BatchCollection):
+    elif keys is not None and prices is not None:
         return {
             "Status": pulp.LpStatus[prob.status],
             "Total cost": pulp.value(prob.objective),
             "Batch quantities": x,
-            "Expense per seller": _expense_per_each_seller(batches_copy, x),
+            "Expense per seller": _expense_per_each_seller(prices, x, keys),
         }
     else:
         return {
@@ -741,20 +915,37 @@ def _apply_benefit_constraints(
 
 def _generate_dual_constraints(
     variables: dict[str, pulp.LpVariable],
-    batch_list: BatchCollection,
+    batch_list: BatchCollection | None,
     demand_list: ItemListRequest,
     minimum_benefit: float | None = None,
     maximum_benefit: float | None = None,
+    matrix: SparseBatchMatrix | None = None,
 ) -> pulp.LpProblem:
-    """Generate the constraints of the dual problem."""
+    """Generate the constraints of the dual problem.
+    Each batch row is read from the rows of the same SparseBatchMatrix as the primal problem,
+    the batches are only read if the matrix is not given.
+    """
+
+    if matrix is None:
+        matrix = _incidence_matrix(batch_list)
+    item_variables = [variables[item_name] for item_name in matrix.item_names]
+    indptr = matrix.indptr.tolist()
+    indices = matrix.indices.tolist()
+    data = matrix.data.tolist()
 
     prob = pulp.LpProblem("Dual problem", pulp.LpMaximize)
-    for batch in batch_list:
+    for row, price in enumerate(matrix.prices.tolist()):
         prob += (
-            pulp.lpSum(
-                [item.quantity_in_batch * variables[item.name] for item in batch]
+            pulp.LpAffineExpression(
+                [
+                    (item_variables[column], quantity)
+                    for column, quantity in zip(
+                        indices[indptr[row] : indptr[row + 1]],
+                        data[indptr[row] : indptr[row + 1]],
+                    )
+                ]
             )
-            <= batch.price
+            <= price
         )
     prob = _apply_benefit_constraints(
         demand_list=demand_list,
@@ -794,13 +985,13 @@ def _collecte_data_dual(
 
 
 def maxEarnings(
-    batches: BatchCollection | BatchLists,
+    batches: BatchCollection | BatchLists | BatchMatrix | SparseBatchMatrix,
     demand_list: ItemListRequest,
     category_of_variables: dict[str, str] | str = "Continuous",
-    exchange_rate: float | np.ndarray | int = 1,
-    tax_rate: float | np.ndarray | int = 0,
-    customs_duty: float | np.ndarray | int = 0,
-    transport_fee: float | np.ndarray | int = 0,
+    exchange_rate: float | np.ndarray | int | dict[str, float] = 1,
+    tax_rate: float | np.ndarray | int | dict[str, float] = 0,
+    customs_duty: float | np.ndarray | int | dict[str, float] = 0,
+    transport_fee: float | np.ndarray | int | dict[str, float] = 0,
     minimum_benefit: float | None = None,
     maximum_benefit: float | None = None,
     price_constraints: dict[str, tuple[float, float | None]] | None = None,
@@ -812,9 +1003,12 @@ def maxEarnings(
 
     Args:
 
-    - batches: BatchCollection | BatchLists: The list of batches to optimize.
+    - batches: BatchCollection | BatchLists | BatchMatrix | SparseBatchMatrix: The list of batches to optimize.
 
     You can specify the list of batches in the form of a BatchCollection or a BatchLists.
+    A SparseBatchMatrix, for example loaded with SparseBatchMatrix.from_npy, is read from its arrays without building
+    its batches, which are named like those of the kind of catalog it was created from ('seller_batch' for a BatchLists).
+    A BatchMatrix is read in the same way from its quantity matrix, converted with to_sparse.
 
 
     - demand_list: ItemListRequest: The list of items requested.
@@ -826,26 +1020,30 @@ def maxEarnings(
 
     You can specify a category (Contnuous or Integer) for each bach.
 
-    - exchange_rate: float | np.ndarray: The exchange rate.
+    - exchange_rate: float | np.ndarray | dict[str, float]: The exchange rate.
 
-    You can specify a different exchange rate for each batch in the form of an np.array([]).
+    You can specify a different exchange rate for each batch in the form of an np.array([]), with one rate per batch.
+    You can also specify the exchange rate of each seller, or of each item, in the form of a dict.
 
     Attention , the final money will be in the currency of the requester.
 
 
-    - tax_rate: float | np.ndarray: The tax rate.
+    - tax_rate: float | np.ndarray | dict[str, float]: The tax rate.
 
-    You can specify a different tax rate for each batch in the form of an np.array([]).
+    You can specify a different tax rate for each batch in the form of an np.array([]), with one rate per batch.
+    You can also specify the tax rate of each seller, or of each item, in the form of a dict.
 
 
-    - customs_duty: float | np.ndarray: The customs duty.
+    - customs_duty: float | np.ndarray | dict[str, float]: The customs duty.
 
-    You can specify a different customs duty for each batch in the form of an np.array([]).
+    You can specify a different customs duty for each batch in the form of an np.array([]), with one rate per batch.
+    You can also specify the customs duty of each seller, or of each item, in the form of a dict.
 
 
-    - transport_fee: float | np.ndarray: The transport fee.
+    - transport_fee: float | np.ndarray | dict[str, float]: The transport fee.
 
-    You can specify a different transport fee for each batch in the form of an np.array([]).
+    You can specify a different transport fee for each batch in the form of an np.array([]), with one rate per batch.
+    You can also specify the transport fee of each seller, or of each item, in the form of a dict.
 
     the different rates are applied to the price of the batch in the following order:
     - transport_fee
@@ -853,6 +1051,11 @@ def maxEarnings(
     - tax_rate
     - customs_duty
 
+    The rate of a batch given by item is the mean of the rates of its items weighted by their quantities.
+    The sellers or the items absent from the dict get a neutral rate (1 for the exchange rate, 0 otherwise).
+    A KeyError is raised if a key is not a seller or an item of the batches, the keys cannot mix both.
+    The effective prices are computed at once with NumPy, the batches given are not modified.
+
     - minimum_benefit: float: The minimum benefit the seller is willing to earn.
 
     - maximum_benefit: float: The maximum benefit the seller is willing to earn.
@@ -970,7 +1173,7 @@ def maxEarnings(
     ...         },
     ...         category_of_variables="Integer",
     ...         exchange_rate=1.2,
-    ...         transport_fee=np.array([0.1, 0.2, 0.3, 0.4, 0.5]),
+    ...         transport_fee=np.array([0.1, 0.2, 0.3]),
     ...         tax_rate=0.1,
     ...         customs_duty=0.2,
     ...     )
@@ -1009,7 +1212,7 @@ def maxEarnings(
     ...         },
     ...         category_of_variables="Integer",
     ...         exchange_rate=1.2,
-    ...         transport_fee=np.array([0.1, 0.2, 0.3, 0.4, 0.5]),
+    ...         transport_fee=np.array([0.1, 0.2, 0.3]),
     ...         tax_rate=0.1,
     ...         customs_duty=0.2,
     ...     )
@@ -1057,31 +1260,18 @@ def maxEarnings(
         ValueError: maximum_benefit cannot be less than minimum_benefit
     """
 
-    batches = _prepare_the_problem(
+    return DualBatchProblem(
         batches=batches,
         demand_list=demand_list,
+        category_of_variables=category_of_variables,
         exchange_rate=exchange_rate,
         tax_rate=tax_rate,
         customs_duty=customs_duty,
         transport_fee=transport_fee,
-    )
-
-    variables, objective, constraints = _collecte_data_dual(
-        batches=batches,
-        demand_list=demand_list,
-        cat=category_of_variables,
-        maximum_benefit=maximum_benefit,
         minimum_benefit=minimum_benefit,
+        maximum_benefit=maximum_benefit,
         price_constraints=price_constraints,
-    )
-
-    prob = pulp.LpProblem("Dual problem", pulp.LpMaximize)
-    prob += objective
-    for constraint in constraints.values():
-        prob += constraint
-    prob.solve(pulp.PULP_CBC_CMD(msg=False))
-
-    return _return_maxEarnings(variables=variables, demand_list=demand_list, prob=prob)
+    ).solve()
 
 
 def _return_maxEarnings(
@@ -1102,3 +1292,813 @@ def _return_maxEarnings(
             "Total benefit": pulp.value(prob.objective),
             "Item prices": x,
         }
+
+
+class _CompiledProblem(ABC):
+    """Data shared by the compiled problems : the incidence matrix of the batches, their names in the optimization,
+    their base prices, the rates and the demand list completed with the unrequested items.
+    A catalog is read once into a SparseBatchMatrix, a BatchMatrix is converted with to_sparse
+    and a SparseBatchMatrix is used as it is : the problem is built from their arrays and no batch is created.
+    """
+
+    def __init__(
+        self,
+        batches: BatchCollection | BatchLists | BatchMatrix | SparseBatchMatrix,
+        demand_list: ItemListRequest,
+        exchange_rate: float | np.ndarray | int | dict[str, float] = 1,
+        tax_rate: float | np.ndarray | int | dict[str, float] = 0,
+        customs_duty: float | np.ndarray | int | dict[str, float] = 0,
+        transport_fee: float | np.ndarray | int | dict[str, float] = 0,
+    ):
+        self.batches = batches
+        if isinstance(batches, BatchMatrix):
+            batches = batches.to_sparse()
+        if isinstance(batches, BatchCollection):
+            batches = SparseBatchMatrix.from_batch_collection(batches)
+        elif isinstance(batches, BatchLists):
+            batches = SparseBatchMatrix.from_batch_lists(batches)
+
+        self._matrix = batches
+        self._keys = _matrix_keys(self._matrix)
+        self._sellers = self._matrix.sellers()
+        self._prices = self._matrix.prices.astype(np.float64)
+        self._rates = {
+            "exchange_rate": exchange_rate,
+            "tax_rate": tax_rate,
+            "customs_duty": customs_duty,
+            "transport_fee": transport_fee,
+        }
+        self.set_demand(demand_list)
+
+    def _effective_prices(self) -> np.ndarray:
+        """Returns the prices of the batches once the rates are applied to their base prices."""
+
+        return _effective_prices(
+            self._matrix, **self._rates, sellers=self._sellers, prices=self._prices
+        )
+
+    @abstractmethod
+    def _update_prices(self):
+        """Applies the new effective prices to the compiled problem."""
+
+    @abstractmethod
+    def _solve(self, warm_start: bool = False) -> pulp.LpProblem:
+        """Builds the LpProblem from the compiled rows and solves it."""
+
+    @abstractmethod
+    def _price_slope(self, prob: pulp.LpProblem, row: int) -> float:
+        """Returns the derivative of the optimal objective with respect to the effective price of a batch."""
+
+    def _price_factor(self, row: int) -> float:
+        """Returns the effective price of a batch for a base price of 1, the rates being linear in the price."""
+
+        return float(
+            _effective_prices(
+                self._matrix,
+                **self._rates,
+                sellers=self._sellers,
+                prices=np.ones(len(self._prices)),
+            )[row]
+        )
+
+    def set_demand(self, demand_list: ItemListRequest):
+        """Replaces the demand list, the items not requested are added with a quantity of 0.
+
+        Raises :
+        - ValueError : if an item requested is not contained in any batch
+        """
+
+        item_names = set(self._matrix.item_names)
+        if any(item_request.name not in item_names for item_request in demand_list):
+            raise ValueError("An item requested is not contained in any batch.")
+
+        self.demand_list = ItemListRequest(list(demand_list.items))
+        requested = {item_request.name for item_request in demand_list}
+        self._demand = ItemListRequest(
+            [
+                *demand_list.items,
+                *[
+                    ItemRequest(item_name, 0)
+                    for item_name in self._matrix.item_names
+                    if item_name not in requested
+                ],
+            ]
+        )
+
+    def set_item_request(self, item_request: ItemRequest):
+        """Replaces the request of an item, or adds it at the end of the demand list if it is not requested yet.
+
+        Raises :
+        - ValueError : if the item is not contained in any batch
+        """
+
+        items = [
+            item_request if request.name == item_request.name else request
+            for request in self.demand_list
+        ]
+        if item_request.name not in {request.name for request in self.demand_list}:
+            items.append(item_request)
+        self.set_demand(ItemListRequest(items))
+
+    def set_prices(self, prices: dict[str, float] | np.ndarray):
+        """Replaces the base prices of the batches, before the rates are applied.
+        The prices are given by the name of the batches in the optimization ('seller_batch' for a BatchLists),
+        or for all the batches in an array.
+
+        Raises :
+        - KeyError : if a batch is not in the problem
+        - ValueError : if an array does not give one price per batch
+        """
+
+        if isinstance(prices, dict):
+            rows = {name: row for row, name in enumerate(self._keys)}
+            for name, price in prices.items():
+                self._prices[rows[name]] = price
+        else:
+            if len(prices) != len(self._prices):
+                raise ValueError(
+                    f"The prices must be given for each of the {len(self._prices)} batches."
+                )
+            self._prices = np.asarray(prices, dtype=np.float64).copy()
+        self._update_prices()
+
+    def set_rates(
+        self,
+        exchange_rate: float | np.ndarray | int | dict[str, float] | None = None,
+        tax_rate: float | np.ndarray | int | dict[str, float] | None = None,
+        customs_duty: float | np.ndarray | int | dict[str, float] | None = None,
+        transport_fee: float | np.ndarray | int | dict[str, float] | None = None,
+    ):
+        """Replaces the rates given, the other rates are kept."""
+
+        rates = {
+            "exchange_rate": exchange_rate,
+            "tax_rate": tax_rate,
+            "customs_duty": customs_duty,
+            "transport_fee": transport_fee,
+        }
+        self._rates.update(
+            {name: rate for name, rate in rates.items() if rate is not None}
+        )
+        self._update_prices()
+
+
+class BatchProblem(_CompiledProblem):
+    """Problem of minBatchExpense compiled once, which can be modified and solved again.
+
+    The variables, the objective function and the rows of the items are built once.
+    The quantities requested, the prices, the rates, the constraints of the batches and the expense limits
+    are then updated in place, and solve returns the same result as minBatchExpense.
+
+    Args :
+    - the arguments of minBatchExpense
+
+    Raises :
+    - ValueError : if an item requested is not contained in any batch
+    - ValueError : if the maximum_expense is less than the minimum_expense
+
+    Example :
+
+    >>> batches = BatchCollection.from_str(
+    ...     "batch1:10; 5xapple, 10xbanana", "batch2:12; 3xapple, 20xbanana"
+    ... )
+    >>> problem = BatchProblem(batches, ItemListRequest([ItemRequest("apple", 10)]))
+    >>> problem.solve()
+    {'Status': 'Optimal', 'Total cost': 20.0, 'Batch quantities': {'batch1': 2.0, 'batch2': 0.0}}
+    >>> problem.set_item_request(ItemRequest("banana", 100))
+    >>> problem.set_prices({"batch2": 5})
+    >>> problem.solve()
+    {'Status': 'Optimal', 'Total cost': 25.0, 'Batch quantities': {'batch1': 0.0, 'batch2': 5.0}}
+    """
+
+    def __init__(
+        self,
+        batches: BatchCollection | BatchLists | BatchMatrix | SparseBatchMatrix,
+        demand_list: ItemListRequest,
+        category_of_variables: dict[str, str] | str = "Continuous",
+        exchange_rate: float | np.ndarray | int | dict[str, float] = 1,
+        tax_rate: float | np.ndarray | int | dict[str, float] = 0,
+        customs_duty: float | np.ndarray | int | dict[str, float] = 0,
+        transport_fee: float | np.ndarray | int | dict[str, float] = 0,
+        minimum_expense: float | None = None,
+        maximum_expense: float | None = None,
+        batch_constraints: dict[str, tuple[float, float | None]] | None = None,
+    ):
+        super().__init__(
+            batches, demand_list, exchange_rate, tax_rate, customs_duty, transport_fee
+        )
+        self.set_expense_limits(minimum_expense, maximum_expense)
+
+        self._variables = _batch_variables(
+            self._keys, category_of_variables, batch_constraints
+        )
+        self._batch_variables = list(self._variables.values())
+        self._objective = pulp.LpAffineExpression()
+        self._update_prices()
+        self._quantities = {
+            item_name: _item_quantity(self._matrix, self._batch_variables, item_name)
+            for item_name in self._matrix.item_names
+        }
+        self._rows: dict[tuple[str, int, int], pulp.LpConstraint] = {}
+
+    def _update_prices(self):
+        """Applies the new effective prices to the objective function, which is also the expense."""
+
+        for variable, price in zip(
+            self._batch_variables, self._effective_prices().tolist()
+        ):
+            self._objective[variable] = price
+
+    def _row(
+        self, item_name: str, occurrence: int, sense: int, quantity: float
+    ) -> pulp.LpConstraint:
+        """Returns the row of the item, built the first time, with its new right-hand side."""
+
+        key = (item_name, occurrence, sense)
+        if key not in self._rows:
+            self._rows[key] = pulp.LpConstraint(self._quantities[item_name], sense)
+        self._rows[key].constant = -quantity
+        return self._rows[key]
+
+    def set_expense_limits(
+        self, minimum_expense: float | None = None, maximum_expense: float | None = None
+    ):
+        """Replaces the minimum and the maximum expense, None removes the limit.
+
+        Raises :
+        - ValueError : if the maximum_expense is less than the minimum_expense
+        """
+
+        if minimum_expense is not None and maximum_expense is not None:
+            if maximum_expense < minimum_expense:
+                raise ValueError("maximum_expense cannot be less than minimum_expense")
+        self.minimum_expense = minimum_expense
+        self.maximum_expense = maximum_expense
+
+    def set_batch_constraints(
+        self, batch_constraints: dict[str, tuple[float, float | None]] | None = None
+    ):
+        """Replaces the bounds of the quantities of the batches, (0, None) for the batches not given."""
+
+        if batch_constraints is None:
+            batch_constraints = {}
+        for name, variable in self._variables.items():
+            variable.lowBound, variable.upBound = batch_constraints.get(name, (0, None))
+
+    def _solve(self, warm_start: bool = False) -> pulp.LpProblem:
+        """Builds the LpProblem from the compiled rows and solves it.
+        With warm_start, the values of the previous solve are given to CBC as a starting solution.
+        """
+
+        prob = pulp.LpProblem("Primal problem", pulp.LpMinimize)
+        prob += self._objective
+        occurrences: Counter = Counter()
+        for item_request in self._demand:
+            occurrence = occurrences[item_request.name]
+            occurrences[item_request.name] += 1
+            prob += self._row(
+                item_request.name,
+                occurrence,
+                pulp.LpConstraintGE,
+                item_request.minimum_quantity,
+            )
+            if item_request.maximum_quantity:
+                prob += self._row(
+                    item_request.name,
+                    occurrence,
+                    pulp.LpConstraintLE,
+                    item_request.maximum_quantity,
+                )
+        if self.minimum_expense is not None:
+            prob += self._objective >= self.minimum_expense
+        if self.maximum_expense is not None:
+            prob += self._objective <= self.maximum_expense
+        prob.solve(pulp.PULP_CBC_CMD(msg=False, warmStart=warm_start))
+
+        return prob
+
+    def _price_slope(self, prob: pulp.LpProblem, row: int) -> float:
+        """Returns the derivative of the optimal expense with respect to the effective price of a batch,
+        which is the quantity of the batch bought."""
+
+        return self._batch_variables[row].varValue
+
+    def solve(self) -> dict:
+        """Solves the problem and returns the result in the form of minBatchExpense."""
+
+        prob = self._solve()
+        if not _named_by_seller(self._matrix):
+            return _return_minBatchExpense(self._variables, prob)
+        return _return_minBatchExpense(
+            self._variables, prob, self._keys, self._effective_prices()
+        )
+
+
+class DualBatchProblem(_CompiledProblem):
+    """Problem of maxEarnings compiled once, which can be modified and solved again.
+
+    The variables and the rows of the batches are built once.
+    The quantities requested, the prices, the rates, the constraints of the prices and the benefit limits
+    are then updated in place, and solve returns the same result as maxEarnings.
+
+    Args :
+    - the arguments of maxEarnings
+
+    Raises :
+    - ValueError : if an item requested is not contained in any batch
+    - ValueError : if the maximum_benefit is less than the minimum_benefit
+
+    Example :
+
+    >>> batches = BatchCollection.from_str(
+    ...     "batch1:10; 5xapple, 10xbanana", "batch2:12; 3xapple, 20xbanana"
+    ... )
+    >>> problem = DualBatchProblem(batches, ItemListRequest([ItemRequest("apple", 10)]))
+    >>> problem.solve()
+    {'Status': 'Optimal', 'Total benefit': 20.0, 'Item prices': {'apple': 2.0, 'banana': 0.0}}
+    >>> problem.set_prices({"batch1": 5})
+    >>> problem.solve()
+    {'Status': 'Optimal', 'Total benefit': 10.0, 'Item prices': {'apple': 1.0, 'banana': 0.0}}
+    """
+
+    def __init__(
+        self,
+        batches: BatchCollection | BatchLists | BatchMatrix | SparseBatchMatrix,
+        demand_list: ItemListRequest,
+        category_of_variables: dict[str, str] | str = "Continuous",
+        exchange_rate: float | np.ndarray | int | dict[str, float] = 1,
+        tax_rate: float | np.ndarray | int | dict[str, float] = 0,
+        customs_duty: float | np.ndarray | int | dict[str, float] = 0,
+        transport_fee: float | np.ndarray | int | dict[str, float] = 0,
+        minimum_benefit: float | None = None,
+        maximum_benefit: float | None = None,
+        price_constraints: dict[str, tuple[float, float | None]] | None = None,
+    ):
+        super().__init__(
+            batches, demand_list, exchange_rate, tax_rate, customs_duty, transport_fee
+        )
+        self.set_benefit_limits(minimum_benefit, maximum_benefit)
+
+        self._variables = _generate_variable_dual(
+            demand_list=self._demand,
+            cat=category_of_variables,
+            price_constraints=price_constraints,
+        )
+        self._rows = list(
+            _generate_dual_constraints(
+                variables=self._variables,
+                batch_list=None,
+                demand_list=self._demand,
+                matrix=self._matrix,
+            ).values()
+        )
+        self._update_prices()
+
+    def _update_prices(self):
+        """Applies the new effective prices to the right-hand sides of the batches."""
+
+        for row, price in zip(self._rows, self._effective_prices().tolist()):
+            row.constant = -price
+
+    def set_benefit_limits(
+        self, minimum_benefit: float | None = None, maximum_benefit: float | None = None
+    ):
+        """Replaces the minimum and the maximum benefit, None removes the limit.
+
+        Raises :
+        - ValueError : if the maximum_benefit is less than the minimum_benefit
+        """
+
+        if minimum_benefit is not None and maximum_benefit is not None:
+            if maximum_benefit < minimum_benefit:
+                raise ValueError("maximum_benefit cannot be less than minimum_benefit")
+        self.minimum_benefit = minimum_benefit
+        self.maximum_benefit = maximum_benefit
+
+    def set_price_constraints(
+        self, price_constraints: dict[str, tuple[float, float | None]] | None = None
+    ):
+        """Replaces the bounds of the prices of the items, (0, None) for the items not given."""
+
+        if price_constraints is None:
+            price_constraints = {}
+        for name, variable in self._variables.items():
+            variable.lowBound, variable.upBound = price_constraints.get(name, (0, None))
+
+    def _solve(self, warm_start: bool = False) -> pulp.LpProblem:
+        """Builds the LpProblem from the compiled rows and solves it.
+        With warm_start, the values of the previous solve are given to CBC as a starting solution.
+        """
+
+        prob = pulp.LpProblem("Dual problem", pulp.LpMaximize)
+        prob += _generate_dual_objective_function(self._variables, self._demand)
+        for row in self._rows:
+            prob += row
+        prob = _apply_benefit_constraints(
+            demand_list=self._demand,
+            variables=self._variables,
+            constraints=prob,
+            minimum_benefit=self.minimum_benefit,
+            maximum_benefit=self.maximum_benefit,
+        )
+        prob.solve(pulp.PULP_CBC_CMD(msg=False, warmStart=warm_start))
+
+        return prob
+
+    def _price_slope(self, prob: pulp.LpProblem, row: int) -> float:
+        """Returns the derivative of the optimal benefit with respect to the effective price of a batch,
+        which is the shadow price of its row."""
+
+        return self._rows[row].pi
+
+    def solve(self) -> dict:
+        """Solves the problem and returns the result in the form of maxEarnings."""
+
+        return _return_maxEarnings(
+            variables=self._variables, demand_list=self._demand, prob=self._solve()
+        )
+
+
+_worker_problem: _CompiledProblem | None = None
+
+
+def _init_worker(problem: _CompiledProblem):
+    """Keeps the compiled problem in the worker process, inherited without copy when the process is forked."""
+
+    global _worker_problem
+    _worker_problem = problem
+
+
+def _solve_scenario(problem: _CompiledProblem, demand_list: ItemListRequest) -> dict:
+    """Solves the compiled problem for a demand list.
+    An error of the scenario is returned with the status 'Error' instead of being raised.
+    """
+
+    try:
+        problem.set_demand(demand_list)
+        return problem.solve()
+    except Exception as error:
+        return {"Status": "Error", "Error": f"{type(error).__name__}: {error}"}
+
+
+def _solve_in_worker(demand_list: ItemListRequest) -> dict:
+    """Solves the compiled problem of the worker process for a demand list."""
+
+    return _solve_scenario(_worker_problem, demand_list)  # type: ignore[arg-type]
+
+
+def solve_many(
+    batches: BatchCollection | BatchLists | BatchMatrix | SparseBatchMatrix,
+    demands: Iterable[ItemListRequest],
+    workers: int = 1,
+    dual: bool = False,
+    **kwargs,
+) -> Iterator[dict]:
+    """Solves the problem of minBatchExpense, or of maxEarnings if dual is True, for each demand list,
+    against the same catalog.
+
+    The catalog is prepared and the problem compiled once. With several workers, the scenarios are solved
+    in a pool of processes which inherit the compiled problem : the processes are forked when the platform
+    allows it, else the problem is sent once to each of them.
+    The results are yielded as soon as they are available, in the order of the demand lists.
+    The demand lists are read as the scenarios are solved, with at most two per process waiting for a result.
+
+    Args :
+    - batches : BatchCollection | BatchLists | BatchMatrix | SparseBatchMatrix : the catalog
+    - demands : Iterable[ItemListRequest] : the demand lists, a generator is not drained in advance
+    - workers : int : number of processes, 1 solves the scenarios in the current process
+    - dual : bool : solves the problem of maxEarnings instead of minBatchExpense
+    - **kwargs : the other arguments of minBatchExpense, or of maxEarnings if dual is True
+
+    Returns :
+    - Iterator[dict] : the result of each demand list, in the form of minBatchExpense or maxEarnings.
+    The errors of a demand list, for example an item not contained in any batch, are returned as
+    {'Status': 'Error', 'Error': 'ValueError: ...'} and do not stop the other scenarios.
+
+    Raises :
+    - ValueError : if workers is less than 1
+
+    The arguments are checked and the problem compiled when solve_many is called,
+    before the first result is requested.
+
+    Example :
+
+    >>> batches = BatchCollection.from_str(
+    ...     "batch1:10; 5xapple, 10xbanana", "batch2:12; 3xapple, 20xbanana"
+    ... )
+    >>> demands = [
+    ...     ItemListRequest([ItemRequest("apple", 10)]),
+    ...     ItemListRequest([ItemRequest("cherry", 1)]),
+    ... ]
+    >>> list(solve_many(batches, demands, workers=2))
+    [{'Status': 'Optimal', 'Total cost': 20.0, 'Batch quantities': {'batch1': 2.0, 'batch2': 0.0}}, {'Status': 'Error', 'Error': 'ValueError: An item requested is not contained in any batch.'}]
+    """
+
+    if workers < 1:
+        raise ValueError("The number of workers must be at least 1.")
+
+    compiled_problem = DualBatchProblem if dual else BatchProblem
+    problem = compiled_problem(batches, ItemListRequest([]), **kwargs)
+    return _solve_scenarios(problem, demands, workers)
+
+
+def _solve_scenarios(
+    problem: _CompiledProblem, demands: Iterable[ItemListRequest], workers: int
+) -> Iterator[dict]:
+    """Yields the result of the compiled problem for each demand list, see solve_many.
+    With several workers, the demand lists are sent to a pool of processes, with at most two per process in flight.
+    """
+
+    if workers == 1:
+        for demand_list in demands:
+            yield _solve_scenario(problem, demand_list)
+        return
+
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    window = 2 * workers
+    pending: deque = deque()
+    with context.Pool(workers, initializer=_init_worker, initargs=(problem,)) as pool:
+        for demand_list in demands:
+            pending.append(pool.apply_async(_solve_in_worker, (demand_list,)))
+            if len(pending) >= window:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+
+
+@dataclass(eq=False)
+class PriceSweep:
+    """Result of price_sweep : the optimal objectives of both problems for each price of a batch.
+
+    Attributes :
+    - batch : str : name of the batch in the optimization ('seller_batch' for a BatchLists)
+    - prices : np.ndarray : base prices of the batch, before the rates are applied
+    - primal_objective : np.ndarray : total cost of minBatchExpense for each price, nan if it is not optimal
+    - dual_objective : np.ndarray : total benefit of maxEarnings for each price, nan if it is not optimal
+    - batch_quantity : np.ndarray : quantity of the batch bought in the primal problem for each price
+    - primal_breakpoints : np.ndarray : prices where the optimal solution of the primal problem changes
+    - dual_breakpoints : np.ndarray : prices where the optimal solution of the dual problem changes
+    - solves : int : number of problems solved
+    """
+
+    batch: str
+    prices: np.ndarray
+    primal_objective: np.ndarray
+    dual_objective: np.ndarray
+    batch_quantity: np.ndarray
+    primal_breakpoints: np.ndarray
+    dual_breakpoints: np.ndarray
+    solves: int
+
+
+def _sweep_point(
+    problem: _CompiledProblem, row: int, price: float, warm_start: bool = False
+) -> tuple[float, float] | None:
+    """Solves the problem for a base price of the batch and returns the optimal objective
+    and its derivative with respect to the effective price, or None if the problem is not optimal.
+    """
+
+    problem._prices[row] = price
+    problem._update_prices()
+    prob = problem._solve(warm_start)
+    if pulp.LpStatus[prob.status] != "Optimal":
+        return None
+    return pulp.value(prob.objective) or 0.0, problem._price_slope(prob, row) or 0.0
+
+
+def _parametric_sweep(
+    problem: _CompiledProblem, row: int, low: float, high: float
+) -> tuple[np.ndarray, list[float], int] | None:
+    """Computes the optimal objective of the problem on [low, high] as the minimum of lines, one per optimal solution.
+
+    The optimal objective is concave and piecewise linear in the price of the batch, and each solve gives the line
+    of its optimal solution, which is above the objective and tangent at the price solved.
+    The lines at both ends are intersected, and the intersection is solved : if the objective is on the lines,
+    the intersection is a breakpoint, else the new line splits the interval in two.
+    Each breakpoint therefore costs two solves, whatever the number of prices.
+
+    Returns the (slope, intercept, derivative) of each line, the breakpoints and the number of solves,
+    or None if a solve is not optimal.
+    """
+
+    factor = problem._price_factor(row)
+    lines: list[tuple[float, float, float]] = []
+
+    def solve_line(price: float) -> tuple[float, float, float] | None:
+        point = _sweep_point(problem, row, price)
+        if point is None:
+            return None
+        value, derivative = point
+        slope = derivative * factor
+        lines.append((slope, value - slope * price, derivative))
+        return lines[-1]
+
+    first, last = solve_line(low), solve_line(high)
+    if first is None or last is None:
+        return None
+    breakpoints = []
+    intervals = [(low, first, high, last)]
+    while intervals:
+        start, left, end, right = intervals.pop()
+        tolerance = 1e-6 * max(1.0, abs(left[0] * end + left[1]))
+        if abs(left[0] - right[0]) * (end - start) <= tolerance:
+            continue
+        price = (right[1] - left[1]) / (left[0] - right[0])
+        if not start < price < end:
+            continue
+        middle = solve_line(price)
+        if middle is None:
+            return None
+        if middle[0] * price + middle[1] >= left[0] * price + left[1] - tolerance:
+            breakpoints.append(price)
+        elif min(price - start, end - price) > tolerance:
+            intervals += [(start, left, price, middle), (price, middle, end, right)]
+
+    return np.array(lines), sorted(breakpoints), len(lines)
+
+
+def _same_solution(first: np.ndarray | None, second: np.ndarray | None) -> bool:
+    """Checks if two solutions are equal, None standing for a problem which is not optimal."""
+
+    if first is None or second is None:
+        return first is second
+    return np.allclose(first, second)
+
+
+def _grid_sweep(
+    problem: _CompiledProblem, row: int, prices: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, list[float], int]:
+    """Solves the problem for each price, in increasing order, each solve starting from the previous solution
+    when the problem has integer variables. The breakpoints are the prices of the grid where the values
+    of the variables change.
+
+    Returns the objective and its derivative for each price, the breakpoints and the number of solves.
+    """
+
+    variables = list(problem._variables.values())  # type: ignore[attr-defined]
+    warm_start = any(variable.cat != pulp.LpContinuous for variable in variables)
+    values = np.full(len(prices), np.nan)
+    derivatives = np.full(len(prices), np.nan)
+    breakpoints = []
+    previous: np.ndarray | None = None
+    for position, index in enumerate(np.argsort(prices, kind="stable").tolist()):
+        point = _sweep_point(problem, row, float(prices[index]), warm_start)
+        solution = None
+        if point is not None:
+            values[index], derivatives[index] = point
+            solution = np.array([variable.varValue or 0.0 for variable in variables])
+        if position > 0 and not _same_solution(previous, solution):
+            breakpoints.append(float(prices[index]))
+        previous = solution
+
+    return values, derivatives, breakpoints, len(prices)
+
+
+def _sweep(
+    problem: _CompiledProblem, row: int, prices: np.ndarray, parametric: bool
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    """Returns the optimal objective and its derivative for each price, the breakpoints and the number of solves.
+    The sweep is parametric if the objective is concave in the price, else each price is solved.
+    """
+
+    if parametric:
+        sweep = _parametric_sweep(
+            problem, row, float(prices.min()), float(prices.max())
+        )
+        if sweep is not None:
+            lines, breakpoints, solves = sweep
+            values = lines[:, 1, None] + lines[:, 0, None] * prices[None, :]
+            active = values.argmin(axis=0)
+            return (
+                values[active, np.arange(len(prices))],
+                lines[active, 2],
+                np.array(breakpoints),
+                solves,
+            )
+    values, derivatives, breakpoints, solves = _grid_sweep(problem, row, prices)
+
+    return values, derivatives, np.array(breakpoints), solves
+
+
+def price_sweep(
+    batches: BatchCollection | BatchLists | BatchMatrix | SparseBatchMatrix,
+    demand_list: ItemListRequest,
+    batch: str,
+    prices: np.ndarray | list[float],
+    category_of_variables: dict[str, str] | str = "Continuous",
+    exchange_rate: float | np.ndarray | int | dict[str, float] = 1,
+    tax_rate: float | np.ndarray | int | dict[str, float] = 0,
+    customs_duty: float | np.ndarray | int | dict[str, float] = 0,
+    transport_fee: float | np.ndarray | int | dict[str, float] = 0,
+    minimum_expense: float | None = None,
+    maximum_expense: float | None = None,
+    batch_constraints: dict[str, tuple[float, float | None]] | None = None,
+    minimum_benefit: float | None = None,
+    maximum_benefit: float | None = None,
+    price_constraints: dict[str, tuple[float, float | None]] | None = None,
+) -> PriceSweep:
+    """Studies the impact of the price of a batch on the problems of minBatchExpense and maxEarnings.
+
+    Each problem is compiled once, only the price of the batch changes between the solves.
+    The optimal expense is concave and piecewise linear in the price of the batch, and so is the optimal benefit
+    when its variables are continuous : the breakpoints, where the optimal solution changes, are searched
+    between the lowest and the highest price, with two solves per breakpoint, and the objective of each price
+    is computed from the lines of the optimal solutions found.
+    With expense limits, which depend on the price, or an integer dual problem, each price is solved instead,
+    starting from the previous solution for the integer problems, and the breakpoints are located on the prices given.
+
+    Args :
+    - batches, demand_list : the catalog and the demand list, like minBatchExpense and maxEarnings
+    - batch : str : name of the batch in the optimization ('seller_batch' for a BatchLists)
+    - prices : np.ndarray | list[float] : base prices of the batch, before the rates are applied
+    - category_of_variables, the rates : the arguments shared by minBatchExpense and maxEarnings
+    - minimum_expense, maximum_expense, batch_constraints : the arguments of minBatchExpense
+    - minimum_benefit, maximum_benefit, price_constraints : the arguments of maxEarnings
+
+    Returns :
+    - PriceSweep : the objectives of both problems and the quantity of the batch bought for each price,
+    with the breakpoints of both problems
+
+    Raises :
+    - KeyError : if the batch is not in the catalog
+    - ValueError : if a price is negative, or if the prices are empty
+
+    Example :
+
+    >>> batches = BatchCollection.from_str(
+    ...     "batch1:10; 5xapple, 10xbanana", "batch2:12; 3xapple, 20xbanana"
+    ... )
+    >>> sweep = price_sweep(
+    ...     batches, ItemListRequest([ItemRequest("apple", 15), ItemRequest("banana", 60)]),
+    ...     batch="batch1", prices=np.linspace(0, 40, 5)
+    ... )
+    >>> np.round(sweep.primal_objective, 4)
+    array([ 0.    , 42.8571, 60.    , 60.    , 60.    ])
+    >>> np.round(sweep.batch_quantity, 4)
+    array([6.    , 1.7143, 1.7143, 0.    , 0.    ])
+    >>> np.round(sweep.primal_breakpoints, 4)
+    array([ 6., 20.])
+    >>> sweep.solves
+    10
+    """
+
+    prices = np.asarray(prices, dtype=np.float64)
+    if len(prices) == 0:
+        raise ValueError("The prices of the batch must be given.")
+    if (prices < 0).any():
+        raise ValueError("The prices of the batch must be positive or zero.")
+
+    primal = BatchProblem(
+        batches,
+        demand_list,
+        category_of_variables,
+        exchange_rate,
+        tax_rate,
+        customs_duty,
+        transport_fee,
+        minimum_expense,
+        maximum_expense,
+        batch_constraints,
+    )
+    dual = DualBatchProblem(
+        batches,
+        demand_list,
+        category_of_variables,
+        exchange_rate,
+        tax_rate,
+        customs_duty,
+        transport_fee,
+        minimum_benefit,
+        maximum_benefit,
+        price_constraints,
+    )
+    if batch not in primal._keys:
+        raise KeyError(f"The batch '{batch}' is not in the catalog.")
+    row = list(primal._keys).index(batch)
+
+    primal_objective, batch_quantity, primal_breakpoints, primal_solves = _sweep(
+        primal,
+        row,
+        prices,
+        parametric=minimum_expense is None and maximum_expense is None,
+    )
+    dual_objective, _, dual_breakpoints, dual_solves = _sweep(
+        dual,
+        row,
+        prices,
+        parametric=all(
+            variable.cat == pulp.LpContinuous for variable in dual._variables.values()
+        ),
+    )
+
+    return PriceSweep(
+        batch=batch,
+        prices=prices,
+        primal_objective=primal_objective,
+        dual_objective=dual_objective,
+        batch_quantity=batch_quantity,
+        primal_breakpoints=primal_breakpoints,
+        dual_breakpoints=dual_breakpoints,
+        solves=primal_solves + dual_solves,
+    )
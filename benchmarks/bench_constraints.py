@@ -0,0 +1,158 @@
+"""Description:
+
+Benchmark of the generation of the constraints of the primal and dual problems.
+
+Generates the demand rows of the primal problem and the batch rows of the dual problem of the same catalog
+with the previous implementation (each demand row reads every item of every batch)
+and with the item incidence of the package (a SparseBatchMatrix built once),
+checks that the constraints are the same and prints the time taken by each of them.
+
+You can run this benchmark with the following command:
+    python -m benchmarks.bench_constraints --batches 3000 --items 8000
+"""
+
+import argparse
+import random
+import time
+import warnings
+
+import pulp
+
+from BatchMonitor import Batch, BatchCollection, Item_in_batch, ItemListRequest
+from BatchMonitor.lib_optimization import (
+    _addition_of_unrequested_item,
+    _generate_dual_constraints,
+    _generate_primal_constraints,
+    _generate_variable_dual,
+    _generate_variables_primal,
+)
+
+
+def build_problem(
+    batches: int, items: int, items_per_batch: int
+) -> tuple[BatchCollection, ItemListRequest]:
+    """Builds a catalog of random batches and a demand list requesting all of its items."""
+
+    generator = random.Random(0)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        batch_collection = BatchCollection.from_batches(
+            Batch(
+                f"batch {index}",
+                float(generator.randint(1, 100)),
+                [
+                    Item_in_batch(f"item {item}", float(generator.randint(1, 10)))
+                    for item in generator.sample(range(items), items_per_batch)
+                ],
+            )
+            for index in range(batches)
+        )
+    return batch_collection, _addition_of_unrequested_item(
+        batch_collection, ItemListRequest([])
+    )
+
+
+def previous_primal_constraints(variables, batches, demand_list) -> dict:
+    """Previous implementation of the demand rows of _generate_primal_constraints."""
+
+    prob = pulp.LpProblem("Primal problem", pulp.LpMinimize)
+    for item_request in demand_list:
+        prob += (
+            pulp.lpSum(
+                [
+                    item.quantity_in_batch * variables[batch.name]
+                    for batch in batches
+                    for item in batch
+                    if item.name == item_request.name
+                ]
+            )
+            >= item_request.minimum_quantity
+        )
+        if item_request.maximum_quantity:
+            prob += (
+                pulp.lpSum(
+                    [
+                        item.quantity_in_batch * variables[batch.name]
+                        for batch in batches
+                        for item in batch
+                        if item.name == item_request.name
+                    ]
+                )
+                <= item_request.maximum_quantity
+            )
+    return prob.constraints
+
+
+def previous_dual_constraints(variables, batches) -> dict:
+    """Previous implementation of the batch rows of _generate_dual_constraints."""
+
+    prob = pulp.LpProblem("Dual problem", pulp.LpMaximize)
+    for batch in batches:
+        prob += (
+            pulp.lpSum(
+                [item.quantity_in_batch * variables[item.name] for item in batch]
+            )
+            <= batch.price
+        )
+    return prob.constraints
+
+
+def rows(constraints: dict) -> list:
+    """Returns the coefficients, the sense and the constant of each constraint, to compare them."""
+
+    return [
+        (
+            {variable.name: coefficient for variable, coefficient in row.items()},
+            row.sense,
+            row.constant,
+        )
+        for row in constraints.values()
+    ]
+
+
+def timed(function, *args, **kwargs) -> tuple[float, object]:
+    """Returns the time taken by the call, in seconds, and its result."""
+
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batches", type=int, default=3000)
+    parser.add_argument("--items", type=int, default=8000)
+    parser.add_argument("--items-per-batch", type=int, default=30)
+    parser.add_argument("--skip-previous", action="store_true")
+    args = parser.parse_args()
+
+    batches, demand_list = build_problem(args.batches, args.items, args.items_per_batch)
+    primal_variables = _generate_variables_primal(batches)
+    dual_variables = _generate_variable_dual(demand_list)
+
+    primal, primal_rows = timed(
+        _generate_primal_constraints, primal_variables, batches, demand_list
+    )
+    dual, dual_rows = timed(
+        _generate_dual_constraints, dual_variables, batches, demand_list
+    )
+    print(f"{args.batches} batches, {len(demand_list)} requested items")
+    print(f"primal constraints : {primal:8.2f} s")
+    print(f"dual constraints   : {dual:8.2f} s")
+
+    if not args.skip_previous:
+        previous_primal, previous_primal_rows = timed(
+            previous_primal_constraints, primal_variables, batches, demand_list
+        )
+        previous_dual, previous_dual_rows = timed(
+            previous_dual_constraints, dual_variables, batches
+        )
+        assert rows(primal_rows) == rows(previous_primal_rows)
+        assert rows(dual_rows) == rows(previous_dual_rows)
+        print(f"previous primal    : {previous_primal:8.2f} s")
+        print(f"previous dual      : {previous_dual:8.2f} s")
+        print(f"primal speed-up    : {previous_primal / primal:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
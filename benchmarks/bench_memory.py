@@ -0,0 +1,84 @@
+"""Description:
+
+Memory benchmark of the catalog records.
+
+Builds the same catalog with the slotted Item_in_batch and Batch classes of the package
+and with plain dataclasses equivalent to their previous layout (one __dict__ per instance,
+names not interned), and prints the memory allocated for each of them.
+
+You can run this benchmark with the following command:
+    python -m benchmarks.bench_memory --lines 1000000
+"""
+
+import argparse
+import gc
+import tracemalloc
+from dataclasses import dataclass, field
+
+from BatchMonitor import Batch, Item_in_batch
+
+
+@dataclass
+class DictItem:
+    """Previous layout of Item_in_batch."""
+
+    name: str
+    quantity_in_batch: float | int
+
+
+@dataclass
+class DictBatch:
+    """Previous layout of Batch."""
+
+    name: str
+    price: float | int
+    items: list[DictItem] = field(default_factory=list)
+
+
+def build_catalog(
+    batch_class: type, item_class: type, lines: int, items_per_batch: int
+) -> list:
+    """Builds a catalog of `lines` item lines, the names are built at runtime like a parser would do."""
+
+    return [
+        batch_class(
+            f"batch {index}",
+            float(index),
+            [
+                item_class("item " + str((index + position) % 5000), 1.0)
+                for position in range(items_per_batch)
+            ],
+        )
+        for index in range(lines // items_per_batch)
+    ]
+
+
+def measure(batch_class: type, item_class: type, lines: int, items_per_batch: int):
+    """Returns the memory allocated by the catalog, in MB."""
+
+    gc.collect()
+    tracemalloc.start()
+    catalog = build_catalog(batch_class, item_class, lines, items_per_batch)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del catalog
+    return size / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=1_000_000)
+    parser.add_argument("--items-per-batch", type=int, default=20)
+    args = parser.parse_args()
+
+    before = measure(DictBatch, DictItem, args.lines, args.items_per_batch)
+    after = measure(Batch, Item_in_batch, args.lines, args.items_per_batch)
+
+    print(f"Catalog of {args.lines} item lines")
+    print(f"dict dataclasses, names not interned : {before:8.1f} MB")
+    print(f"slotted dataclasses, interned names  : {after:8.1f} MB")
+    print(f"ratio                                : {before / after:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Description:
+
+Benchmark of the price sweep of a batch.
+
+Solves minBatchExpense and maxEarnings for each price of a batch, like a loop over the prices would do,
+and computes the same objectives with price_sweep, checks that they are equal
+and prints the time and the number of solves of each of them.
+
+You can run this benchmark with the following command:
+    python -m benchmarks.bench_price_sweep --batches 300 --items 200 --prices 100
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from BatchMonitor import maxEarnings, minBatchExpense, price_sweep
+
+from .bench_resolve import build_catalog, demand_lists
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batches", type=int, default=300)
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--items-per-batch", type=int, default=10)
+    parser.add_argument("--requested", type=int, default=30)
+    parser.add_argument("--prices", type=int, default=100)
+    args = parser.parse_args()
+
+    catalog = build_catalog(args.batches, args.items, args.items_per_batch)
+    demand_list = demand_lists(catalog, 1, args.requested)[0]
+    batch = catalog[0].name
+    prices = np.linspace(0, 2 * catalog[0].price, args.prices)
+
+    start = time.perf_counter()
+    primal, dual = [], []
+    for price in prices:
+        catalog[0].price = float(price)
+        primal.append(minBatchExpense(catalog, demand_list)["Total cost"])
+        dual.append(maxEarnings(catalog, demand_list)["Total benefit"])
+    loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sweep = price_sweep(catalog, demand_list, batch=batch, prices=prices)
+    swept = time.perf_counter() - start
+
+    assert np.allclose(sweep.primal_objective, primal, rtol=1e-6)
+    assert np.allclose(sweep.dual_objective, dual, rtol=1e-6)
+    print(f"{args.prices} prices of a batch, {args.batches} batches")
+    print(f"loop over the prices : {loop:8.2f} s, {2 * args.prices} solves")
+    print(f"price_sweep          : {swept:8.2f} s, {sweep.solves} solves")
+    print(f"breakpoints          : {len(sweep.primal_breakpoints)} (primal)")
+
+
+if __name__ == "__main__":
+    main()
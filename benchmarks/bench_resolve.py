@@ -0,0 +1,96 @@
+"""Description:
+
+Benchmark of the re-solve of a compiled problem.
+
+Solves the same catalog for several demand lists with minBatchExpense, which builds the problem at each call,
+with a BatchProblem compiled once whose quantities requested are updated in place,
+and with solve_many in a pool of processes, checks that the results are identical
+and prints the time of each of them.
+
+You can run this benchmark with the following command:
+    python -m benchmarks.bench_resolve --batches 2000 --items 3000 --solves 20 --workers 4
+"""
+
+import argparse
+import random
+import time
+
+from BatchMonitor import (
+    BatchCollection,
+    BatchProblem,
+    ItemListRequest,
+    ItemRequest,
+    minBatchExpense,
+    solve_many,
+)
+
+
+def build_catalog(batches: int, items: int, items_per_batch: int) -> BatchCollection:
+    """Builds a catalog where each batch holds a few random items of the universe."""
+
+    random.seed(0)
+    return BatchCollection.from_str(
+        *[
+            f"batch {index}:{random.randint(1, 100)}; "
+            + ", ".join(
+                f"{random.randint(1, 10)}xitem {item}"
+                for item in random.sample(range(items), items_per_batch)
+            )
+            for index in range(batches)
+        ],
+        seller="seller",
+    )
+
+
+def demand_lists(
+    catalog: BatchCollection, solves: int, requested: int
+) -> list[ItemListRequest]:
+    """Returns the demand lists of the solves, on the same requested items."""
+
+    item_names = sorted({item.name for batch in catalog for item in batch})[:requested]
+    return [
+        ItemListRequest(
+            [ItemRequest(item_name, random.randint(1, 50)) for item_name in item_names]
+        )
+        for _ in range(solves)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batches", type=int, default=2000)
+    parser.add_argument("--items", type=int, default=3000)
+    parser.add_argument("--items-per-batch", type=int, default=20)
+    parser.add_argument("--requested", type=int, default=50)
+    parser.add_argument("--solves", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    catalog = build_catalog(args.batches, args.items, args.items_per_batch)
+    demands = demand_lists(catalog, args.solves, args.requested)
+
+    start = time.perf_counter()
+    before = [minBatchExpense(catalog, demand) for demand in demands]
+    rebuilt = time.perf_counter() - start
+
+    start = time.perf_counter()
+    problem = BatchProblem(catalog, demands[0])
+    after = []
+    for demand in demands:
+        problem.set_demand(demand)
+        after.append(problem.solve())
+    compiled = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pooled = list(solve_many(catalog, demands, workers=args.workers))
+    parallel = time.perf_counter() - start
+
+    assert before == after == pooled
+    print(f"{args.solves} solves of {args.batches} batches and {args.items} items")
+    print(f"minBatchExpense at each solve : {rebuilt:8.2f} s")
+    print(f"BatchProblem compiled once    : {compiled:8.2f} s")
+    print(f"{f'solve_many, {args.workers} workers':30}: {parallel:8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Description:
+
+Throughput benchmark of the JSON serialization of a BatchLists object.
+
+Writes the same catalog with the previous encoder of to_json (one Python callback per object,
+indented output) and with the compact encoder of the package, with and without the sparse layout
+(item vocabulary per seller), then loads the compact files back, and prints the time taken and the size of each file.
+
+You can run this benchmark with the following command:
+    python -m benchmarks.bench_serialization --items 1000000
+"""
+
+import argparse
+import json
+import os
+import time
+import warnings
+from dataclasses import fields
+
+from BatchMonitor import Batch, BatchCollection, BatchLists, Item_in_batch
+
+
+def previous_default(obj: object) -> dict:
+    """Previous json callback of to_json, called for every object of the catalog."""
+
+    return {
+        attribute.name: getattr(obj, attribute.name)
+        for attribute in fields(obj)  # type: ignore[arg-type]
+        if not attribute.name.startswith("_")
+    }
+
+
+def build_catalog(items: int, items_per_batch: int, sellers: int) -> BatchLists:
+    """Builds a catalog of `items` item lines shared between the sellers."""
+
+    batches_per_seller = items // items_per_batch // sellers
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return BatchLists(
+            [
+                BatchCollection.from_batches(
+                    (
+                        Batch(
+                            f"batch {index}",
+                            float(index),
+                            [
+                                Item_in_batch(
+                                    "item " + str((index + position) % 5000), 1.0
+                                )
+                                for position in range(items_per_batch)
+                            ],
+                        )
+                        for index in range(batches_per_seller)
+                    ),
+                    seller=f"seller {seller}",
+                )
+                for seller in range(sellers)
+            ]
+        )
+
+
+def timed(function, *args, **kwargs) -> float:
+    """Returns the time taken by the call, in seconds."""
+
+    start = time.perf_counter()
+    function(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def previous_to_json(batch_lists: BatchLists, path: str) -> None:
+    """Previous implementation of BatchLists.to_json."""
+
+    with open(path, "w") as file:
+        json.dump(batch_lists.batchlists, file, default=previous_default, indent=4)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=1_000_000)
+    parser.add_argument("--items-per-batch", type=int, default=20)
+    parser.add_argument("--sellers", type=int, default=20)
+    args = parser.parse_args()
+
+    catalog = build_catalog(args.items, args.items_per_batch, args.sellers)
+
+    before = timed(previous_to_json, catalog, "bench_previous.json")
+    dense = timed(catalog.to_json, "bench_dense.json", compact=True, sparse=False)
+    after = timed(catalog.to_json, "bench_compact.json", compact=True)
+    dense_loading = timed(BatchLists.from_json, "bench_dense.json")
+    loading = timed(BatchLists.from_json, "bench_compact.json")
+    before_size = os.path.getsize("bench_previous.json") / 1e6
+    dense_size = os.path.getsize("bench_dense.json") / 1e6
+    after_size = os.path.getsize("bench_compact.json") / 1e6
+    os.remove("bench_previous.json")
+    os.remove("bench_dense.json")
+    os.remove("bench_compact.json")
+
+    print(f"Catalog of {args.items} item lines")
+    print(f"previous to_json        : {before:6.2f} s, {before_size:7.1f} MB")
+    print(f"compact dense to_json   : {dense:6.2f} s, {dense_size:7.1f} MB")
+    print(f"compact sparse to_json  : {after:6.2f} s, {after_size:7.1f} MB")
+    print(f"speed-up                : {before / after:6.2f}")
+    print(f"compact dense from_json : {dense_loading:6.2f} s")
+    print(f"compact sparse from_json: {loading:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,9 @@
 Tests for the batch dataclass.
 """
 
+import copy
 import os
+import pickle
 import sys
 import pytest
 
@@ -382,3 +384,64 @@ def test_are_equal_Batch(batch_fixture):
         Batch.from_str("batch 1:1; 1xapple, 2xbanana, 3xorange")
     )
     assert not batch_fixture.are_equal(Batch.from_str("batch 1:1; 1xapple, 2xbanana"))
+
+
+def test_index_updated_Batch(batch_fixture):
+    """Test of the item index of Batch after add_item, remove_item and sort"""
+
+    batch_fixture.add_item(Item_in_batch("kiwi", 0.5))
+    assert batch_fixture.find_item("kiwi") == 3
+    batch_fixture.sort(by="quantity")
+    assert batch_fixture.find_item("kiwi") == 0
+    assert batch_fixture.find_item("orange") == 3
+    batch_fixture.remove_item(item_name="kiwi")
+    assert "kiwi" not in batch_fixture
+    assert batch_fixture.find_item("orange") == 2
+    batch_fixture.items.append(Item_in_batch("cherries", 4.0))
+    assert "cherries" in batch_fixture
+    assert batch_fixture.find_item("cherries") == 3
+
+
+def test_index_in_place_edit_Batch(batch_fixture):
+    """Test of the item index of Batch after the list of items is edited in place"""
+
+    batch_fixture.items[0] = Item_in_batch("kiwi", 1)
+    assert "kiwi" in batch_fixture
+    assert "apple" not in batch_fixture
+    assert batch_fixture.find_item("kiwi") == 0
+    assert batch_fixture["kiwi"] == 1
+    batch_fixture.items[1], batch_fixture.items[2] = (
+        batch_fixture.items[2],
+        batch_fixture.items[1],
+    )
+    assert batch_fixture.find_item("orange") == 1
+    assert batch_fixture.find_item("banana") == 2
+
+    index = batch_fixture._index
+    assert "cherry" not in batch_fixture
+    assert batch_fixture._index is index
+    batch_fixture.items.append(Item_in_batch("cherry", 4))
+    assert batch_fixture["cherry"] == 4
+    del batch_fixture.items[0]
+    assert "kiwi" not in batch_fixture
+    batch_fixture.items = [Item_in_batch("melon", 5)]
+    assert batch_fixture.find_item("melon") == 0
+    assert "orange" not in batch_fixture
+    assert copy.deepcopy(batch_fixture)["melon"] == 5
+    assert pickle.loads(pickle.dumps(batch_fixture)) == batch_fixture
+
+
+def test_freeze_Batch(batch_fixture):
+    """Test of the freeze method of the Batch class"""
+
+    frozen_batch = batch_fixture.freeze()
+
+    assert frozen_batch.items == (("apple", 1.0), ("banana", 2.0), ("orange", 3.0))
+    assert hash(frozen_batch) == hash(batch_fixture.freeze())
+    assert frozen_batch.fingerprint == batch_fixture.freeze().fingerprint
+    assert frozen_batch.thaw() == batch_fixture
+    with pytest.raises(AttributeError):
+        frozen_batch.price = 2.0
+    batch_fixture.price = 2.0
+    assert frozen_batch.price == 1.0
+    assert frozen_batch.fingerprint != batch_fixture.freeze().fingerprint
@@ -87,7 +87,7 @@ def test_remove_null_item_in_all_batches():
 def test_raise_warning_incomplete_batch():
     """Test of the BatchCollection warning class with incomplete batches"""
 
-    with pytest.warns(UserWarning):
+    with pytest.warns(UserWarning, match="implicit quantity of 0"):
         BatchCollection(
             [
                 Batch.from_str("lot1:1; 2xapple, 3xcherries, 0xkiwi"),
@@ -490,3 +490,62 @@ def test_error_to_json_batchCollection():
 
     with pytest.raises(Exception):
         BatchCollection.to_json(path="ddddddddddddddd")
+
+
+def test_sparse_items_BatchCollection(batch_collection_fixture):
+    """Test of the universe of items of the BatchCollection class"""
+
+    assert batch_collection_fixture.item_names == [
+        "apple",
+        "banana",
+        "kiwi",
+        "pineapple",
+        "cherries",
+    ]
+    first_batch = batch_collection_fixture[0]
+    assert isinstance(first_batch, Batch)
+    assert len(first_batch) == 3
+    assert first_batch["kiwi"] == 4.0
+    assert first_batch["cherries"] == 0.0
+    with pytest.raises(KeyError):
+        first_batch["strawberry"]
+
+
+def test_from_batches_BatchCollection(batch_collection_fixture):
+    """Test of the from_batches method of the BatchCollection class"""
+
+    batches = (
+        Batch.from_str(string)
+        for string in [
+            "batch 1:1; 2xapple, 3xbanana, 4xkiwi",
+            "batch 2:2; 4xapple, 3xpineapple",
+            "batch 3:3; 6xapple, 7xbanana, 8xcherries",
+        ]
+    )
+    assert BatchCollection.from_batches(batches) == batch_collection_fixture
+    trusted = BatchCollection.from_batches(
+        batch_collection_fixture.batch_list, validate="none"
+    )
+    assert trusted == batch_collection_fixture
+    assert trusted.item_names == batch_collection_fixture.item_names
+    with pytest.raises(ValueError):
+        BatchCollection.from_batches(
+            [Batch.from_str("lot1:1; 2xapple"), Batch.from_str("lot1:2; 3xapple")]
+        )
+    with pytest.raises(ValueError):
+        BatchCollection.from_batches([], validate="never")
+
+
+def test_from_lines_BatchCollection(batch_collection_fixture):
+    """Test of the bulk parsing of lines of the string grammar of a seller"""
+
+    lines = [
+        "batch 1:1; 2xapple, 3xbanana, 4xkiwi",
+        "batch 2:2; 4xapple, 3xpineapple",
+        "batch 3:3; 6xapple, 7xbanana, 8xcherries",
+    ]
+
+    assert BatchCollection.from_lines(lines) == batch_collection_fixture
+    assert BatchCollection.from_lines(lines, seller="seller1").seller == "seller1"
+    with pytest.raises(ValueError, match="Line 2"):
+        BatchCollection.from_lines([lines[0], "batch 2:2; 4xapple, -3xpineapple"])
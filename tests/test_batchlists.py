@@ -4,9 +4,11 @@ Test module for the BatchLists dataclass."""
 
 import os
 import sys
+import pandas as pd
 import pytest
 
-from BatchMonitor import Batch, BatchCollection, BatchLists
+from BatchMonitor import Batch, BatchCollection, BatchLists, Item_in_batch
+from BatchMonitor.lib_batches import Incompatible_negative_value, Invalid_batch_line
 
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -612,3 +614,435 @@ def test_batchlists_to_json_exception():
 
     with pytest.raises(Exception):
         BatchLists.to_json(path="ddddddddddddddddd")
+
+
+def test_Batchlists_from_records(batchlists_fixture):
+    """Test of the from_records method of the BatchLists class"""
+
+    bl = BatchLists.from_records(
+        [
+            ("seller1", Batch.from_str("batch 1:1; 2xapple, 3xbanana")),
+            ("seller2", Batch.from_str("batch 3:3; 6xstrawberry, 7xbanana")),
+            ("seller1", Batch.from_str("batch 2:2; 4xorange, 5xpineapple")),
+            ("seller2", Batch.from_str("batch 4:4; 8xorange, 7xcherries")),
+        ]
+    )
+
+    assert bl == batchlists_fixture
+    with pytest.raises(ValueError):
+        BatchLists.from_records(
+            [
+                ("seller1", Batch.from_str("batch 1:1; 2xapple")),
+                ("seller1", Batch.from_str("batch 1:2; 3xapple")),
+            ]
+        )
+
+
+def test_freeze_Batchlists(batchlists_fixture):
+    """Test of the freeze method of the BatchLists class"""
+
+    frozen_batchlists = batchlists_fixture.freeze()
+    results = {frozen_batchlists: "result"}
+
+    assert len(frozen_batchlists) == 2
+    assert [batches.seller for batches in frozen_batchlists] == ["seller1", "seller2"]
+    assert frozen_batchlists.thaw() == batchlists_fixture
+    assert results[frozen_batchlists.thaw().freeze()] == "result"
+    assert (
+        frozen_batchlists.thaw().freeze().fingerprint == frozen_batchlists.fingerprint
+    )
+    batchlists_fixture[0][0].price = 10
+    assert batchlists_fixture.freeze() not in results
+
+
+def test_seller_index_Batchlists(batchlists_fixture):
+    """Test of the seller and batch indexes of the BatchLists class"""
+
+    assert batchlists_fixture.find_batch("seller2", "batch 4")["cherries"] == 7.0
+    assert batchlists_fixture.find_batch("seller1", "batch 4") is None
+    assert batchlists_fixture.find_batch("seller3", "batch 1") is None
+
+    batchlists_fixture.sort(reverse=True)
+    assert batchlists_fixture.find("seller1") == 1
+    assert batchlists_fixture["seller1"].seller == "seller1"
+
+    batchlists_fixture.remove_BatchCollection(seller_name="seller2")
+    assert "seller2" not in batchlists_fixture
+    assert batchlists_fixture.find("seller1") == 0
+
+    batchlists_fixture.batchlists.append(
+        BatchCollection([Batch.from_str("batch 5:5; 1xapple")], "seller3")
+    )
+    assert batchlists_fixture.find_batch("seller3", "batch 5").price == 5.0
+
+    batchlists_fixture.batchlists[0] = BatchCollection(
+        [Batch.from_str("batch 6:6; 1xkiwi")], "seller4"
+    )
+    assert "seller4" in batchlists_fixture
+    assert "seller1" not in batchlists_fixture
+    assert batchlists_fixture.find("seller4") == 0
+
+    sellers = batchlists_fixture._sellers
+    batches = batchlists_fixture["seller4"]
+    index = batches._index
+    assert "seller5" not in batchlists_fixture
+    assert "batch 7" not in batches
+    assert batchlists_fixture._sellers is sellers
+    assert batches._index is index
+    batches.add_batch(Batch.from_str("batch 7:7; 1xkiwi"))
+    assert batches._index is index
+    batches.batch_list[0] = Batch.from_str("batch 8:8; 1xkiwi")
+    assert batchlists_fixture.find_batch("seller4", "batch 8").price == 8.0
+    assert batchlists_fixture.find_batch("seller4", "batch 6") is None
+
+
+def test_add_BatchCollection_vocabulary_Batchlists(batchlists_fixture):
+    """Test of the vocabulary of the BatchLists after add_BatchCollection, without rebuilding it"""
+
+    batchlists_fixture.add_BatchCollection(
+        BatchCollection([Batch.from_str("batch 5:5; 1xkiwi, 2xapple")], "seller1")
+    )
+    batchlists_fixture.add_BatchCollection(
+        BatchCollection([Batch.from_str("batch 6:6; 3xmelon")], "seller3")
+    )
+
+    assert batchlists_fixture.item_names[-2:] == ["kiwi", "melon"]
+    assert batchlists_fixture.aligned_quantities(
+        batchlists_fixture.find_batch("seller1", "batch 5")
+    ) == [2, 0, 0, 0, 0, 0, 1, 0]
+    assert batchlists_fixture.find_batch("seller3", "batch 6")["apple"] == 0.0
+    assert batchlists_fixture.find("seller3") == 2
+
+
+def test_aligned_quantities_new_items_Batchlists(batchlists_fixture):
+    """Test of aligned_quantities after items are added through a BatchCollection or a Batch of the BatchLists"""
+
+    batchlists_fixture.batchlists[0].add_batch(Batch.from_str("batch 5:1; 1xmelon"))
+    batchlists_fixture.find_batch("seller1", "batch 1").add_item(
+        Item_in_batch("kiwi", 2)
+    )
+
+    assert batchlists_fixture.aligned_quantities(
+        batchlists_fixture.find_batch("seller1", "batch 5")
+    ) == [0, 0, 0, 0, 0, 0, 1]
+    assert batchlists_fixture.aligned_quantities(
+        batchlists_fixture.find_batch("seller1", "batch 1")
+    ) == [2, 3, 0, 0, 0, 0, 0, 2]
+    assert batchlists_fixture.item_names[-2:] == ["melon", "kiwi"]
+
+
+def test_same_seller_merged_Batchlists():
+    """Test of the merge of the BatchCollection objects of a same seller"""
+
+    bl = BatchLists(
+        [
+            BatchCollection([Batch.from_str("batch 1:1; 2xapple")], "seller1"),
+            BatchCollection([Batch.from_str("batch 2:2; 3xapple")], "seller1"),
+        ]
+    )
+
+    assert len(bl) == 1
+    assert len(bl["seller1"]) == 2
+    assert bl.find_batch("seller1", "batch 2").price == 2.0
+
+
+def test_lazy_alignment_Batchlists(batchlists_fixture):
+    """Test of the virtual alignment of the items of the BatchLists class"""
+
+    batch = batchlists_fixture.find_batch("seller1", "batch 1")
+
+    assert len(batch) == 2
+    assert batchlists_fixture.item_names == [
+        "apple",
+        "banana",
+        "orange",
+        "pineapple",
+        "strawberry",
+        "cherries",
+    ]
+    assert batchlists_fixture.aligned_quantities(batch) == [2, 3, 0, 0, 0, 0]
+    assert batch["cherries"] == 0.0
+
+    batchlists_fixture.to_json("batchlists.json")
+    with open("batchlists.json") as file:
+        assert '"quantity_in_batch": 0' not in file.read()
+    assert BatchLists.from_json("batchlists.json") == batchlists_fixture
+    os.remove("batchlists.json")
+
+
+def test_iter_json_Batchlists(batchlists_fixture):
+    """Test of the streaming of a BatchLists JSON file, one seller at a time"""
+
+    batchlists_fixture.to_json("batchlists.json")
+    collections = BatchLists.iter_json("batchlists.json", chunk_size=16)
+
+    assert next(collections) == batchlists_fixture[0]
+    assert list(collections) == batchlists_fixture.batchlists[1:]
+    os.remove("batchlists.json")
+
+    with open("batchlists.json", "w") as file:
+        file.write('{"seller": "seller1"}')
+    with pytest.raises(ValueError):
+        next(BatchLists.iter_json("batchlists.json"))
+    with open("batchlists.json", "w") as file:
+        file.write('[{"batch_list": [], "seller": "seller1"}')
+    with pytest.raises(ValueError):
+        list(BatchLists.iter_json("batchlists.json"))
+    seller = '{"batch_list": [], "seller": "seller1"}'
+    for array in (
+        f"[{seller}{seller}]",
+        f"[{seller},,{seller}]",
+        f"[,{seller}]",
+        f"[{seller},]",
+    ):
+        with open("batchlists.json", "w") as file:
+            file.write(array)
+        with pytest.raises(ValueError):
+            list(BatchLists.iter_json("batchlists.json", chunk_size=8))
+    os.remove("batchlists.json")
+
+    with open("batchlists.json", "w") as file:
+        file.write(" " * 64 + "\n[" + " " * 64 + seller + " " * 64 + "]")
+    assert list(BatchLists.iter_json("batchlists.json", chunk_size=16)) == [
+        BatchCollection([], "seller1")
+    ]
+    with open("batchlists.json", "w") as file:
+        file.write(" " * 64 + "[ ]")
+    assert list(BatchLists.iter_json("batchlists.json", chunk_size=16)) == []
+    os.remove("batchlists.json")
+
+
+def test_ndjson_Batchlists(batchlists_fixture):
+    """Test of the NDJSON format of the BatchLists class"""
+
+    batchlists_fixture.to_ndjson("batchlists.ndjson")
+    assert BatchLists.from_ndjson("batchlists.ndjson") == batchlists_fixture
+
+    BatchLists.append_ndjson(
+        "batchlists.ndjson", "seller 9", Batch.from_str("batch 9:9; 1xapple")
+    )
+    with open("batchlists.ndjson") as file:
+        lines = file.readlines()
+    loaded = BatchLists.from_ndjson("batchlists.ndjson", workers=2, chunk_size=64)
+
+    assert len(lines) == sum(len(batches) for batches in batchlists_fixture) + 1
+    assert loaded.find_batch("seller 9", "batch 9") == Batch.from_str(
+        "batch 9:9; 1xapple"
+    )
+    assert loaded.batchlists[:-1] == batchlists_fixture.batchlists
+    os.remove("batchlists.ndjson")
+
+
+def test_from_dataframe_Batchlists():
+    """Test of the creation of a BatchLists from a DataFrame, a CSV file and an Excel file"""
+
+    dataframe = pd.DataFrame(
+        [[2, None, 1], [1, 3, 0], [10, 20, 30], ["seller1", "seller2", "seller1"]],
+        index=["apple", "banana", "TOTAL", "Seller"],
+        columns=["batch 1", "batch 1", "batch 2"],
+    )
+    waited = BatchLists.from_str(
+        [
+            "seller1_batch 1:10; 2xapple, 1xbanana",
+            "seller2_batch 1:20; 3xbanana",
+            "seller1_batch 2:30; 1xapple",
+        ]
+    )
+
+    assert BatchLists.from_dataframe(dataframe) == waited
+    dataframe.to_csv("batchlists.csv")
+    assert BatchLists.from_csv("batchlists.csv") == waited
+    os.remove("batchlists.csv")
+
+    batch_lists = BatchLists.from_excel(
+        os.path.join(os.path.dirname(__file__), "..", "exemple", "exemple_Offre.xlsx")
+    )
+    assert [batches.seller for batches in batch_lists] == ["Detalin", "Malandrin"]
+    assert batch_lists.find_batch("Malandrin", "LOT1")["tank"] == 8.0
+
+    with pytest.raises(KeyError):
+        BatchLists.from_dataframe(dataframe.drop(index="TOTAL"))
+    with pytest.raises(ValueError):
+        BatchLists.from_dataframe(dataframe.replace(3, -3))
+
+
+def test_from_lines_Batchlists():
+    """Test of the bulk parsing of lines of the string grammar"""
+
+    lines = [
+        "seller1_batch 1:1; 2xapple, 3xbanana",
+        "",
+        "seller2_batch 1:2; 4xkiwi",
+        "seller1_batch 2:3; 5xapple",
+    ]
+    with open("batchlists.txt", "w") as file:
+        file.write("\n".join(lines))
+
+    assert BatchLists.from_lines(lines) == BatchLists.from_str(
+        [line for line in lines if line]
+    )
+    assert BatchLists.from_lines("batchlists.txt", workers=2, chunk_size=1) == (
+        BatchLists.from_lines(lines)
+    )
+    os.remove("batchlists.txt")
+
+    with pytest.raises(Invalid_batch_line) as error:
+        BatchLists.from_lines([*lines, "seller2_batch 2:4; 1xapple, fourxkiwi"])
+    assert error.value.line_number == 5
+    with pytest.raises(Invalid_batch_line) as error:
+        BatchLists.from_lines(
+            [*lines, "seller2_batch 1:5; 1xapple"], workers=2, chunk_size=2
+        )
+    assert error.value.line_number == 5
+    with pytest.raises(ValueError):
+        BatchLists.from_lines(["batch 1:1; 2xapple"])
+    for line in ("s1_b1:1; 2x", "s1_b1:1; 2x  ", "s1_b1:1; 1xapple, 2x"):
+        with pytest.raises(Invalid_batch_line) as error:
+            BatchLists.from_lines([line])
+        assert error.value.line_number == 1
+
+
+def test_apply_patch_Batchlists():
+    """Test of the patches of prices, batches and quantities of the BatchLists class"""
+
+    batch_lists = BatchLists.from_str(
+        [
+            "seller1_batch 1:1; 2xapple, 3xbanana",
+            "seller1_batch 2:2; 4xapple",
+            "seller2_batch 1:3; 5xkiwi",
+        ]
+    )
+    patch = [
+        {"op": "price", "seller": "seller1", "batch": "batch 2", "price": 2.5},
+        {"op": "quantity", "seller": "seller1", "batch": "batch 1", "item": "banana", "quantity": 0},
+        {"op": "quantity", "seller": "seller1", "batch": "batch 2", "item": "apple", "quantity": 6},
+        {"op": "quantity", "seller": "seller1", "batch": "batch 2", "item": "cherry", "quantity": 1},
+        {"op": "remove", "seller": "seller2", "batch": "batch 1"},
+        {
+            "op": "add",
+            "seller": "seller3",
+            "batch": "batch 1",
+            "price": 4,
+            "items": [{"name": "apple", "quantity_in_batch": 1}],
+        },
+    ]  # fmt: skip
+    expected = BatchLists.from_str(
+        [
+            "seller1_batch 1:1; 2xapple",
+            "seller1_batch 2:2.5; 6xapple, 1xcherry",
+            "seller3_batch 1:4; 1xapple",
+        ]
+    )
+
+    assert batch_lists.apply_patch(patch) == expected
+    assert batch_lists.item_names == expected.item_names == ["apple", "cherry"]
+    assert batch_lists.find_batch("seller1", "batch 1")["cherry"] == 0.0
+    with pytest.raises(KeyError):
+        batch_lists.find_batch("seller1", "batch 2")["kiwi"]
+
+    batch_lists = BatchLists.from_str(
+        [
+            "seller1_batch 1:1; 2xapple, 3xbanana",
+            "seller1_batch 2:2; 4xapple",
+            "seller2_batch 1:3; 5xkiwi",
+        ]
+    )
+    BatchLists.append_patch("batchlists.patch.ndjson", *patch[:3])
+    BatchLists.append_patch("batchlists.patch.ndjson", *patch[3:])
+    assert batch_lists.apply_patch("batchlists.patch.ndjson") == expected
+    os.remove("batchlists.patch.ndjson")
+
+    with pytest.raises(KeyError):
+        batch_lists.apply_patch(
+            [{"op": "remove", "seller": "seller2", "batch": "batch 1"}]
+        )
+    with pytest.raises(ValueError):
+        batch_lists.apply_patch([{**patch[-1], "seller": "seller1"}])
+    with pytest.raises(Incompatible_negative_value):
+        batch_lists.apply_patch([{**patch[0], "price": -1}])
+    with pytest.raises(ValueError):
+        batch_lists.apply_patch([{**patch[0], "op": "rename"}])
+    with pytest.raises(TypeError):
+        batch_lists.apply_patch([{**patch[0], "price": "2.5"}])
+    with pytest.raises(TypeError):
+        batch_lists.apply_patch([{**patch[2], "quantity": "6"}])
+
+
+def test_apply_patch_swap_remove_Batchlists():
+    """Test of the removals of the patches, the last batch or seller takes the place of the removed one"""
+
+    batch_lists = BatchLists.from_str(
+        [
+            "seller1_batch 1:1; 2xapple, 3xbanana, 4xkiwi",
+            "seller1_batch 2:2; 4xapple",
+            "seller1_batch 3:3; 5xapple",
+            "seller2_batch 1:4; 6xapple",
+            "seller3_batch 1:5; 7xapple",
+        ]
+    )
+    sellers = batch_lists._sellers
+    index = batch_lists["seller1"]._index
+    batch_lists.apply_patch(
+        [
+            {"op": "remove", "seller": "seller1", "batch": "batch 1"},
+            {"op": "remove", "seller": "seller2", "batch": "batch 1"},
+        ]
+    )
+
+    assert batch_lists == BatchLists.from_str(
+        [
+            "seller1_batch 3:3; 5xapple",
+            "seller1_batch 2:2; 4xapple",
+            "seller3_batch 1:5; 7xapple",
+        ]
+    )
+    assert batch_lists._sellers is sellers
+    assert batch_lists["seller1"]._index is index
+    assert batch_lists.find_batch("seller1", "batch 3").price == 3.0
+    assert batch_lists.find("seller3") == 1
+
+    batch_lists.apply_patch(
+        [
+            {"op": "add", "seller": "seller1", "batch": "batch 4", "price": 6, "items": [
+                {"name": "apple", "quantity_in_batch": 1},
+                {"name": "banana", "quantity_in_batch": 2},
+                {"name": "kiwi", "quantity_in_batch": 3},
+            ]},
+            {"op": "quantity", "seller": "seller1", "batch": "batch 4", "item": "apple", "quantity": 0},
+        ]
+    )  # fmt: skip
+    batch = batch_lists.find_batch("seller1", "batch 4")
+    assert [item.name for item in batch.items] == ["kiwi", "banana"]
+    assert batch["kiwi"] == 3
+
+
+def test_apply_patch_vocabulary_Batchlists():
+    """Test of the update in place of the vocabulary by the patches of the BatchLists class"""
+
+    batch_lists = BatchLists.from_str(
+        [
+            "seller1_batch 1:1; 2xapple, 3xbanana",
+            "seller2_batch 1:2; 4xbanana, 5xkiwi",
+            "seller2_batch 2:3; 6xorange",
+        ]
+    )
+    batch_lists.apply_patch([{"op": "remove", "seller": "seller1", "batch": "batch 1"}])
+    assert batch_lists.item_names == ["orange", "banana", "kiwi"]
+    assert batch_lists.aligned_quantities(
+        batch_lists.find_batch("seller2", "batch 1")
+    ) == [0.0, 4.0, 5.0]
+
+    batch_lists.apply_patch(
+        [{"op": "quantity", "seller": "seller2", "batch": "batch 1", "item": "banana", "quantity": 0}]
+    )  # fmt: skip
+    assert batch_lists.item_names == ["orange", "kiwi"]
+    assert batch_lists.aligned_quantities(
+        batch_lists.find_batch("seller2", "batch 2")
+    ) == [6.0, 0.0]
+
+    batch_lists.remove_BatchCollection(seller_name="seller2")
+    assert batch_lists.item_names == []
+    batch_lists.add_BatchCollection(
+        BatchCollection.from_str("batch 1:1; 1xpear", seller="seller3")
+    )
+    assert batch_lists.item_names == ["pear"]
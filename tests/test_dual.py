@@ -11,6 +11,7 @@ import pulp as pulp
 import pytest
 
 from BatchMonitor import (
+    DualBatchProblem,
     ItemListRequest,
     ItemRequest,
     maxEarnings,
@@ -166,7 +167,7 @@ def test_ultimate_maxEarnings(Batch_Collection_fixture, ItemListRequest_fixture)
         },
         category_of_variables="Integer",
         exchange_rate=1.2,
-        transport_fee=np.array([0.1, 0.2, 0.3, 0.4, 0.5]),
+        transport_fee=np.array([0.1, 0.2, 0.3]),
         tax_rate=0.1,
         customs_duty=0.2,
     )
@@ -238,3 +239,45 @@ def test_maxEarnings_bl(Batch_lists_fixture, ItemListRequest_fixture):
 
     assert result["Status"] == waited["Status"]
     assert result["Total benefit"] == waited["Total benefit"]
+
+
+def test_maxEarnings_inputs_unchanged(
+    Batch_Collection_fixture, ItemListRequest_fixture
+):
+    """Test that the maxEarnings function does not modify its inputs"""
+
+    frozen = Batch_Collection_fixture.freeze()
+    items_requested = list(ItemListRequest_fixture.items)
+
+    maxEarnings(Batch_Collection_fixture, ItemListRequest_fixture, transport_fee=0.5)
+
+    assert Batch_Collection_fixture.freeze() == frozen
+    assert ItemListRequest_fixture.items == items_requested
+
+
+def test_DualBatchProblem(Batch_lists_fixture, ItemListRequest_fixture):
+    """Test of the re-solve of a DualBatchProblem against maxEarnings"""
+
+    problem = DualBatchProblem(Batch_lists_fixture, ItemListRequest_fixture)
+    assert problem.solve() == maxEarnings(Batch_lists_fixture, ItemListRequest_fixture)
+
+    problem.set_item_request(ItemRequest("banana", 30))
+    problem.set_rates(transport_fee=0.5)
+    problem.set_price_constraints({"apple": (0, 1)})
+    problem.set_benefit_limits(maximum_benefit=500)
+
+    assert problem.solve() == maxEarnings(
+        Batch_lists_fixture,
+        ItemListRequest(
+            [
+                ItemRequest("apple", 10),
+                ItemRequest("banana", 30),
+                ItemRequest("orange", 10),
+            ]
+        ),
+        transport_fee=0.5,
+        price_constraints={"apple": (0, 1)},
+        maximum_benefit=500,
+    )
+    with pytest.raises(ValueError):
+        problem.set_benefit_limits(minimum_benefit=10, maximum_benefit=1)
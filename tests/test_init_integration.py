@@ -331,8 +331,9 @@ def test_bc_creation():
     ) as mock_from_str, patch(
         "BatchMonitor.lib_app._animate_progress_bar"
     ) as mock_animate_progress_bar:
-        mock_BatchCollection.return_value = MagicMock()
-        mock_from_str.return_value = MagicMock()
+        mock_BatchCollection.from_batches.return_value = MagicMock()
+        mock_batches = [MagicMock(), MagicMock(), MagicMock()]
+        mock_from_str.side_effect = mock_batches
 
         number_of_batches, bc = _bc_creation()
 
@@ -345,13 +346,15 @@ def test_bc_creation():
             call("\n[red]⠹ 100.0% : [/red]Enter the Batch n°3"),
         ]
         assert mock_styled_echo.call_count == 2
-        mock_BatchCollection.assert_called_once_with(seller="seller")
+        mock_BatchCollection.from_batches.assert_called_once_with(
+            mock_batches, seller="seller"
+        )
         assert mock_from_str.call_count == 3
         mock_animate_progress_bar.assert_called_once_with(
             "Initialization of the problems", 3
         )
         assert number_of_batches == 3
-        assert bc == mock_BatchCollection.return_value
+        assert bc == mock_BatchCollection.from_batches.return_value
 
 
 def test_bc_creation_bad_input():
@@ -374,7 +377,7 @@ def test_bc_creation_bad_input():
     ) as mock_animate_progress_bar, patch(
         "BatchMonitor.lib_app._style_invalid_choice"
     ) as mock_style_invalid_choice:
-        mock_BatchCollection.return_value = MagicMock()
+        mock_BatchCollection.from_batches.return_value = MagicMock()
 
         number_of_batches, bc = _bc_creation()
 
@@ -386,7 +389,7 @@ def test_bc_creation_bad_input():
             call("\n[red]⠹ 100.0% : [/red]Enter the Batch n°1"),
         ]
         assert mock_styled_echo.call_count == 4
-        mock_BatchCollection.assert_called_once_with(seller="seller")
+        mock_BatchCollection.from_batches.assert_called_once()
         assert mock_from_str.call_count == 2
         mock_animate_progress_bar.assert_called_once_with(
             "Initialization of the problems", 1
@@ -395,7 +398,7 @@ def test_bc_creation_bad_input():
             "Invalid format.\nHave you entered two batches with the same name for the same seller?\nIf so, please change the name of one of the batches"
         )
         assert number_of_batches == 1
-        assert bc == mock_BatchCollection.return_value
+        assert bc == mock_BatchCollection.from_batches.return_value
 
 
 def test_bl_creation():
@@ -102,3 +102,10 @@ def test_str_item_in_batch(ib_fixture):
     assert "5.0" in output
     assert "Item name" in output
     assert "Quantity in batch" in output
+
+
+def test_slots_item_in_batch(ib_fixture):
+    """Test of the compact layout of Item_in_batch"""
+
+    assert not hasattr(ib_fixture, "__dict__")
+    assert Item_in_batch("".join(["app", "le"]), 1).name is ib_fixture.name
@@ -4,6 +4,7 @@ This file contains the test cases for the ItemlistRequest dataclass"""
 
 import os
 import sys
+import pandas as pd
 import pytest
 from BatchMonitor import ItemListRequest, ItemRequest
 
@@ -480,3 +481,30 @@ def test_error_to_json_ilr():
 
     with pytest.raises(Exception):
         ItemListRequest.to_json(path="ddddddddd")
+
+
+def test_from_dataframe_ItemListRequest():
+    """Test of the creation of an ItemListRequest from a DataFrame"""
+
+    dataframe = pd.DataFrame(
+        {"Min_Quantity": [5, 7, None], "Max_Quantity": [6, None, 10]},
+        index=["apple", "banana", "orange"],
+    )
+
+    assert ItemListRequest.from_dataframe(dataframe) == ItemListRequest(
+        [
+            ItemRequest("apple", 5, 6),
+            ItemRequest("banana", 7),
+            ItemRequest("orange", 0, 10),
+        ]
+    )
+    assert ItemListRequest.from_dataframe(
+        pd.read_excel(
+            os.path.join(
+                os.path.dirname(__file__), "..", "exemple", "exemple_demande.xlsx"
+            ),
+            index_col=0,
+        )
+    )[0] == ItemRequest("rifle", 100000)
+    with pytest.raises(KeyError):
+        ItemListRequest.from_dataframe(dataframe, minimum_column="Minimum")
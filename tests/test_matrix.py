@@ -0,0 +1,228 @@
+"""Description
+
+Test module for the BatchMatrix dataclass."""
+
+import dataclasses
+import os
+import shutil
+import sys
+import numpy as np
+import pytest
+
+from BatchMonitor import (
+    Batch,
+    BatchCollection,
+    BatchLists,
+    BatchMatrix,
+    ItemListRequest,
+    ItemRequest,
+    SparseBatchMatrix,
+    maxEarnings,
+    minBatchExpense,
+)
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+@pytest.fixture
+def batch_lists_fixture():
+    """Fixture for the BatchMatrix class"""
+
+    return BatchLists.from_str(
+        [
+            "seller1_batch 1:1; 2xapple, 3xbanana",
+            "seller1_batch 2:2; 4xapple",
+            "seller2_batch 1:3; 5xkiwi",
+        ]
+    )
+
+
+def test_BatchMatrix_from_batch_collection():
+    """Test of the creation of a BatchMatrix from a BatchCollection"""
+
+    batch_collection = BatchCollection.from_str(
+        "batch 1:1; 2xapple, 3xbanana", "batch 2:2; 4xkiwi", seller="seller1"
+    )
+    matrix = BatchMatrix.from_batch_collection(batch_collection)
+
+    assert matrix.shape == (2, 3)
+    assert matrix.item_names == ["apple", "banana", "kiwi"]
+    assert matrix.batch_names == ["batch 1", "batch 2"]
+    assert matrix.sellers() == ["seller1", "seller1"]
+    assert np.array_equal(matrix.quantities, [[2.0, 3.0, 0.0], [0.0, 0.0, 4.0]])
+    assert np.array_equal(matrix.prices, [1.0, 2.0])
+    assert matrix[1] == Batch.from_str("batch 2:2; 4xkiwi")
+    assert matrix.to_batch_collection() == batch_collection
+
+
+def test_BatchMatrix_from_batch_lists(batch_lists_fixture):
+    """Test of the creation of a BatchMatrix from a BatchLists"""
+
+    matrix = BatchMatrix.from_batch_lists(batch_lists_fixture)
+
+    assert matrix.keys() == ["seller1_batch 1", "seller1_batch 2", "seller2_batch 1"]
+    assert np.array_equal(matrix.item_column("apple"), [2.0, 4.0, 0.0])
+    assert [batch.name for batch in matrix] == ["batch 1", "batch 2", "batch 1"]
+    assert matrix == BatchMatrix.from_batch_lists(matrix.to_batch_lists())
+    with pytest.raises(ValueError):
+        matrix.to_batch_collection()
+    with pytest.raises(KeyError):
+        matrix.item_column("cherry")
+
+
+def test_BatchMatrix_optimization(batch_lists_fixture, monkeypatch):
+    """Test of the optimization of a BatchMatrix, read from its arrays without building its batches"""
+
+    demand_list = ItemListRequest([ItemRequest("apple", 4), ItemRequest("kiwi", 5)])
+    batch_collection = BatchCollection.from_str(
+        "batch 1:1; 2xapple, 3xbanana", "batch 2:2; 4xapple", seller="seller1"
+    )
+    apples = ItemListRequest([ItemRequest("apple", 4)])
+    results = [
+        minBatchExpense(batch_lists_fixture, demand_list),
+        maxEarnings(batch_lists_fixture, demand_list),
+        minBatchExpense(batch_collection, apples),
+    ]
+    matrices = [
+        BatchMatrix.from_batch_lists(batch_lists_fixture),
+        BatchMatrix.from_batch_collection(batch_collection),
+    ]
+
+    def no_batch(*args):
+        raise AssertionError("The batches of the matrix must not be built.")
+
+    monkeypatch.setattr(BatchMatrix, "__getitem__", no_batch)
+    monkeypatch.setattr(BatchMatrix, "to_catalog", no_batch)
+    assert [
+        minBatchExpense(matrices[0], demand_list),
+        maxEarnings(matrices[0], demand_list),
+        minBatchExpense(matrices[1], apples),
+    ] == results
+    assert "Expense per seller" in results[0]
+
+
+def test_BatchMatrix_wrong_dimensions():
+    """Test of the BatchMatrix class with arrays of wrong dimensions"""
+
+    with pytest.raises(ValueError):
+        BatchMatrix(np.zeros((2, 2)), np.zeros(2), ["batch 1", "batch 2"], ["apple"])
+    with pytest.raises(ValueError):
+        BatchMatrix(np.zeros((1, 1)), np.zeros(2), ["batch 1"], ["apple"])
+
+
+def test_SparseBatchMatrix(batch_lists_fixture):
+    """Test of the SparseBatchMatrix class"""
+
+    matrix = SparseBatchMatrix.from_batch_lists(batch_lists_fixture)
+
+    assert matrix.shape == (3, 3)
+    assert matrix.nnz == 4
+    assert np.array_equal(matrix.indptr, [0, 2, 3, 4])
+    assert matrix[0] == Batch.from_str("batch 1:1; 2xapple, 3xbanana")
+    assert matrix[-1] == Batch.from_str("batch 1:3; 5xkiwi")
+    rows, quantities = matrix.item_batches("apple")
+    assert np.array_equal(rows, [0, 1])
+    assert np.array_equal(quantities, [2.0, 4.0])
+    assert np.array_equal(matrix.item_column("kiwi"), [0.0, 0.0, 5.0])
+    assert matrix.to_dense() == BatchMatrix.from_batch_lists(batch_lists_fixture)
+    assert matrix.to_dense().to_sparse() == matrix
+    assert hash(matrix) == hash(SparseBatchMatrix.from_batch_lists(batch_lists_fixture))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        matrix.prices = np.zeros(3)
+    with pytest.raises(ValueError):
+        matrix.data[0] = 10.0
+    prices = np.array([1.0, 2.0, 3.0])
+    SparseBatchMatrix(
+        matrix.indptr,
+        matrix.indices,
+        matrix.data,
+        prices,
+        matrix.batch_names,
+        matrix.item_names,
+    )
+    prices[0] = 4.0
+    with pytest.raises(KeyError):
+        matrix.item_batches("cherry")
+    with pytest.raises(ValueError):
+        SparseBatchMatrix([0, 2], [0], [1.0], [1.0], ["batch 1"], ["apple"])
+
+
+def test_SparseBatchMatrix_json(batch_lists_fixture):
+    """Test of the JSON round trip of the SparseBatchMatrix class"""
+
+    matrix = SparseBatchMatrix.from_batch_lists(batch_lists_fixture)
+    matrix.to_json("batch_matrix.json")
+    assert SparseBatchMatrix.from_json("batch_matrix.json") == matrix
+    os.remove("batch_matrix.json")
+
+
+def test_SparseBatchMatrix_npy(batch_lists_fixture, monkeypatch):
+    """Test of the memory-mapped binary format of the SparseBatchMatrix class"""
+
+    matrix = SparseBatchMatrix.from_batch_lists(batch_lists_fixture)
+    matrix.to_npy("batch_matrix")
+    loaded = SparseBatchMatrix.from_npy("batch_matrix")
+    demand_list = ItemListRequest([ItemRequest("apple", 4), ItemRequest("kiwi", 5)])
+    primal = minBatchExpense(batch_lists_fixture, demand_list)
+    dual = maxEarnings(batch_lists_fixture, demand_list)
+
+    assert isinstance(np.load("batch_matrix/data.npy", mmap_mode="r"), np.memmap)
+    assert loaded == matrix
+    assert loaded.to_catalog() == batch_lists_fixture
+
+    def no_batch(*args):
+        raise AssertionError("The batches of the matrix must not be built.")
+
+    monkeypatch.setattr(SparseBatchMatrix, "__getitem__", no_batch)
+    monkeypatch.setattr(SparseBatchMatrix, "to_catalog", no_batch)
+    assert minBatchExpense(loaded, demand_list) == primal
+    assert maxEarnings(loaded, demand_list) == dual
+    shutil.rmtree("batch_matrix")
+
+
+def test_SparseBatchMatrix_npy_validation(batch_lists_fixture):
+    """Test of the checks of the arrays loaded by from_npy, only their shapes and dtypes when they are memory-mapped"""
+
+    SparseBatchMatrix.from_batch_lists(batch_lists_fixture).to_npy("batch_matrix")
+    np.save("batch_matrix/indices.npy", np.array([0, 1, 0, 7], dtype=np.intp))
+    assert SparseBatchMatrix.from_npy("batch_matrix").indices.tolist() == [0, 1, 0, 7]
+    with pytest.raises(ValueError):
+        SparseBatchMatrix.from_npy("batch_matrix", mmap_mode=None)
+
+    np.save("batch_matrix/indices.npy", np.array([0, 1, 0, 2], dtype=np.int32))
+    with pytest.raises(ValueError):
+        SparseBatchMatrix.from_npy("batch_matrix")
+    assert SparseBatchMatrix.from_npy("batch_matrix", mmap_mode=None) == (
+        SparseBatchMatrix.from_batch_lists(batch_lists_fixture)
+    )
+    np.save("batch_matrix/data.npy", np.array([2.0, 3.0, 4.0]))
+    with pytest.raises(ValueError):
+        SparseBatchMatrix.from_npy("batch_matrix")
+    shutil.rmtree("batch_matrix")
+
+
+def test_SparseBatchMatrix_npy_catalog():
+    """Test of the kind of catalog kept by the binary format of the SparseBatchMatrix class"""
+
+    batch_lists = BatchLists.from_str(["seller1_batch 1:1; 2xapple"])
+    batch_collection = BatchCollection.from_str("batch 1:1; 2xapple", seller="seller1")
+    demand_list = ItemListRequest([ItemRequest("apple", 2)])
+
+    SparseBatchMatrix.from_batch_lists(batch_lists).to_npy("batch_matrix")
+    loaded = SparseBatchMatrix.from_npy("batch_matrix")
+    assert loaded.catalog == "BatchLists"
+    assert loaded.to_catalog() == batch_lists
+    assert minBatchExpense(loaded, demand_list) == minBatchExpense(
+        batch_lists, demand_list
+    )
+
+    SparseBatchMatrix.from_batch_collection(batch_collection).to_npy("batch_matrix")
+    loaded = SparseBatchMatrix.from_npy("batch_matrix")
+    assert loaded.to_catalog() == batch_collection
+    assert minBatchExpense(loaded, demand_list) == minBatchExpense(
+        batch_collection, demand_list
+    )
+    shutil.rmtree("batch_matrix")
+
+    with pytest.raises(ValueError):
+        SparseBatchMatrix([0, 0], [], [], [1.0], ["batch 1"], [], catalog="Batch")
@@ -16,9 +16,13 @@ from BatchMonitor import (
 )
 from BatchMonitor import (
     BatchLists,
+    BatchProblem,
     ItemListRequest,
     ItemRequest,
+    maxEarnings,
     minBatchExpense,
+    price_sweep,
+    solve_many,
 )
 from BatchMonitor.lib_optimization import (
     _generate_variables_primal,
@@ -71,6 +75,35 @@ def test_generate_primal_constraints(Batch_Collection_fixture, ItemListRequest_f
     assert constraints == waited["constraints"]
 
 
+def test_generate_primal_constraints_sparse():
+    """Test of the _generate_primal_constraints function with batches not containing all the items"""
+
+    batches = BatchCollection.from_str(
+        "batch 1:10; 3xapple, 2xbanana", "batch 2:15; 5xorange", "batch 3:20; 6xapple"
+    )
+    demand_list = ItemListRequest(
+        [ItemRequest("apple", 10, 20), ItemRequest("orange", 5)]
+    )
+    variables = _generate_variables_primal(batches)
+    constraints = list(
+        _generate_primal_constraints(variables, batches, demand_list).values()
+    )
+
+    assert [
+        {variable.name: coefficient for variable, coefficient in row.items()}
+        for row in constraints
+    ] == [
+        {"batch_1": 3.0, "batch_3": 6.0},
+        {"batch_1": 3.0, "batch_3": 6.0},
+        {"batch_2": 5.0},
+    ]
+    assert [(row.sense, row.constant) for row in constraints] == [
+        (pulp.LpConstraintGE, -10),
+        (pulp.LpConstraintLE, -20),
+        (pulp.LpConstraintGE, -5),
+    ]
+
+
 def test_collecte_data_primal(Batch_Collection_fixture, ItemListRequest_fixture):
     """Test of the _collecte_data_primal function"""
     variables, objective, constraints = _collecte_data_primal(
@@ -154,6 +187,21 @@ def test_minBatchExpense_2(Batch_lists_fixture, ItemListRequest_fixture):
     assert result["Batch quantities"].keys() == waited["batches_name"].keys()
 
 
+def test_minBatchExpense_inputs_unchanged(Batch_lists_fixture, ItemListRequest_fixture):
+    """Test that the minBatchExpense function does not modify its inputs"""
+
+    frozen = Batch_lists_fixture.freeze()
+    items_requested = list(ItemListRequest_fixture.items)
+
+    result = minBatchExpense(
+        Batch_lists_fixture, ItemListRequest_fixture, exchange_rate=2, tax_rate=0.2
+    )
+
+    assert result["Status"] == "Optimal"
+    assert Batch_lists_fixture.freeze() == frozen
+    assert ItemListRequest_fixture.items == items_requested
+
+
 def test_ultimate_minBatchExpense():
     """Test of the minBatchExpense function with all parameters"""
 
@@ -177,8 +225,8 @@ def test_ultimate_minBatchExpense():
         items,
         category_of_variables="Continuous",
         exchange_rate=0.9,
-        transport_fee=np.array([0.3, 0.1, 0.4]),
-        tax_rate=np.array([0.2, 0.1, 0.3]),
+        transport_fee=np.array([0.3, 0.1]),
+        tax_rate=np.array([0.2, 0.1]),
         customs_duty=0.2,
         batch_constraints=dict(batch1=(0, 50), batch2=(0, 1000), batch3=(0, 100)),
         minimum_expense=20,
@@ -260,3 +308,113 @@ def test_minBatchExpenseBatchlists(ItemListRequest_fixture):
     }
 
     assert minBatchExpense(lists_of_batches, ItemListRequest_fixture) == waited
+
+
+def test_BatchProblem(Batch_lists_fixture, ItemListRequest_fixture):
+    """Test of the re-solve of a BatchProblem against minBatchExpense"""
+
+    problem = BatchProblem(Batch_lists_fixture, ItemListRequest_fixture, tax_rate=0.1)
+    assert problem.solve() == minBatchExpense(
+        Batch_lists_fixture, ItemListRequest_fixture, tax_rate=0.1
+    )
+
+    demand_list = ItemListRequest(
+        [ItemRequest("apple", 12, 20), ItemRequest("orange", 15)]
+    )
+    problem.set_demand(demand_list)
+    problem.set_rates(exchange_rate={"seller 2": 2})
+    problem.set_prices({"seller 1_batch 1": 5})
+    problem.set_batch_constraints({"seller 2_batch 3": (0, 1)})
+    problem.set_expense_limits(maximum_expense=1000)
+    Batch_lists_fixture["seller 1"][0].price = 5
+
+    assert problem.solve() == minBatchExpense(
+        Batch_lists_fixture,
+        demand_list,
+        exchange_rate={"seller 2": 2},
+        tax_rate=0.1,
+        batch_constraints={"seller 2_batch 3": (0, 1)},
+        maximum_expense=1000,
+    )
+    with pytest.raises(ValueError):
+        problem.set_item_request(ItemRequest("cherry", 1))
+    with pytest.raises(ValueError):
+        problem.set_expense_limits(minimum_expense=10, maximum_expense=1)
+    with pytest.raises(KeyError):
+        problem.set_prices({"seller 3_batch 1": 5})
+
+
+def test_solve_many(Batch_lists_fixture, ItemListRequest_fixture):
+    """Test of the solve of several demand lists, in the current process and in a pool"""
+
+    demands = [
+        ItemListRequest_fixture,
+        ItemListRequest([ItemRequest("cherry", 1)]),
+        ItemListRequest([ItemRequest("apple", 12, 20), ItemRequest("orange", 15)]),
+    ]
+    waited = [
+        minBatchExpense(Batch_lists_fixture, demands[0], tax_rate=0.1),
+        {
+            "Status": "Error",
+            "Error": "ValueError: An item requested is not contained in any batch.",
+        },
+        minBatchExpense(Batch_lists_fixture, demands[2], tax_rate=0.1),
+    ]
+
+    assert list(solve_many(Batch_lists_fixture, demands, tax_rate=0.1)) == waited
+    assert (
+        list(solve_many(Batch_lists_fixture, iter(demands), workers=2, tax_rate=0.1))
+        == waited
+    )
+    read = []
+    endless = (read.append(demands[0]) or demands[0] for _ in iter(int, 1))
+    results = solve_many(Batch_lists_fixture, endless, workers=2, tax_rate=0.1)
+    assert next(results) == waited[0]
+    assert len(read) <= 4
+    results.close()
+    assert list(solve_many(Batch_lists_fixture, demands[:1], dual=True)) == [
+        maxEarnings(Batch_lists_fixture, demands[0])
+    ]
+    with pytest.raises(ValueError):
+        solve_many(Batch_lists_fixture, demands, workers=0)
+    with pytest.raises(ValueError):
+        solve_many(Batch_lists_fixture, demands, tax_rate=np.array([0.1]))
+
+
+def test_price_sweep(Batch_lists_fixture, ItemListRequest_fixture):
+    """Test of the price sweep against minBatchExpense and maxEarnings solved for each price"""
+
+    prices = np.linspace(0, 40, 9)
+    sweep = price_sweep(
+        Batch_lists_fixture,
+        ItemListRequest_fixture,
+        batch="seller 1_batch 1",
+        prices=prices,
+        tax_rate=0.1,
+    )
+
+    for index, price in enumerate(prices):
+        Batch_lists_fixture["seller 1"][0].price = float(price)
+        primal = minBatchExpense(
+            Batch_lists_fixture, ItemListRequest_fixture, tax_rate=0.1
+        )
+        dual = maxEarnings(Batch_lists_fixture, ItemListRequest_fixture, tax_rate=0.1)
+        assert sweep.primal_objective[index] == pytest.approx(primal["Total cost"])
+        assert sweep.dual_objective[index] == pytest.approx(dual["Total benefit"])
+    assert sweep.solves < 2 * len(prices)
+
+    limited = price_sweep(
+        Batch_lists_fixture,
+        ItemListRequest_fixture,
+        batch="seller 1_batch 1",
+        prices=[0, 40],
+        maximum_expense=0,
+    )
+    assert np.isnan(limited.primal_objective[1])
+    assert np.array_equal(limited.primal_breakpoints, [40])
+    with pytest.raises(KeyError):
+        price_sweep(Batch_lists_fixture, ItemListRequest_fixture, "batch 1", [1])
+    with pytest.raises(ValueError):
+        price_sweep(
+            Batch_lists_fixture, ItemListRequest_fixture, "seller 1_batch 1", [-1]
+        )
@@ -9,17 +9,23 @@ import sys
 import copy
 import numpy as np
 import pulp as pulp
-from BatchMonitor import Batch
+import pytest
+from BatchMonitor import Batch, minBatchExpense
 
 from BatchMonitor.lib_optimization import (
     _apply_rates,
     _customs_duty,
+    _effective_prices,
     _exchange_rate,
     _taxe_rate,
     _transport_fee,
 )
 
-from .fixture_optimization import Batch_list_fixture
+from .fixture_optimization import (
+    Batch_list_fixture,
+    Batch_lists_fixture,
+    ItemListRequest_fixture,
+)
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
@@ -150,3 +156,46 @@ def test_apply_rates(Batch_list_fixture):
     )
 
     assert np.all(batch_list_float == waited_float)
+
+
+def test_effective_prices_by_item(Batch_list_fixture):
+    """Test of the _effective_prices function with rates given by item"""
+
+    prices = _effective_prices(
+        Batch_list_fixture, transport_fee={"apple": 0.3, "orange": 0.9}
+    )
+
+    assert prices == pytest.approx([15, 21, 28.1])
+    assert [batch.price for batch in Batch_list_fixture] == [10, 15, 20]
+    with pytest.raises(KeyError):
+        _effective_prices(Batch_list_fixture, tax_rate={"cherry": 0.1})
+    with pytest.raises(ValueError):
+        _effective_prices(Batch_list_fixture, tax_rate=np.array([0.1, 0.2]))
+    with pytest.raises(ValueError):
+        _effective_prices(Batch_list_fixture, tax_rate=np.array([0.1, 0.2, 0.3, 0.4]))
+
+
+def test_effective_prices_by_seller(Batch_lists_fixture, ItemListRequest_fixture):
+    """Test of the rates given by seller, the catalog given is not modified"""
+
+    catalog = copy.deepcopy(Batch_lists_fixture)
+    prices = _effective_prices(
+        [batch for collection in catalog for batch in collection],
+        exchange_rate={"seller 2": 2},
+        tax_rate=0.5,
+        sellers=["seller 1", "seller 1", "seller 2"],
+    )
+
+    assert np.array_equal(prices, [15, 22.5, 60])
+    with pytest.raises(KeyError):
+        _effective_prices(
+            [batch for collection in catalog for batch in collection],
+            exchange_rate={"seller 2": 2, "seler 1": 3},
+            sellers=["seller 1", "seller 1", "seller 2"],
+        )
+
+    minBatchExpense(
+        catalog, ItemListRequest_fixture, exchange_rate={"seller 2": 2}, tax_rate=0.5
+    )
+
+    assert catalog == Batch_lists_fixture
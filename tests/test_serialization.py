@@ -6,7 +6,10 @@ Test module for the serialization method"""
 import os
 import sys
 import json
+import warnings
+import pytest
 from BatchMonitor import BatchCollection, BatchLists, ItemListRequest
+from BatchMonitor.lib_batches import Incompatible_negative_value
 from tests import batch_collection_fixture, batchlists_fixture, ilr_fixture
 
 
@@ -35,6 +38,137 @@ def test_batchlists_serialization(batchlists_fixture):
     os.remove("batchlists.json")
 
 
+def test_compact_serialization(batch_collection_fixture, batchlists_fixture):
+    """Test of the compact serialization of the BatchCollection and BatchLists objects"""
+
+    batch_collection_fixture.to_json("batch_collection.json", compact=True)
+    batchlists_fixture.to_json("batchlists.json", compact=True, checksum=False)
+    with open("batchlists.json") as file:
+        text = file.read()
+    batchlists_fixture.to_json("batchlists_indented.json", checksum=False)
+    with open("batchlists_indented.json") as file:
+        indented_text = file.read()
+
+    assert "\n" not in text and ": " not in text
+    assert json.loads(text) == json.loads(indented_text)
+    assert batch_collection_fixture == BatchCollection.from_json(
+        "batch_collection.json"
+    )
+    assert batchlists_fixture == BatchLists.from_json("batchlists.json")
+    os.remove("batch_collection.json")
+    os.remove("batchlists.json")
+    os.remove("batchlists_indented.json")
+
+
+def test_sparse_serialization(batch_collection_fixture, batchlists_fixture):
+    """Test of the sparse serialization, the names of the items are written once per seller"""
+
+    batchlists_fixture.to_json("batchlists.json", compact=True)
+    batchlists_fixture.to_json("batchlists_dense.json", compact=True, sparse=False)
+    with open("batchlists.json") as file:
+        data = json.load(file)
+    batch = batchlists_fixture[0][0]
+
+    assert data[0]["item_names"] == batchlists_fixture[0].item_names
+    assert data[0]["batch_list"][0]["quantities"] == [
+        item.quantity_in_batch for item in batch
+    ]
+    assert "quantity_in_batch" not in json.dumps(data)
+    assert os.path.getsize("batchlists.json") < os.path.getsize("batchlists_dense.json")
+    assert batchlists_fixture == BatchLists.from_json("batchlists.json")
+    assert batchlists_fixture == BatchLists.from_json("batchlists_dense.json")
+    os.remove("batchlists.json")
+    os.remove("batchlists_dense.json")
+
+    batch_collection_fixture.to_json("batch_collection.json", sparse=False)
+    assert batch_collection_fixture == BatchCollection.from_json(
+        "batch_collection.json"
+    )
+    batch_collection_fixture.to_json("batch_collection.json")
+    assert batch_collection_fixture == BatchCollection.from_json(
+        "batch_collection.json"
+    )
+    os.remove("batch_collection.json")
+
+
+def test_trusted_serialization(batch_collection_fixture, batchlists_fixture):
+    """Test of the trusted loading, which skips the checks when the checksum matches"""
+
+    batchlists_fixture.to_json("batchlists.json", compact=True)
+    batchlists_fixture.to_json("batchlists_indented.json")
+    with open("batchlists.json") as file:
+        data = json.load(file)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert batchlists_fixture == BatchLists.from_json(
+            "batchlists_indented.json", trusted=True
+        )
+        assert list(BatchLists.iter_json("batchlists.json", 16, trusted=True)) == [
+            *batchlists_fixture
+        ]
+    trusted = BatchLists.from_json("batchlists.json", trusted=True)
+    assert trusted == batchlists_fixture
+    assert trusted.item_names == batchlists_fixture.item_names
+    assert trusted[0].item_names == batchlists_fixture[0].item_names
+    assert trusted[0][0]["cherries"] == 0.0
+
+    with open("batchlists.json", "w") as file:
+        json.dump(data, file)
+    with pytest.warns(UserWarning, match="checksum"):
+        assert batchlists_fixture == BatchLists.from_json(
+            "batchlists.json", trusted=True
+        )
+
+    data[0]["batch_list"][0]["quantities"][0] = -1
+    with open("batchlists.json", "w") as file:
+        json.dump(data, file)
+    with pytest.warns(UserWarning, match="checksum"):
+        with pytest.raises(Incompatible_negative_value):
+            BatchLists.from_json("batchlists.json", trusted=True)
+    os.remove("batchlists.json")
+    os.remove("batchlists_indented.json")
+
+    batch_collection_fixture.to_json("batch_collection.json", checksum=False)
+    with open("batch_collection.json") as file:
+        assert "checksum" not in json.load(file)
+    assert batch_collection_fixture == BatchCollection.from_json(
+        "batch_collection.json", trusted=True
+    )
+    batch_collection_fixture.to_json("batch_collection.json", sparse=False)
+    assert batch_collection_fixture == BatchCollection.from_json(
+        "batch_collection.json", trusted=True
+    )
+    os.remove("batch_collection.json")
+
+
+def test_compressed_serialization(
+    batch_collection_fixture, batchlists_fixture, ilr_fixture
+):
+    """Test of the serialization in gzip, bz2 and lzma files chosen by suffix"""
+
+    for suffix, magic in [(".gz", b"\x1f\x8b"), (".bz2", b"BZh"), (".xz", b"\xfd7zXZ")]:
+        batchlists_fixture.to_json("batchlists.json" + suffix, compact=True)
+        with open("batchlists.json" + suffix, "rb") as file:
+            assert file.read().startswith(magic)
+        assert batchlists_fixture == BatchLists.from_json("batchlists.json" + suffix)
+        os.remove("batchlists.json" + suffix)
+
+    batch_collection_fixture.to_json("batch_collection.json.gz")
+    assert batch_collection_fixture == BatchCollection.from_json(
+        "batch_collection.json.gz"
+    )
+    ilr_fixture.to_json("ilr.json.bz2")
+    assert ilr_fixture == ItemListRequest.from_json("ilr.json.bz2")
+    batchlists_fixture.to_ndjson("batchlists.ndjson.xz")
+    assert batchlists_fixture == BatchLists.from_ndjson(
+        "batchlists.ndjson.xz", chunk_size=16
+    )
+    os.remove("batch_collection.json.gz")
+    os.remove("ilr.json.bz2")
+    os.remove("batchlists.ndjson.xz")
+
+
 def test_ilr_serialization(ilr_fixture):
     """Test of the serialization of an ItemListRequest object"""
 
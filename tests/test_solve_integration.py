@@ -18,6 +18,7 @@ from BatchMonitor.lib_app import (
 )
 
 from BatchMonitor.__main__ import (
+    _create_object_from_json,
     _solving_problem_choice,
     solve,
     init_and_run,
@@ -679,3 +680,20 @@ def test_init_and_run_mbe_bc_invalid_ilr(bc_fixture, ilr_fixture):
         mock_verify_valid_ilr.call_count == 2
         mock_styled_prompt.assert_called()
         mock_style_h2.call_count == 5
+
+
+def test_create_object_from_compressed_json(bc_fixture, ilr_fixture):
+    """Test the loading of the compressed json files given to the solve command"""
+
+    bc_fixture.to_json("batches.json.gz", compact=True)
+    ilr_fixture.to_json("itemlist.json.xz")
+
+    batch_object, ilr_object, number_of_batches = _create_object_from_json(
+        "BatchCollection", "batches.json.gz", "itemlist.json.xz"
+    )
+
+    assert batch_object == bc_fixture
+    assert ilr_object == ilr_fixture
+    assert number_of_batches == 2
+    os.remove("batches.json.gz")
+    os.remove("itemlist.json.xz")
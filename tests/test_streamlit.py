@@ -62,3 +62,43 @@ def test_create_df_from_json():
     )
     (Path(".").resolve() / "batchlists.json").unlink()
     assert database.equals(waited)
+
+
+def test_create_df_from_json_sparse():
+    """Test the function create_df_from_json with batches not containing all the items"""
+
+    bl = BatchLists.from_str(
+        strings=[
+            "seller1_batch1:10.0; 1xapple",
+            "seller2_batch1:30.0; 2xbanana",
+        ]
+    )
+    bl.to_json("batchlists.json")
+    df_bl = pd.read_json("batchlists.json")
+    database = create_df_from_json(df_bl)
+    waited = pd.DataFrame(
+        data={
+            "batch1.1": [1.0, 0.0, 10.0, "seller1"],
+            "batch1.2": [0.0, 2.0, 30.0, "seller2"],
+        },
+        index=["apple", "banana", "TOTAL", "Seller"],
+    )
+    (Path(".").resolve() / "batchlists.json").unlink()
+    assert database.equals(waited)
+
+
+def test_create_df_from_json_dense():
+    """Test the function create_df_from_json with a json file written without item vocabulary"""
+
+    bl = BatchLists.from_str(
+        strings=[
+            "seller1_batch1:10.0; 1xapple",
+            "seller2_batch1:30.0; 2xbanana",
+        ]
+    )
+    bl.to_json("batchlists.json")
+    sparse_database = create_df_from_json(pd.read_json("batchlists.json"))
+    bl.to_json("batchlists.json", sparse=False)
+    database = create_df_from_json(pd.read_json("batchlists.json"))
+    (Path(".").resolve() / "batchlists.json").unlink()
+    assert database.equals(sparse_database)